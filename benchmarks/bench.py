@@ -0,0 +1,329 @@
+"""
+Microbenchmarks for the game's hot paths.
+
+    python benchmarks/bench.py                       # run everything, print a table
+    python benchmarks/bench.py -k storage            # only names containing "storage"
+    python benchmarks/bench.py --save                # overwrite benchmarks/baseline.json
+    python benchmarks/bench.py --compare             # flag regressions against the baseline
+    python benchmarks/bench.py --compare --threshold 0.5
+
+Each benchmark reports the best per-call time over several repeats (the
+minimum is the least noisy estimate on a busy machine). Storage and
+trivia benchmarks run against a throwaway data directory, never the
+real ~/.terminal_blackjack.
+"""
+import argparse
+import io
+import json
+import platform
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from blackjack import storage
+from blackjack.models.card import Card, Deck
+from blackjack.models.player import Player, Dealer
+from blackjack.trivia import TriviaManager
+
+BASELINE = Path(__file__).parent / "baseline.json"
+DEFAULT_THRESHOLD = 0.25  # flag anything more than 25% slower than the baseline
+
+# name -> (setup, which returns the callable to time)
+BENCHMARKS: Dict[str, Callable[[Path], Callable[[], object]]] = {}
+
+
+def benchmark(name: str):
+    def register(setup):
+        BENCHMARKS[name] = setup
+        return setup
+    return register
+
+
+# --- Models ---
+
+@benchmark("deck.create_deck")
+def _create_deck(tmp: Path):
+    deck = Deck(num_decks=6)
+    return deck.create_deck
+
+
+@benchmark("deck.deal")
+def _deal(tmp: Path):
+    deck = Deck(num_decks=6)
+
+    def deal():
+        if len(deck) < 1:
+            deck.create_deck()
+        return deck.deal()
+    return deal
+
+
+@benchmark("player.hand_value")
+def _hand_value(tmp: Path):
+    player = Player("Bench")
+    for rank in ('Ace', 'Five', 'Ace', 'Three'):
+        player.add_card(Card(rank, 'Spades'))
+    return lambda: player.hand_value
+
+
+# --- Storage ---
+
+def _use_data_dir(data_dir: Path):
+    """Point the storage module at data_dir."""
+    storage.DATA_DIR = data_dir
+    storage.DATA_FILE = data_dir / "players.json"
+    storage.SESSION_FILE = data_dir / "session.json"
+    storage.BACKUP_ROOT = data_dir / "saves"
+
+
+def _storage_with_players(tmp: Path, count: int, backend: str = "json") -> str:
+    data_dir = tmp / f"players-{count}-{backend}"
+    _use_data_dir(data_dir)
+    storage.BACKEND = backend
+    if not data_dir.exists():
+        data_dir.mkdir(parents=True)
+        # Write the other players in one go; count save_player calls would be quadratic
+        storage._save_all_data({storage._hash_name(f"player{i}"): {"name": f"player{i}", "chips": 500 + i}
+                                for i in range(count - 1)})
+        storage.save_player("bench", 500)
+    return "bench"
+
+
+def _register_storage(count: int, label: str, backend: str = "json"):
+    if backend != "json":
+        label = f"{label} {backend}"
+
+    @benchmark(f"storage.save_player[{label}]")
+    def _save(tmp: Path):
+        name = _storage_with_players(tmp, count, backend)
+        chips = iter(range(10**9))
+        return lambda: storage.save_player(name, next(chips))
+
+    @benchmark(f"storage.load_player[{label}]")
+    def _load(tmp: Path):
+        name = _storage_with_players(tmp, count, backend)
+        return lambda: storage.load_player(name)
+
+
+for _count, _label in ((1, "1"), (1_000, "1k"), (100_000, "100k")):
+    _register_storage(_count, _label)
+_register_storage(100_000, "100k", "binary")
+
+
+@benchmark("storage.save_current_game[200 topics]")
+def _save_game(tmp: Path):
+    data_dir = tmp / "save-game"
+    _use_data_dir(data_dir)
+    questions = data_dir / "questions"
+    questions.mkdir(parents=True)
+    bank = [{"question": f"Q{i}?", "options": ["A", "B", "C", "D"], "correct_index": i % 4} for i in range(500)]
+    for i in range(200):
+        with open(questions / f"topic{i}.json", 'w') as f:
+            json.dump({"topic": f"Topic {i}", "questions": bank}, f)
+    storage.CURRENT_SAVE_SLOT = None
+    chips = iter(range(10**9))
+
+    def save():
+        # One chip change per save, as on a normal exit
+        storage.save_player("bench", next(chips))
+        storage.save_current_game()
+    return save
+
+
+@benchmark("storage.restore_data[200 topics]")
+def _restore_game(tmp: Path):
+    data_dir = tmp / "restore-game"
+    _use_data_dir(data_dir)
+    questions = data_dir / "questions"
+    questions.mkdir(parents=True)
+    bank = [{"question": f"Q{i}?", "options": ["A", "B", "C", "D"], "correct_index": i % 4} for i in range(500)]
+    for i in range(200):
+        with open(questions / f"topic{i}.json", 'w') as f:
+            json.dump({"topic": f"Topic {i}", "questions": bank}, f)
+    storage.CURRENT_SAVE_SLOT = None
+    storage.save_player("bench", 500)
+    storage.save_current_game()
+    slot = storage.CURRENT_SAVE_SLOT
+    chips = iter(range(10**9))
+
+    def restore():
+        # Play a little, then go back to the save
+        storage.save_player("bench", next(chips))
+        storage.restore_data(slot)
+    return restore
+
+
+# --- Rendering ---
+
+def _ui_and_hands():
+    from blackjack.ui import BlackjackUI
+    ui = BlackjackUI()
+    ui.console = ui.console.__class__(file=io.StringIO(), width=80, force_terminal=True)
+    player = Player("Bench", 500)
+    player.bet = 10
+    for rank in ('Ace', 'Five', 'Three', 'Two'):
+        player.add_card(Card(rank, 'Hearts'))
+    dealer = Dealer()
+    for rank in ('King', 'Seven'):
+        dealer.add_card(Card(rank, 'Clubs'))
+    return ui, player, dealer
+
+
+@benchmark("ui.render_cards_ascii")
+def _render_cards(tmp: Path):
+    ui, player, _ = _ui_and_hands()
+    return lambda: ui.render_cards_ascii(player.hand)
+
+
+@benchmark("ui.build_game_layout")
+def _build_layout(tmp: Path):
+    ui, player, dealer = _ui_and_hands()
+    return lambda: ui.build_game_layout(player, dealer, "playing")
+
+
+@benchmark("ui.build_game_layout+print")
+def _print_layout(tmp: Path):
+    ui, player, dealer = _ui_and_hands()
+
+    def draw():
+        ui.console.file.seek(0)
+        ui.console.file.truncate()
+        ui.console.print(ui.build_game_layout(player, dealer, "playing"))
+    return draw
+
+
+# --- Trivia ---
+
+def _register_topics(files: int, questions: int, label: str):
+    @benchmark(f"trivia.get_custom_topics[{label}]")
+    def _topics(tmp: Path):
+        topic_dir = tmp / f"questions-{label}"
+        if not topic_dir.exists():
+            topic_dir.mkdir(parents=True)
+            bank = [{"question": f"Q{i}?", "options": ["A", "B", "C", "D"], "correct_index": i % 4}
+                    for i in range(questions)]
+            for i in range(files):
+                with open(topic_dir / f"topic{i}.json", 'w') as f:
+                    json.dump({"topic": f"Topic {i}", "questions": bank}, f)
+        manager = TriviaManager(custom_dir=str(topic_dir))
+        return manager.get_custom_topics
+
+
+_register_topics(10, 50, "10x50")
+_register_topics(200, 500, "200x500")
+
+
+# --- Runner ---
+
+def time_call(func: Callable[[], object], repeat: int = 5, min_time: float = 0.2) -> float:
+    """Best seconds per call over `repeat` runs of an auto-sized loop."""
+    timer = timeit.Timer(func)
+    number, elapsed = timer.autorange()
+    # autorange stops at 0.2s; scale the loop to min_time
+    number = max(1, int(number * min_time / max(elapsed, 1e-9)))
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def run(names: List[str], repeat: int = 5, min_time: float = 0.2) -> Dict[str, float]:
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        saved = (storage.DATA_DIR, storage.DATA_FILE, storage.SESSION_FILE, storage.BACKUP_ROOT,
+                 storage.CURRENT_SAVE_SLOT, storage.BACKEND)
+        try:
+            for name in names:
+                storage.BACKEND = saved[-1]
+                func = BENCHMARKS[name](Path(tmp))
+                results[name] = time_call(func, repeat, min_time)
+                print(f"  {name:<40} {_fmt(results[name]):>10}", file=sys.stderr)
+        finally:
+            (storage.DATA_DIR, storage.DATA_FILE, storage.SESSION_FILE, storage.BACKUP_ROOT,
+             storage.CURRENT_SAVE_SLOT, storage.BACKEND) = saved
+            storage._close_store()
+    return results
+
+
+def compare(results: Dict[str, float], baseline: Dict[str, float],
+            threshold: float = DEFAULT_THRESHOLD) -> List[Tuple[str, float, Optional[float], bool]]:
+    """(name, seconds, ratio to baseline or None, regressed) per result."""
+    rows = []
+    for name, seconds in results.items():
+        base = baseline.get(name)
+        ratio = seconds / base if base else None
+        rows.append((name, seconds, ratio, ratio is not None and ratio > 1 + threshold))
+    return rows
+
+
+def _fmt(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+
+def load_baseline(path: Path) -> Dict[str, float]:
+    with open(path, 'r') as f:
+        return json.load(f)["results"]
+
+
+def save_baseline(path: Path, results: Dict[str, float]):
+    data = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "system": platform.system(),
+        "results": results,
+    }
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2)
+        f.write("\n")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Terminal Blackjack microbenchmarks")
+    parser.add_argument("-k", dest="filter", default="", help="only run benchmarks whose name contains this")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.2, help="seconds per timed loop")
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument("--save", action="store_true", help="write results to the baseline file")
+    parser.add_argument("--compare", action="store_true", help="compare against the baseline file")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="slowdown ratio above which a benchmark is a regression (0.25 = 25%%)")
+    parser.add_argument("--list", action="store_true", help="list benchmark names and exit")
+    args = parser.parse_args(argv)
+
+    names = [name for name in BENCHMARKS if args.filter in name]
+    if args.list:
+        print("\n".join(names))
+        return 0
+
+    results = run(names, args.repeat, args.min_time)
+
+    if args.save:
+        merged = load_baseline(args.baseline) if args.baseline.exists() else {}
+        merged.update(results)
+        save_baseline(args.baseline, merged)
+        print(f"Saved {len(results)} results to {args.baseline}")
+        return 0
+
+    if not args.compare:
+        for name, seconds in results.items():
+            print(f"{name:<40} {_fmt(seconds):>10}")
+        return 0
+
+    regressions = 0
+    for name, seconds, ratio, regressed in compare(results, load_baseline(args.baseline), args.threshold):
+        change = f"{ratio:.2f}x" if ratio is not None else "new"
+        flag = "  REGRESSION" if regressed else ""
+        print(f"{name:<40} {_fmt(seconds):>10} {change:>8}{flag}")
+        regressions += regressed
+    if regressions:
+        print(f"{regressions} benchmark(s) more than {args.threshold:.0%} slower than baseline")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
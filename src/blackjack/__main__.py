@@ -3,6 +3,7 @@ import sys
 import shutil
 import subprocess
 from . import storage
+from .instrumentation import SpanRecorder
 
 def uninstall_game():
     """Uninstalls the game package."""
@@ -70,6 +71,38 @@ def main():
             print("Please run 'pybjack' to access the Restore menu.")
             return
 
+        # --- TRACE COMMAND ---
+        elif arg in ("-trace", "--trace"):
+            recorder = SpanRecorder()
+            game = BlackjackGame(recorder=recorder)
+            try:
+                game.run()
+            finally:
+                trace_path = data_dir / "trace.json"
+                data_dir.mkdir(exist_ok=True)
+                recorder.dump(trace_path)
+                print(f"Round timings written to {trace_path}")
+            return
+
+        # --- PROFILE COMMAND ---
+        elif arg in ("-profile", "--profile"):
+            # Pulls in the simulator and solver, so only imported when asked for
+            from . import profiling
+            options = sys.argv[2:]
+            sampling = "-sampling" in options or "--sampling" in options
+            if sampling and not profiling.sampling_available():
+                print("pyinstrument is not installed; using cProfile instead.")
+            if "headless" in options:
+                rounds = next((int(o) for o in options if o.isdigit()), 20_000)
+                print(f"Profiling {rounds} headless rounds...")
+                paths = profiling.profile_call(lambda: profiling.headless_session(rounds), "headless", sampling)
+            else:
+                paths = profiling.profile_call(BlackjackGame().run, "game", sampling)
+            print("Profile written to:")
+            for path in paths:
+                print(f"  {path}")
+            return
+
         # --- HELP COMMAND ---
         elif arg in ("-h", "-help", "--help"):
             print("Terminal Blackjack by szxivk")
@@ -79,6 +112,10 @@ def main():
             print("  (no args)   Start the game")
             print("  -reset      Fully reset all game data and saves")
             print("  -remove     Uninstall the game (optional: keep saves)")
+            print("  -trace      Start the game and write per-phase timings to trace.json")
+            print("  -profile    Profile the game and save a report to the data directory")
+            print("              -profile headless [ROUNDS]   profile simulated rounds instead")
+            print("              -profile -sampling           use pyinstrument if installed")
             print("  -help       Show this help message")
             return
         
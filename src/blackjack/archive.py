@@ -0,0 +1,123 @@
+"""
+Compressed single-file archives of old save slots.
+
+An archive is a tar stream (xz by default) laid out so it can be written
+and read in one pass, without seeking:
+
+    index.json          slot name -> index entry plus {"files": manifest}
+    objects/<digest>    each distinct file content, stored once
+
+index.json comes first, so listing an archive reads one small member,
+and extracting a slot decompresses the stream once while writing only
+the objects that slot references.
+"""
+import io
+import json
+import os
+import shutil
+import tarfile
+import time
+from pathlib import Path, PurePosixPath
+from typing import Dict, Optional
+
+from .objectstore import file_digest, read_manifest
+
+INDEX_MEMBER = "index.json"
+OBJECTS_PREFIX = "objects/"
+COMPRESSION = "xz"
+
+
+def archive_suffix(compression: str = COMPRESSION) -> str:
+    return f".tar.{compression}" if compression else ".tar"
+
+
+def _slot_files(slot: Path) -> Dict[str, Dict]:
+    """A slot's manifest; legacy full-copy slots are hashed file by file."""
+    files = read_manifest(slot)
+    if files:
+        return files
+    for path in sorted(p for p in slot.rglob("*") if p.is_file()):
+        files[path.relative_to(slot).as_posix()] = {"digest": file_digest(path), "size": path.stat().st_size}
+    return files
+
+
+def _add_bytes(tar: tarfile.TarFile, name: str, data: bytes):
+    info = tarfile.TarInfo(name)
+    info.size = len(data)
+    info.mtime = int(time.time())
+    tar.addfile(info, io.BytesIO(data))
+
+
+def write_archive(path: Path, slots: Dict[Path, Dict], compression: str = COMPRESSION) -> Dict[str, Dict]:
+    """
+    Pack slot folders into one archive at path. `slots` maps each folder to
+    its index entry. Returns the archive's index (entries plus manifests).
+    """
+    index: Dict[str, Dict] = {}
+    sources: Dict[str, Path] = {}
+    for slot, entry in slots.items():
+        files = _slot_files(slot)
+        index[slot.name] = dict(entry, files=files)
+        for rel, meta in files.items():
+            sources.setdefault(meta["digest"], slot / rel)
+
+    tmp = path.with_name(f".{path.name}.tmp")
+    with tarfile.open(tmp, f"w|{compression}") as tar:
+        _add_bytes(tar, INDEX_MEMBER, json.dumps({"version": 1, "slots": index}).encode())
+        for digest, source in sources.items():
+            tar.add(str(source), arcname=OBJECTS_PREFIX + digest, recursive=False)
+    os.replace(tmp, path)
+    return index
+
+
+def read_archive_index(path: Path) -> Dict[str, Dict]:
+    """Slot entries stored in an archive; reads only its first member."""
+    with tarfile.open(path, "r|*") as tar:
+        member = tar.next()
+        if member is None or member.name != INDEX_MEMBER:
+            raise ValueError(f"{path.name} has no index")
+        return json.load(tar.extractfile(member))["slots"]
+
+
+def _safe_rel(rel: str) -> bool:
+    parts = PurePosixPath(rel).parts
+    return bool(parts) and not PurePosixPath(rel).is_absolute() and ".." not in parts
+
+
+def extract_slot(path: Path, name: str, dest: Path, skip: Optional[set] = None) -> int:
+    """
+    Write one slot's files from an archive into dest, streaming the
+    archive once. Files named in skip are left out. Returns files written.
+    """
+    with tarfile.open(path, "r|*") as tar:
+        member = tar.next()
+        if member is None or member.name != INDEX_MEMBER:
+            raise ValueError(f"{path.name} has no index")
+        slots = json.load(tar.extractfile(member))["slots"]
+        if name not in slots:
+            raise KeyError(name)
+
+        wanted: Dict[str, list] = {}
+        for rel, meta in slots[name]["files"].items():
+            if _safe_rel(rel) and rel not in (skip or ()):
+                wanted.setdefault(meta["digest"], []).append(dest / rel)
+
+        written = 0
+        for member in tar:
+            digest = member.name[len(OBJECTS_PREFIX):]
+            targets = wanted.pop(digest, None)
+            if not targets or not member.isfile():
+                continue
+            first = targets[0]
+            first.parent.mkdir(parents=True, exist_ok=True)
+            with open(first, 'wb') as out:
+                shutil.copyfileobj(tar.extractfile(member), out)
+            for target in targets[1:]:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copyfile(first, target)
+            written += len(targets)
+            if not wanted:
+                break
+    if wanted:
+        raise ValueError(f"{path.name} is missing objects for {name}")
+    return written
@@ -0,0 +1,132 @@
+"""
+Vectorized bankroll and risk-of-ruin simulation.
+
+Plays many flat-betting bankroll paths at once as NumPy arrays, using the
+game's chip rules: a win pays even money, a surrender gets bet // 2 back,
+and a player who can't cover the full bet stakes whatever is left. A path
+ends at ruin (no chips, as in play_game_loop) or when it reaches the
+target. Needs numpy (pip install terminal-blackjack[sim]).
+"""
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence
+
+from .simulation import SimulationStats
+
+NEW_PLAYER_CHIPS = 500  # what BlackjackGame.welcome grants a new player
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("Bankroll simulation needs numpy: pip install terminal-blackjack[sim]") from None
+    return numpy
+
+
+@dataclass(frozen=True)
+class OutcomeProbs:
+    """Per-round outcome probabilities (busts count as losses)."""
+    win: float
+    loss: float
+    push: float
+    surrender: float = 0.0
+
+    def __post_init__(self):
+        total = self.win + self.loss + self.push + self.surrender
+        if abs(total - 1.0) > 1e-9:
+            raise ValueError(f"Outcome probabilities must sum to 1 (got {total})")
+
+    @classmethod
+    def from_stats(cls, stats: SimulationStats) -> "OutcomeProbs":
+        """Empirical probabilities from a simulation run."""
+        n = stats.rounds
+        return cls(stats.wins / n, (stats.losses + stats.busts) / n, stats.pushes / n, stats.surrenders / n)
+
+
+@dataclass
+class BankrollReport:
+    """Results over all paths. Arrays have one entry per path."""
+    rounds_played: "numpy.ndarray"
+    final_chips: "numpy.ndarray"
+    ruined: "numpy.ndarray"
+    reached_target: "numpy.ndarray"
+
+    @property
+    def paths(self) -> int:
+        return len(self.final_chips)
+
+    @property
+    def ruin_probability(self) -> float:
+        return float(self.ruined.mean())
+
+    @property
+    def target_probability(self) -> float:
+        return float(self.reached_target.mean())
+
+    def rounds_to_ruin_quantiles(self, qs: Sequence[float] = (0.05, 0.25, 0.5, 0.75, 0.95)) -> Dict[float, float]:
+        """Quantiles of rounds survived, over the paths that went broke."""
+        np = _numpy()
+        survived = self.rounds_played[self.ruined]
+        if not survived.size:
+            return {q: float("nan") for q in qs}
+        return dict(zip(qs, (float(v) for v in np.quantile(survived, qs))))
+
+    def survival_curve(self) -> "numpy.ndarray":
+        """Fraction of paths still solvent after each round (index 0 = start)."""
+        np = _numpy()
+        ruin_rounds = np.bincount(self.rounds_played[self.ruined], minlength=int(self.rounds_played.max()) + 1)
+        return 1.0 - np.cumsum(ruin_rounds) / self.paths
+
+    def final_quantiles(self, qs: Sequence[float] = (0.05, 0.25, 0.5, 0.75, 0.95)) -> Dict[float, float]:
+        np = _numpy()
+        return dict(zip(qs, (float(v) for v in np.quantile(self.final_chips, qs))))
+
+    def summary(self) -> Dict:
+        return {
+            "paths": self.paths,
+            "ruin_probability": self.ruin_probability,
+            "target_probability": self.target_probability,
+            "rounds_to_ruin": self.rounds_to_ruin_quantiles(),
+            "final_chips": self.final_quantiles(),
+        }
+
+
+def simulate_bankroll(probs: OutcomeProbs, bet: int = 10, start: int = NEW_PLAYER_CHIPS,
+                      target: Optional[int] = None, max_rounds: int = 10_000, paths: int = 10_000,
+                      seed: Optional[int] = None) -> BankrollReport:
+    """
+    Flat-bet `bet` chips per round on `paths` independent bankrolls starting
+    at `start`, for at most `max_rounds` rounds each.
+    """
+    np = _numpy()
+    rng = np.random.Generator(np.random.PCG64(seed))
+    cumulative = np.cumsum([probs.win, probs.loss, probs.push])
+
+    chips = np.full(paths, start, dtype=np.int64)
+    rounds_played = np.zeros(paths, dtype=np.int64)
+    active = np.arange(paths)
+
+    for _ in range(max_rounds):
+        if not active.size:
+            break
+        held = chips[active]
+        stake = np.minimum(held, bet)
+        # 0 = win, 1 = loss, 2 = push, 3 = surrender
+        outcome = np.searchsorted(cumulative, rng.random(active.size), side='right')
+        delta = np.select(
+            [outcome == 0, outcome == 1, outcome == 2],
+            [stake, -stake, 0],
+            stake // 2 - stake,
+        )
+        held += delta
+        chips[active] = held
+        rounds_played[active] += 1
+
+        done = held <= 0
+        if target is not None:
+            done |= held >= target
+        active = active[~done]
+
+    ruined = chips <= 0
+    reached = chips >= target if target is not None else np.zeros(paths, dtype=bool)
+    return BankrollReport(rounds_played, chips, ruined, reached)
@@ -0,0 +1,274 @@
+"""
+Binary player records, memory-mapped for random access.
+
+Selected with PYBJACK_STORAGE=binary (see storage.BACKEND). players.bin
+is a header, a fixed-size open-addressing hash table of 32-byte records,
+then a heap of UTF-8 names:
+
+    header  magic, version, capacity, count, heap end
+    record  key (the 8 bytes of _hash_name), chips (int64),
+            name offset and length into the heap, used flag
+
+The whole file is mmapped, so a lookup probes a record or two and a chip
+update is one 8-byte store into the map; nothing proportional to the
+player count is parsed or written. New players append their name to the
+heap, which grows the file HEAP_CHUNK bytes at a time. The table is
+rebuilt at twice the size (written to a temp file and renamed in) once
+it is half full. An existing players.json (plus journal) is imported
+when the file is first created.
+
+Names are stored when a player is first saved; later saves only change
+chips. Several processes can share the file for chip updates (the map is
+shared), but adding players is not coordinated between processes.
+"""
+import mmap
+import os
+import struct
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from . import storage
+
+MAGIC = b"PBJK"
+VERSION = 1
+MIN_CAPACITY = 1024
+HEAP_CHUNK = 64 * 1024
+
+_HEADER = struct.Struct("<4sIIIQ8x")  # magic, version, capacity, count, heap_end
+_RECORD = struct.Struct("<8sqQII")    # key, chips, name_off, name_len, used
+_CHIPS = struct.Struct("<q")
+_CHIPS_OFFSET = 8                     # within a record
+_USED_OFFSET = 28                     # within a record; the flag's low byte
+_COUNTS = struct.Struct("<IQ")        # count, heap_end
+_COUNTS_OFFSET = 12                   # within the header
+
+
+def _capacity_for(count: int) -> int:
+    capacity = MIN_CAPACITY
+    while capacity < count * 2:
+        capacity *= 2
+    return capacity
+
+
+def _slot(key: bytes, mask: int) -> int:
+    return int.from_bytes(key, "little") & mask
+
+
+def write_table(path: Path, players: Iterable[Tuple[str, str, int]], capacity: Optional[int] = None):
+    """Write (key, name, chips) rows to a new players.bin at path, atomically."""
+    rows = list(players)
+    capacity = capacity or _capacity_for(len(rows))
+    mask = capacity - 1
+    table = bytearray(capacity * _RECORD.size)
+    heap = bytearray()
+    heap_start = _HEADER.size + len(table)
+    for key_hex, name, chips in rows:
+        key = bytes.fromhex(key_hex)
+        index = _slot(key, mask)
+        while table[index * _RECORD.size + _USED_OFFSET]:
+            index = (index + 1) & mask
+        encoded = name.encode()
+        _RECORD.pack_into(table, index * _RECORD.size, key, max(0, chips),
+                          heap_start + len(heap), len(encoded), 1)
+        heap += encoded
+
+    tmp = path.with_name(f".{path.name}.tmp")
+    with open(tmp, 'wb') as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, capacity, len(rows), heap_start + len(heap)))
+        f.write(table)
+        f.write(heap)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def read_table(path: Path) -> Dict[str, Dict]:
+    """Every player in a players.bin, read without mapping (or being able to change) it."""
+    data = path.read_bytes()
+    magic, version, capacity, _, _ = _HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path.name} is not a version {VERSION} player file")
+    table_end = _HEADER.size + capacity * _RECORD.size
+    return {key.hex(): {"name": data[name_off:name_off + name_len].decode(), "chips": chips}
+            for key, chips, name_off, name_len, used
+            in _RECORD.iter_unpack(data[_HEADER.size:table_end]) if used}
+
+
+class BinaryStore:
+    """Same interface as storage.PlayerStore, backed by a memory-mapped players.bin."""
+
+    def __init__(self, data_path: Path):
+        self.data_path = data_path
+        self._lock = threading.Lock()
+        self._file = None
+        self._map: Optional[mmap.mmap] = None
+        self._ino: Optional[int] = None
+        if not data_path.exists():
+            self._migrate_json()
+        self._open()
+
+    def _migrate_json(self):
+        """Create the file from players.json and its journal (empty if there are none)."""
+        json_path = self.data_path.with_name(storage.DATA_FILE.name)
+        players = storage.PlayerStore(json_path).load()
+        write_table(self.data_path, ((key, entry.get("name", ""), entry.get("chips", 0))
+                                     for key, entry in players.items()))
+
+    def _open(self):
+        self._close()
+        f = open(self.data_path, 'r+b')
+        try:
+            magic, version, capacity, _, _ = _HEADER.unpack(f.read(_HEADER.size))
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"{self.data_path.name} is not a version {VERSION} player file")
+            self._map = mmap.mmap(f.fileno(), 0)
+        except Exception:
+            f.close()
+            raise
+        self._file = f
+        self._capacity = capacity
+        self._ino = os.fstat(f.fileno()).st_ino
+
+    def _close(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _counts(self) -> Tuple[int, int]:
+        return _COUNTS.unpack_from(self._map, _COUNTS_OFFSET)
+
+    def _find(self, key: bytes) -> Tuple[int, bool]:
+        """Byte offset of key's record in the map, and whether it is there (else the free slot to use)."""
+        mask = self._capacity - 1
+        index = _slot(key, mask)
+        while True:
+            offset = _HEADER.size + index * _RECORD.size
+            if not self._map[offset + _USED_OFFSET]:
+                return offset, False
+            if self._map[offset:offset + 8] == key:
+                return offset, True
+            index = (index + 1) & mask
+
+    def _remap(self, size: int):
+        """Map at least size bytes, growing the file if it is shorter (never shrinking it)."""
+        # Unmap first: some platforms refuse to resize a mapped file
+        self._map.close()
+        if os.fstat(self._file.fileno()).st_size < size:
+            self._file.truncate(size)
+        self._map = mmap.mmap(self._file.fileno(), 0)
+
+    def _name(self, offset: int, length: int) -> str:
+        if offset + length > len(self._map):
+            # Appended by another process since we mapped the file
+            self._remap(offset + length)
+        return self._map[offset:offset + length].decode()
+
+    def _rows(self) -> List[Tuple[str, str, int]]:
+        table_end = _HEADER.size + self._capacity * _RECORD.size
+        return [(key.hex(), self._name(name_off, name_len), chips)
+                for key, chips, name_off, name_len, used
+                in _RECORD.iter_unpack(self._map[_HEADER.size:table_end]) if used]
+
+    def _grow(self):
+        write_table(self.data_path, self._rows(), self._capacity * 2)
+        self._open()
+
+    # --- PlayerStore interface ---
+
+    def refresh(self):
+        """Remap if the file was replaced (grown or rewritten by another process)."""
+        try:
+            ino = os.stat(self.data_path).st_ino
+        except OSError:
+            ino = None
+        if ino != self._ino or self._map is None:
+            if ino is None:
+                self._migrate_json()
+            self._open()
+
+    def invalidate(self):
+        self._ino = None
+
+    def load(self) -> Dict[str, Dict]:
+        with self._lock:
+            self.refresh()
+            return {key: {"name": name, "chips": chips} for key, name, chips in self._rows()}
+
+    def get(self, name: str) -> Optional[Dict]:
+        with self._lock:
+            self.refresh()
+            offset, found = self._find(bytes.fromhex(storage._hash_name(name)))
+            if not found:
+                return None
+            _, chips, name_off, name_len, _ = _RECORD.unpack_from(self._map, offset)
+            return {"name": self._name(name_off, name_len), "chips": chips}
+
+    def put(self, name: str, chips: int) -> bool:
+        return self.put_many([(name, chips)])
+
+    def put_many(self, updates: Iterable[Tuple[str, int]], sync: bool = False) -> bool:
+        """Update each player's record in place; new players get a record and a heap entry."""
+        try:
+            with self._lock:
+                self.refresh()
+                appended = False
+                for name, chips in updates:
+                    chips = max(0, chips)  # Never save negative chips
+                    key = bytes.fromhex(storage._hash_name(name))
+                    offset, found = self._find(key)
+                    if found:
+                        _CHIPS.pack_into(self._map, offset + _CHIPS_OFFSET, chips)
+                        continue
+                    count, heap_end = self._counts()
+                    if (count + 1) * 2 > self._capacity:
+                        self._grow()
+                        offset, _ = self._find(key)
+                        count, heap_end = self._counts()
+                    encoded = name.encode()
+                    end = heap_end + len(encoded)
+                    if end > len(self._map):
+                        self._remap(end + HEAP_CHUNK)
+                    # The name goes in before the record that points at it
+                    self._map[heap_end:end] = encoded
+                    _RECORD.pack_into(self._map, offset, key, chips, heap_end, len(encoded), 1)
+                    _COUNTS.pack_into(self._map, _COUNTS_OFFSET, count + 1, end)
+                    appended = True
+                if sync:
+                    self._map.flush()
+                    if appended:
+                        os.fsync(self._file.fileno())
+            return True
+        except (OSError, ValueError):
+            return False
+
+    def replace_all(self, data: Dict[str, Dict]) -> bool:
+        try:
+            with self._lock:
+                write_table(self.data_path, ((key, entry.get("name", ""), entry.get("chips", 0))
+                                             for key, entry in data.items()))
+                self._open()
+            return True
+        except (OSError, ValueError):
+            return False
+
+    def compact(self) -> bool:
+        """
+        Flush the map and bump the file's mtime. Writes through a map do not
+        reliably update mtime, and save slots skip files whose stat is unchanged.
+        """
+        try:
+            with self._lock:
+                self.refresh()
+                self._map.flush()
+                os.utime(self.data_path)
+            return True
+        except (OSError, ValueError):
+            return False
+
+    def close(self):
+        with self._lock:
+            self._close()
@@ -0,0 +1,170 @@
+"""
+Exact dealer final-total probabilities.
+
+The dealer's play is fixed (hit below 17, and a soft 17 too under H17
+rules; see Dealer.should_hit), so the chance of each final total can be
+computed instead of sampled. Shoes are
+described by their composition: a 10-tuple of card counts by value 2..11
+(index 9 is Aces), as returned by Deck.composition(). None means an
+infinite deck.
+"""
+from functools import lru_cache
+from typing import NamedTuple, Optional, Sequence, Tuple
+
+# Draw probabilities by value 2..11 for an infinite deck (Ten, J, Q, K all count 10)
+INFINITE_DECK_PROBS = tuple((4 if value == 10 else 1) / 13 for value in range(2, 12))
+
+
+class DealerDistribution(NamedTuple):
+    """Probability of each dealer final result."""
+    p17: float
+    p18: float
+    p19: float
+    p20: float
+    p21: float
+    bust: float
+
+    def final_total(self, total: int) -> float:
+        """Probability the dealer finishes on `total` (17-21)."""
+        return self[total - 17]
+
+
+def full_shoe(num_decks: int = 6) -> Tuple[int, ...]:
+    """Composition of an undealt shoe."""
+    return tuple((16 if value == 10 else 4) * num_decks for value in range(2, 12))
+
+def remove_card(composition: Tuple[int, ...], value: int) -> Tuple[int, ...]:
+    """Composition with one card of `value` (2-11) taken out."""
+    counts = list(composition)
+    counts[value - 2] -= 1
+    return tuple(counts)
+
+
+def _draw_probs(composition: Optional[Tuple[int, ...]]):
+    """(value, probability, composition after the draw) for every possible card."""
+    if composition is not None:
+        remaining = sum(composition)
+        if remaining > 0:
+            return [
+                (index + 2, count / remaining, composition[:index] + (count - 1,) + composition[index + 1:])
+                for index, count in enumerate(composition) if count
+            ]
+    # Infinite deck, or an exhausted shoe that would be reshuffled
+    return [(index + 2, prob, composition) for index, prob in enumerate(INFINITE_DECK_PROBS)]
+
+
+_BUST = (0.0, 0.0, 0.0, 0.0, 0.0, 1.0)
+_STANDS = tuple(tuple(1.0 if i == total else 0.0 for i in range(6)) for total in range(5))
+
+# Internally a composition is packed into one int, 10 bits per value, which
+# keeps the (very many) memo keys small and cheap to hash.
+_SHIFTS = tuple(10 * index for index in range(10))
+_UNITS = tuple(1 << shift for shift in _SHIFTS)
+
+
+def _pack(composition: Tuple[int, ...]) -> int:
+    return sum(count << shift for count, shift in zip(composition, _SHIFTS))
+
+
+def _stands(hard: int, has_ace: bool, hit_soft_17: bool) -> int:
+    """Final value if the dealer stands on this hand, 0 if they must hit."""
+    soft = has_ace and hard + 10 <= 21
+    value = hard + 10 if soft else hard
+    if value < 17 or (value == 17 and soft and hit_soft_17):
+        return 0
+    return value
+
+
+@lru_cache(maxsize=None)
+def _dealer_infinite(hard: int, has_ace: bool, hit_soft_17: bool = False) -> Tuple[float, ...]:
+    """Distribution from a dealer hand of hard total `hard` (Aces counted as 1), infinite deck."""
+    value = _stands(hard, has_ace, hit_soft_17)
+    if value > 21:
+        return _BUST
+    if value:
+        return _STANDS[value - 17]
+
+    result = [0.0] * 6
+    for index, prob in enumerate(INFINITE_DECK_PROBS):
+        if index == 9:
+            sub = _dealer_infinite(hard + 1, True, hit_soft_17)
+        else:
+            sub = _dealer_infinite(hard + index + 2, has_ace, hit_soft_17)
+        for i in range(6):
+            result[i] += prob * sub[i]
+    return tuple(result)
+
+
+@lru_cache(maxsize=None)
+def _dealer_from(hard: int, has_ace: bool, packed: int, remaining: int, hit_soft_17: bool) -> Tuple[float, ...]:
+    """
+    Same as _dealer_infinite, drawing from a packed composition of `remaining`
+    cards. Only called for hands the dealer must hit; finished hands are
+    settled inline so they never take up a cache entry.
+    """
+    if remaining == 0:
+        # An exhausted shoe is reshuffled
+        return _dealer_infinite(hard, has_ace, hit_soft_17)
+
+    result = [0.0] * 6
+    left = remaining - 1
+    for index in range(10):
+        count = (packed >> _SHIFTS[index]) & 1023
+        if not count:
+            continue
+        prob = count / remaining
+        if index == 9:
+            new_hard, new_ace = hard + 1, True
+        else:
+            new_hard, new_ace = hard + index + 2, has_ace
+        value = _stands(new_hard, new_ace, hit_soft_17)
+        if value > 21:
+            result[5] += prob
+        elif value:
+            result[value - 17] += prob
+        else:
+            sub = _dealer_from(new_hard, new_ace, packed - _UNITS[index], left, hit_soft_17)
+            for i in range(6):
+                result[i] += prob * sub[i]
+    return tuple(result)
+
+
+@lru_cache(maxsize=None)
+def _dealer_distribution(upcard: int, composition: Optional[Tuple[int, ...]],
+                         hit_soft_17: bool = False) -> DealerDistribution:
+    is_ace = upcard == 11
+    hard = 1 if is_ace else upcard
+    if composition is None:
+        return DealerDistribution(*_dealer_infinite(hard, is_ace, hit_soft_17))
+    return DealerDistribution(*_dealer_from(hard, is_ace, _pack(composition), sum(composition), hit_soft_17))
+
+
+def dealer_distribution(upcard: int, shoe: Optional[Sequence[int]] = None,
+                        hit_soft_17: bool = False) -> DealerDistribution:
+    """
+    Exact final-total distribution for a dealer showing `upcard` (2-11, Ace = 11).
+    `shoe` is the undealt composition with the upcard already removed, or None
+    for an infinite deck.
+    """
+    composition = tuple(shoe) if shoe is not None else None
+    return _dealer_distribution(upcard, composition, hit_soft_17)
+
+
+def dealer_table(shoe: Optional[Sequence[int]] = None, hit_soft_17: bool = False) -> dict:
+    """Distribution for every upcard 2-11 drawn from `shoe`."""
+    table = {}
+    for upcard in range(2, 12):
+        composition = None
+        if shoe is not None:
+            if not shoe[upcard - 2]:
+                continue
+            composition = remove_card(tuple(shoe), upcard)
+        table[upcard] = dealer_distribution(upcard, composition, hit_soft_17)
+    return table
+
+
+def clear_cache():
+    """Drop memoized distributions (e.g. after a long simulation)."""
+    _dealer_infinite.cache_clear()
+    _dealer_from.cache_clear()
+    _dealer_distribution.cache_clear()
@@ -0,0 +1,186 @@
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from .models.card import Card, Deck
+from .models.player import Player, Dealer
+from .rules import Rules, DEFAULT_RULES
+
+# Player actions, same codes as BlackjackUI.get_action
+HIT = 'h'
+STAND = 's'
+SURRENDER = 'u'
+
+# Round outcomes
+WIN = "win"
+LOSS = "loss"
+PUSH = "push"
+SURRENDERED = "surrender"
+BUST = "bust"
+
+# decide(player, dealer_upcard, can_surrender) -> HIT / STAND / SURRENDER
+DecisionCallback = Callable[[Player, Card, bool], str]
+
+
+@dataclass
+class RoundResult:
+    """Outcome of a single resolved round."""
+    outcome: str
+    bet: int
+    payout: int  # chips returned to the player (stake included)
+    player_value: int
+    dealer_value: int
+    dealer_busted: bool = False
+
+    @property
+    def net(self) -> int:
+        """Chip delta for the round."""
+        return self.payout - self.bet
+
+
+def is_natural(player: Player) -> bool:
+    """Two-card 21."""
+    return len(player.hand) == 2 and player.hand_value == 21
+
+
+def surrender_hand(player: Player, dealer: Dealer, rules: Rules = DEFAULT_RULES) -> RoundResult:
+    """Give up the hand for part of the bet back (half under the house rules)."""
+    bet = player.bet
+    refund = int(bet * rules.surrender_refund)
+    player.chips += refund
+    player.bet = 0
+    return RoundResult(SURRENDERED, bet, refund, player.hand_value, dealer.hand_value)
+
+
+def _win(player: Player, payout_multiplier: float) -> int:
+    """Pay a winning bet; returns the chips paid back."""
+    chips = player.chips
+    player.win_bet(payout_multiplier)
+    return player.chips - chips
+
+
+def settle(player: Player, dealer: Dealer, rules: Rules = DEFAULT_RULES) -> RoundResult:
+    """Settle a finished hand's bet against the dealer's final hand."""
+    bet = player.bet
+    p_val = player.hand_value
+    d_val = dealer.hand_value
+
+    if player.is_busted:
+        player.lose_bet()
+        return RoundResult(BUST, bet, 0, p_val, d_val)
+
+    if rules.blackjack_payout is not None:
+        player_natural = is_natural(player)
+        dealer_natural = is_natural(dealer)
+        if player_natural and not dealer_natural:
+            return RoundResult(WIN, bet, _win(player, rules.blackjack_payout), p_val, d_val)
+        if dealer_natural and not player_natural:
+            player.lose_bet()
+            return RoundResult(LOSS, bet, 0, p_val, d_val)
+
+    if dealer.is_busted:
+        return RoundResult(WIN, bet, _win(player, rules.win_payout), p_val, d_val, dealer_busted=True)
+    elif d_val > p_val:
+        player.lose_bet()
+        return RoundResult(LOSS, bet, 0, p_val, d_val)
+    elif d_val < p_val:
+        return RoundResult(WIN, bet, _win(player, rules.win_payout), p_val, d_val)
+    else:
+        player.push_bet()
+        return RoundResult(PUSH, bet, bet, p_val, d_val)
+
+
+def play_hand(player: Player, dealer: Dealer, deck: Deck, decide: DecisionCallback,
+              rules: Rules = DEFAULT_RULES) -> Optional[RoundResult]:
+    """
+    Run one player's decisions until they stand or bust.
+    Returns the result if they surrendered, otherwise None (settle later).
+    """
+    upcard = dealer.hand[0]
+    first_action = True
+    while not player.is_busted:
+        can_surrender = first_action and rules.surrender_allowed
+        action = decide(player, upcard, can_surrender)
+        if action == SURRENDER and can_surrender:
+            return surrender_hand(player, dealer, rules)
+        first_action = False
+
+        if action == HIT:
+            player.add_card(deck.deal())
+        else:
+            break
+    return None
+
+
+class RoundEngine:
+    """
+    Headless Blackjack rules.
+
+    Owns the deal order, surrender, bust, dealer play and payouts, with no
+    rendering, sleeping or saving. BlackjackGame drives it step by step for
+    the interactive game; simulations call play_round() with a callback.
+    """
+
+    def __init__(self, deck: Deck, player: Optional[Player] = None, dealer: Optional[Dealer] = None,
+                 rules: Rules = DEFAULT_RULES):
+        self.deck = deck
+        self.rules = rules
+        self.player = player if player is not None else Player("Player")
+        self.dealer = dealer if dealer is not None else Dealer(rules.dealer_hits_soft_17)
+
+    def clear_hands(self):
+        self.player.clear_hand()
+        self.dealer.clear_hand()
+
+    def begin_round(self, bet: int) -> bool:
+        """Place the bet and deal the opening cards. False if the bet is refused."""
+        self.clear_hands()
+        if not self.player.place_bet(bet):
+            return False
+
+        # Reshuffle only between rounds, never mid-hand
+        self.deck.shuffle_if_needed()
+
+        # Player, dealer, player, dealer
+        self.player.add_card(self.deck.deal())
+        self.dealer.add_card(self.deck.deal())
+        self.player.add_card(self.deck.deal())
+        self.dealer.add_card(self.deck.deal())
+        return True
+
+    def hit(self) -> Card:
+        card = self.deck.deal()
+        self.player.add_card(card)
+        return card
+
+    def surrender(self) -> RoundResult:
+        return surrender_hand(self.player, self.dealer, self.rules)
+
+    def dealer_draw(self) -> bool:
+        """Draw one dealer card if the dealer must hit. Returns True if a card was drawn."""
+        if not self.dealer.should_hit():
+            return False
+        self.dealer.add_card(self.deck.deal())
+        return True
+
+    def play_dealer(self):
+        while self.dealer_draw():
+            pass
+
+    def resolve(self) -> RoundResult:
+        return settle(self.player, self.dealer, self.rules)
+
+    def play_round(self, bet: int, decide: DecisionCallback) -> Optional[RoundResult]:
+        """
+        Play a full round without any UI.
+        Returns None if the bet could not be placed.
+        """
+        if not self.begin_round(bet):
+            return None
+
+        surrendered = play_hand(self.player, self.dealer, self.deck, decide, self.rules)
+        if surrendered is not None:
+            return surrendered
+
+        if not self.player.is_busted:
+            self.play_dealer()
+        return self.resolve()
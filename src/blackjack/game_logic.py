@@ -1,8 +1,11 @@
 from .models.card import Deck
 from .models.player import Player, Dealer
+from .engine import RoundEngine, WIN, LOSS
+from .rules import Rules, DEFAULT_RULES
 from .ui import BlackjackUI
 from . import storage
 from .trivia import TriviaManager
+from .instrumentation import NULL_RECORDER
 import time
 import getpass
 import os
@@ -18,12 +21,16 @@ NEW_PLAYER_MESSAGES = [
 ]
 
 class BlackjackGame:
-    def __init__(self):
+    def __init__(self, rng=None, shuffle_log=None, rules: Rules = DEFAULT_RULES, recorder=None):
         self.ui = BlackjackUI()
-        self.deck = Deck(num_decks=6)
+        # Opt-in phase timing (see instrumentation.SpanRecorder)
+        self.recorder = recorder if recorder is not None else NULL_RECORDER
+        self.rules = rules
+        self.deck = Deck(num_decks=rules.num_decks, rng=rng, penetration=rules.penetration, shuffle_log=shuffle_log)
         self.player = Player("Player")
-        self.dealer = Dealer()
-        self.trivia = TriviaManager()
+        self.dealer = Dealer(rules.dealer_hits_soft_17)
+        self.engine = RoundEngine(self.deck, self.player, self.dealer, rules)
+        self.trivia = TriviaManager(rng=rng)
 
     def get_system_username(self) -> str:
         """Get the system username."""
@@ -72,97 +79,104 @@ class BlackjackGame:
 
     def save_progress(self):
         """Save player's current chips."""
-        storage.save_player(self.player.name, self.player.chips)
+        with self.recorder.span("save_progress"):
+            storage.save_player(self.player.name, self.player.chips)
+
+    def display_table(self, *args):
+        with self.recorder.span("display_table"):
+            self.ui.display_table(self.player, self.dealer, *args)
 
     def play_round(self):
+        rec = self.recorder
         # Clear hands first so boards are empty at betting time
-        self.player.clear_hand()
-        self.dealer.clear_hand()
+        self.engine.clear_hands()
         
         # 1. Place Bet
-        self.ui.display_table(self.player, self.dealer, "betting")
-        bet = self.ui.get_bet(self.player.chips)
-        if not self.player.place_bet(bet):
+        with rec.span("bet"):
+            self.display_table("betting")
+            with rec.idle():
+                bet = self.ui.get_bet(self.player.chips)
+
+        # 2. Deal Initial Cards
+        with rec.span("deal"):
+            dealt = self.engine.begin_round(bet)
+        if not dealt:
             self.ui.show_message("Not enough chips!", "red")
             return
 
-        # 2. Deal Initial Cards
-        self.player.add_card(self.deck.deal())
-        self.dealer.add_card(self.deck.deal())
-        self.player.add_card(self.deck.deal())
-        self.dealer.add_card(self.deck.deal())
+        # 3. Player Turn (a natural 21 still gets to choose)
+        result = None
+        message = None
+        with rec.span("player_turn"):
+            first_action = True
+            while not self.player.is_busted:
+                self.display_table("playing")
 
-        # 3. Check Natural Blackjack
-        p_val = self.player.hand_value
-        
-        if p_val == 21:
-            pass  # Let player stand with 21
+                with rec.idle():
+                    action = self.ui.get_action(can_surrender=first_action and self.rules.surrender_allowed)
+                first_action = False
 
-        # 4. Player Turn
-        first_action = True
-        while not self.player.is_busted:
-            self.ui.display_table(self.player, self.dealer, "playing")
-            
-            action = self.ui.get_action(can_surrender=first_action)
-            first_action = False
-            
-            if action in ['h', 'hit']:
-                self.player.add_card(self.deck.deal())
-                if self.player.is_busted:
-                    bet_amount = self.player.bet
-                    self.player.lose_bet()
-                    self.ui.display_table(self.player, self.dealer, "finished", "BUSTED!", f"-${bet_amount}")
-                    self.save_progress()
-                    time.sleep(1.5)
-                    return
+                if action in ['h', 'hit']:
+                    self.engine.hit()
+                    if self.player.is_busted:
+                        break
 
-            elif action in ['u', 'surrender']:
-                half_bet = self.player.bet // 2
-                self.player.chips += half_bet
-                self.player.bet = 0
-                self.ui.display_table(self.player, self.dealer, "finished", "Surrendered", f"-${half_bet}")
-                self.save_progress()
-                time.sleep(1.5)
-                return
-            
-            elif action in ['s', 'stand']:
-                break
-        
-        # 5. Dealer Turn
-        self.ui.display_table(self.player, self.dealer, "dealer_turn", "Dealer...")
-        time.sleep(0.5)
+                elif action in ['u', 'surrender']:
+                    result = self.engine.surrender()
+                    message = ("Surrendered", f"-${-result.net}")
+                    break
+
+                elif action in ['s', 'stand']:
+                    break
+
+        if self.player.is_busted or result is not None:
+            if result is None:
+                with rec.span("resolve"):
+                    result = self.engine.resolve()
+                message = ("BUSTED!", f"-${result.bet}")
+            self.display_table("finished", *message)
+            storage.record_round(self.player.name, result.bet, result.outcome, result.net, self.player.chips)
+            self.save_progress()
+            rec.sleep(1.5)
+            return
         
-        while self.dealer.should_hit():
-            self.dealer.add_card(self.deck.deal())
-            self.ui.display_table(self.player, self.dealer, "dealer_turn")
-            time.sleep(0.5)
+        # 4. Dealer Turn
+        with rec.span("dealer_turn"):
+            self.display_table("dealer_turn", "Dealer...")
+            rec.sleep(0.5)
+
+            while self.engine.dealer_draw():
+                self.display_table("dealer_turn")
+                rec.sleep(0.5)
 
-        # 6. Resolve
-        p_val = self.player.hand_value
-        d_val = self.dealer.hand_value
-        bet_amount = self.player.bet
+        # 5. Resolve
+        with rec.span("resolve"):
+            result = self.engine.resolve()
         
-        if self.dealer.is_busted:
-            self.player.win_bet()
-            self.ui.display_table(self.player, self.dealer, "finished", "You Win!", f"+${bet_amount}")
-        elif d_val > p_val:
-            self.player.lose_bet()
-            self.ui.display_table(self.player, self.dealer, "finished", "Dealer Wins", f"-${bet_amount}")
-        elif d_val < p_val:
-            self.player.win_bet()
-            self.ui.display_table(self.player, self.dealer, "finished", "You Win!", f"+${bet_amount}")
+        if result.outcome == WIN:
+            self.display_table("finished", "You Win!", f"+${result.net}")
+        elif result.outcome == LOSS:
+            self.display_table("finished", "Dealer Wins", f"-${result.bet}")
         else:
-            self.player.push_bet()
-            self.ui.display_table(self.player, self.dealer, "finished", "Push (Tie)", "$0")
+            self.display_table("finished", "Push (Tie)", "$0")
         
         # Save after each round
+        storage.record_round(self.player.name, result.bet, result.outcome, result.net, self.player.chips)
         self.save_progress()
-        time.sleep(1.5)
+        rec.sleep(1.5)
 
     def run(self):
+        # Chip saves go to a background writer so the UI never waits on disk
+        storage.start_write_behind()
+        try:
+            self._run()
+        finally:
+            storage.stop_write_behind()
+
+    def _run(self):
         # 1. Start Menu Logic
-        backups = storage.get_available_backups()
-        latest_backup = backups[0] if backups else None
+        backups = storage.get_backup_entries()
+        latest_backup = backups[0].path if backups else None
         
         # Always show menu
         backup_name = latest_backup.name if latest_backup else None
@@ -319,6 +333,8 @@ class BlackjackGame:
                 self.ui.show_about_page()
             else:  # exit
                 self.ui.console.print("[yellow]Saving game...[/yellow]")
+                # Queued chip updates must be on disk before the save slot is copied
+                storage.flush()
                 if storage.save_current_game():
                     self.ui.console.print("[green]Game saved![/green]")
                 else:
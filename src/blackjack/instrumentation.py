@@ -0,0 +1,121 @@
+"""
+Opt-in wall-time spans for the interactive game.
+
+BlackjackGame wraps each phase of a round (bet, deal, player turn, dealer
+turn, resolve, save, every display_table) in recorder.span(). Time spent
+in deliberate pauses (recorder.sleep) or waiting on the player
+(recorder.idle) is recorded under its own name and subtracted from every
+span it happened inside, so a phase's time is the work it did.
+
+Spans go into a fixed-size ring buffer; summary() gives p50/p95/p99 per
+phase. Without a recorder the game uses NULL_RECORDER, which only sleeps.
+"""
+import json
+import time
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Sequence, Union
+
+SLEEP = "sleep"
+INPUT = "input"
+
+
+class Span(NamedTuple):
+    name: str
+    start: float     # perf_counter() at entry
+    duration: float  # seconds of work, idle time excluded
+    idle: bool = False
+
+
+def percentile(sorted_values: Sequence[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted sequence."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * q // 100))  # ceil
+    return sorted_values[int(rank) - 1]
+
+
+class SpanRecorder:
+    """Records spans into a ring buffer holding the last `capacity` spans."""
+
+    def __init__(self, capacity: int = 4096, clock=time.perf_counter):
+        self.spans: deque = deque(maxlen=capacity)
+        self.clock = clock
+        # Idle seconds accumulated by each open span, innermost last
+        self._open: List[float] = []
+
+    @contextmanager
+    def span(self, name: str):
+        start = self.clock()
+        self._open.append(0.0)
+        try:
+            yield
+        finally:
+            idle = self._open.pop()
+            self.spans.append(Span(name, start, self.clock() - start - idle))
+
+    @contextmanager
+    def idle(self, name: str = INPUT):
+        """Time not spent working (e.g. waiting on a prompt), kept out of enclosing spans."""
+        start = self.clock()
+        try:
+            yield
+        finally:
+            elapsed = self.clock() - start
+            self._open = [idle + elapsed for idle in self._open]
+            self.spans.append(Span(name, start, elapsed, idle=True))
+
+    def sleep(self, seconds: float):
+        with self.idle(SLEEP):
+            time.sleep(seconds)
+
+    def clear(self):
+        self.spans.clear()
+
+    def summary(self) -> Dict[str, Dict]:
+        """Per-name stats in milliseconds, work phases and idle time kept apart."""
+        grouped: Dict[bool, Dict[str, List[float]]] = {False: {}, True: {}}
+        for span in self.spans:
+            grouped[span.idle].setdefault(span.name, []).append(span.duration * 1000)
+
+        def stats(values: List[float]) -> Dict[str, float]:
+            values.sort()
+            return {
+                "count": len(values),
+                "total_ms": sum(values),
+                "p50_ms": percentile(values, 50),
+                "p95_ms": percentile(values, 95),
+                "p99_ms": percentile(values, 99),
+                "max_ms": values[-1],
+            }
+
+        return {
+            "phases": {name: stats(values) for name, values in grouped[False].items()},
+            "idle": {name: stats(values) for name, values in grouped[True].items()},
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self.summary(), indent=2)
+
+    def dump(self, path: Union[str, Path]):
+        with open(path, 'w') as f:
+            f.write(self.to_json())
+
+
+class _NullRecorder:
+    """Recorder that records nothing."""
+
+    @contextmanager
+    def span(self, name: str):
+        yield
+
+    @contextmanager
+    def idle(self, name: str = INPUT):
+        yield
+
+    def sleep(self, seconds: float):
+        time.sleep(seconds)
+
+
+NULL_RECORDER = _NullRecorder()
@@ -1,5 +1,5 @@
 import random
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 SUITS = ['Spades', 'Diamonds', 'Clubs', 'Hearts']
 RANKS = ['Two', 'Three', 'Four', 'Five', 'Six', 'Seven', 'Eight', 'Nine', 'Ten', 'Jack', 'Queen', 'King', 'Ace']
@@ -14,12 +14,40 @@ RANK_SYMBOLS = {
 }
 
 class Card:
-    def __init__(self, rank: str, suit: str):
-        self.rank = rank
-        self.suit = suit
-        self.value = VALUES[rank]
-        self.symbol = SUIT_SYMBOLS[suit]
-        self.rank_symbol = RANK_SYMBOLS[rank]
+    """
+    An immutable playing card.
+
+    There are only 52 distinct cards, so each one is created once and
+    shared: Card('Ace', 'Spades') always returns the same object.
+    """
+    __slots__ = ('rank', 'suit', 'value', 'symbol', 'rank_symbol', 'code')
+    _interned = {}
+
+    def __new__(cls, rank: str, suit: str):
+        card = cls._interned.get((rank, suit))
+        if card is None:
+            card = super().__new__(cls)
+            object.__setattr__(card, 'rank', rank)
+            object.__setattr__(card, 'suit', suit)
+            object.__setattr__(card, 'value', VALUES[rank])
+            object.__setattr__(card, 'symbol', SUIT_SYMBOLS[suit])
+            object.__setattr__(card, 'rank_symbol', RANK_SYMBOLS[rank])
+            object.__setattr__(card, 'code', SUITS.index(suit) * 13 + RANKS.index(rank))
+            cls._interned[(rank, suit)] = card
+        return card
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Card is immutable")
+
+    def __reduce__(self):
+        # Unpickle back to the shared instance
+        return (Card, (self.rank, self.suit))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
 
     def __str__(self):
         return f"{self.rank} of {self.suit}"
@@ -27,28 +55,133 @@ class Card:
     def __repr__(self):
         return f"Card({self.rank}, {self.suit})"
 
+def card_code(rank: str, suit: str) -> int:
+    """Pack a card into a 0-51 code: suit * 13 + rank index."""
+    return Card(rank, suit).code
+
+# The 52 shared cards, indexed by code
+CARDS = tuple(Card(RANKS[code % 13], SUITS[code // 13]) for code in range(52))
+
+def card_from_code(code: int) -> Card:
+    """The shared Card for a packed card code."""
+    return CARDS[code]
+
+# Card value (2-11) of each packed code
+CODE_VALUES = tuple(card.value for card in CARDS)
+
 class Deck:
-    def __init__(self, num_decks: int = 1):
+    """
+    A shoe of num_decks * 52 cards stored as one byte per card.
+
+    Cards are dealt by advancing a cursor over the buffer and handed out as
+    the shared Card instances. Reshuffling permutes the same buffer in place,
+    so no per-card objects are kept or reallocated.
+
+    `penetration` places the cut card: once that fraction of the shoe has
+    been dealt, needs_shuffle turns True and the next shuffle_if_needed()
+    (called between rounds) reshuffles. A hand in progress always finishes
+    from the current shoe.
+
+    `rng` is anything with the random.Random shuffle/seed/getrandbits
+    interface (see blackjack.rng). With a `shuffle_log`, every shuffle is
+    seeded from the log so the whole sequence of shoes can be replayed.
+    """
+
+    def __init__(self, num_decks: int = 1, rng: Optional[random.Random] = None, penetration: float = 1.0,
+                 shuffle_log=None):
+        if not 0 < penetration <= 1:
+            raise ValueError("penetration must be in (0, 1]")
         self.num_decks = num_decks
-        self.cards: List[Card] = []
+        if shuffle_log is None:
+            rng = rng if rng is not None else random
+        elif shuffle_log.replaying:
+            rng = rng if rng is not None else shuffle_log.make_rng()
+        else:
+            # Logged shuffles reseed the RNG, so never hand the global one over
+            rng = rng if rng is not None else random.Random()
+            shuffle_log.kind = getattr(rng, "kind", "random")
+        self.rng = rng
+        self.shuffle_log = shuffle_log
+        self.counter = None
+        self._codes = bytearray(range(52)) * num_decks
+        self._cursor = 0
+        self.cut_card = max(1, int(len(self._codes) * penetration))
         self.create_deck()
 
     def create_deck(self):
-        self.cards = []
-        for _ in range(self.num_decks):
-            for suit in SUITS:
-                for rank in RANKS:
-                    self.cards.append(Card(rank, suit))
+        """Gather every card back into the shoe and shuffle it."""
+        self._cursor = 0
+        if self.counter is not None:
+            self.counter.reset()
         self.shuffle()
 
     def shuffle(self):
-        random.shuffle(self.cards)
+        """Shuffle the undealt part of the shoe in place."""
+        if self.shuffle_log is not None:
+            self.rng.seed(self.shuffle_log.next_seed(self.rng))
+        self.rng.shuffle(memoryview(self._codes)[self._cursor:])
+
+    @property
+    def needs_shuffle(self) -> bool:
+        """True once the cut card has come out."""
+        return self._cursor >= self.cut_card
 
-    def deal(self) -> Optional[Card]:
-        if not self.cards:
-            # Auto-reshuffle if deck is empty (simple rule)
+    def shuffle_if_needed(self) -> bool:
+        """Reshuffle between rounds if the cut card was reached. Returns True if it reshuffled."""
+        if self._cursor < self.cut_card:
+            return False
+        self.create_deck()
+        return True
+
+    def deal_code(self) -> int:
+        """Deal the next card as a packed code (see card_code)."""
+        if self._cursor >= len(self._codes):
+            # Only reached mid-hand if the shoe runs dry before the cut card is checked
             self.create_deck()
-        return self.cards.pop() if self.cards else None
+        code = self._codes[self._cursor]
+        self._cursor += 1
+        if self.counter is not None:
+            self.counter.see(code)
+        return code
+
+    def deal(self) -> Card:
+        return CARDS[self.deal_code()]
+
+    def attach_counter(self, counter):
+        """
+        Track a count (a models.counting.CardCounter) from here on; None detaches.
+        The counter starts from the cards still in the shoe, so attach it
+        right after a shuffle.
+        """
+        self.counter = counter
+
+    @property
+    def decks_remaining(self) -> float:
+        return len(self) / 52
+
+    @property
+    def running_count(self) -> int:
+        if self.counter is None:
+            raise ValueError("No counter attached")
+        return self.counter.running_count
+
+    @property
+    def true_count(self) -> float:
+        if self.counter is None:
+            raise ValueError("No counter attached")
+        return self.counter.true_count(self.decks_remaining)
+
+    def composition(self) -> Tuple[int, ...]:
+        """Undealt card counts by value 2..11 (index 0 is Twos, index 9 is Aces)."""
+        counts = [0] * 10
+        for code in self._codes[self._cursor:]:
+            counts[CODE_VALUES[code] - 2] += 1
+        return tuple(counts)
+
+    @property
+    def cards(self) -> List[Card]:
+        """Undealt cards, next card first."""
+        return [CARDS[code] for code in self._codes[self._cursor:]]
 
     def __len__(self):
-        return len(self.cards)
+        return len(self._codes) - self._cursor
@@ -0,0 +1,56 @@
+from typing import Dict, Sequence, Tuple, Union
+
+# Tag per rank, in RANKS order: Two, Three, ..., King, Ace
+HI_LO = (1, 1, 1, 1, 1, 0, 0, 0, -1, -1, -1, -1, -1)
+KO = (1, 1, 1, 1, 1, 1, 0, 0, -1, -1, -1, -1, -1)
+HI_OPT_I = (0, 1, 1, 1, 1, 0, 0, 0, -1, -1, -1, -1, 0)
+HI_OPT_II = (1, 1, 2, 2, 1, 1, 0, 0, -2, -2, -2, -2, 0)
+OMEGA_II = (1, 1, 2, 2, 2, 1, 0, -1, -2, -2, -2, -2, 0)
+ZEN = (1, 1, 2, 2, 2, 1, 0, 0, -2, -2, -2, -2, -1)
+
+COUNT_SYSTEMS: Dict[str, Tuple[int, ...]] = {
+    "hi-lo": HI_LO,
+    "ko": KO,
+    "hi-opt-i": HI_OPT_I,
+    "hi-opt-ii": HI_OPT_II,
+    "omega-ii": OMEGA_II,
+    "zen": ZEN,
+}
+
+
+class CardCounter:
+    """
+    Running count for a tag system, updated once per dealt card.
+
+    Attach it with Deck.attach_counter(); the deck feeds it every card code
+    it deals and resets it on a full reshuffle.
+    """
+    __slots__ = ('system', 'initial_count', 'running_count', 'cards_seen', '_code_tags')
+
+    def __init__(self, system: Union[str, Sequence[int]] = "hi-lo", initial_count: int = 0):
+        if isinstance(system, str):
+            if system not in COUNT_SYSTEMS:
+                raise ValueError(f"Unknown counting system: {system}")
+            tags = COUNT_SYSTEMS[system]
+        else:
+            tags = tuple(system)
+            if len(tags) != 13:
+                raise ValueError("A counting system needs one tag per rank (13)")
+            system = "custom"
+        self.system = system
+        self.initial_count = initial_count
+        # Tag per packed card code (suit * 13 + rank index), so see() is one lookup
+        self._code_tags = tuple(tags[code % 13] for code in range(52))
+        self.reset()
+
+    def reset(self):
+        self.running_count = self.initial_count
+        self.cards_seen = 0
+
+    def see(self, code: int):
+        self.running_count += self._code_tags[code]
+        self.cards_seen += 1
+
+    def true_count(self, decks_remaining: float) -> float:
+        """Running count per deck left (the running count itself once under half a deck)."""
+        return self.running_count / max(decks_remaining, 0.5)
@@ -2,19 +2,31 @@ from typing import List
 from .card import Card
 
 class Player:
+    __slots__ = ('name', 'chips', 'hand', 'bet', 'is_standing', '_hard_total', '_aces')
+
     def __init__(self, name: str, chips: int = 0):
         self.name = name
         self.chips = chips
         self.hand: List[Card] = []
         self.bet = 0
         self.is_standing = False
+        # Running totals so hand_value never rescans the hand
+        self._hard_total = 0  # Aces counted as 1
+        self._aces = 0
 
     def add_card(self, card: Card):
         self.hand.append(card)
+        if card.rank == 'Ace':
+            self._hard_total += 1
+            self._aces += 1
+        else:
+            self._hard_total += card.value
 
     def clear_hand(self):
         self.hand = []
         self.is_standing = False
+        self._hard_total = 0
+        self._aces = 0
 
     def place_bet(self, amount: int) -> bool:
         if amount > self.chips:
@@ -39,30 +51,31 @@ class Player:
 
     @property
     def hand_value(self) -> int:
-        value = 0
-        aces = 0
-        for card in self.hand:
-            value += card.value
-            if card.rank == 'Ace':
-                aces += 1
-        
-        while value > 21 and aces:
-            value -= 10
-            aces -= 1
-            
-        return value
+        # At most one Ace can count as 11 without busting
+        if self._aces and self._hard_total + 10 <= 21:
+            return self._hard_total + 10
+        return self._hard_total
+
+    @property
+    def is_soft(self) -> bool:
+        """True if an Ace is currently counted as 11."""
+        return self._aces > 0 and self._hard_total + 10 <= 21
     
     @property
     def is_busted(self) -> bool:
-        return self.hand_value > 21
+        return self._hard_total > 21
 
     def __str__(self):
         return f"{self.name} (Chips: {self.chips})"
 
 class Dealer(Player):
-    def __init__(self):
+    __slots__ = ('hits_soft_17',)
+
+    def __init__(self, hits_soft_17: bool = False):
         super().__init__("Dealer", 0)
+        self.hits_soft_17 = hits_soft_17
 
     def should_hit(self) -> bool:
-        # Dealer hits on 16 or less, stands on 17
-        return self.hand_value < 17
+        # Dealer hits on 16 or less, stands on 17 (hits a soft 17 under H17 rules)
+        value = self.hand_value
+        return value < 17 or (value == 17 and self.hits_soft_17 and self.is_soft)
@@ -0,0 +1,219 @@
+"""
+Content-addressed storage for save slots.
+
+Every file saved into a slot is stored once under objects/ by its SHA-256
+and hardlinked into the slot (copied where hardlinks are not supported).
+A slot also gets a small .manifest.json listing each file's digest. Files
+are hashed only when their (size, mtime, inode) changed since the last
+save, and a slot entry whose digest did not change is left alone, so a
+save costs a stat per file plus the bytes that actually changed.
+"""
+import fnmatch
+import hashlib
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional, Set, Tuple
+
+MANIFEST_NAME = ".manifest.json"
+_CHUNK = 1024 * 1024
+
+
+def file_digest(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(_CHUNK), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _replace_file(src: Path, dest: Path, link: bool = True):
+    """Put a hardlink to (or copy of) src at dest, replacing whatever is there."""
+    tmp = dest.with_name(f".{dest.name}.tmp")
+    if tmp.exists():
+        tmp.unlink()
+    try:
+        if not link:
+            raise OSError
+        os.link(src, tmp)
+    except OSError:
+        shutil.copy2(src, tmp)
+    os.replace(tmp, dest)
+
+
+class ObjectStore:
+    """Files stored by SHA-256 under root/ab/cdef..."""
+
+    def __init__(self, root: Path):
+        self.root = root
+
+    def path_for(self, digest: str) -> Path:
+        return self.root / digest[:2] / digest[2:]
+
+    def __contains__(self, digest: str) -> bool:
+        return self.path_for(digest).exists()
+
+    def add_file(self, src: Path) -> str:
+        """Store a copy of src, hashing it as it is copied. Returns its digest."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = self.root / f".incoming-{os.getpid()}"
+        h = hashlib.sha256()
+        with open(src, 'rb') as fin, open(tmp, 'wb') as fout:
+            for chunk in iter(lambda: fin.read(_CHUNK), b""):
+                h.update(chunk)
+                fout.write(chunk)
+        digest = h.hexdigest()
+        dest = self.path_for(digest)
+        if dest.exists():
+            tmp.unlink()
+        else:
+            dest.parent.mkdir(exist_ok=True)
+            shutil.copystat(src, tmp)
+            os.replace(tmp, dest)
+        return digest
+
+    def link(self, digest: str, dest: Path):
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        _replace_file(self.path_for(digest), dest)
+
+    def digests(self) -> Iterator[str]:
+        if not self.root.exists():
+            return
+        for prefix in self.root.iterdir():
+            if prefix.is_dir() and len(prefix.name) == 2:
+                for obj in prefix.iterdir():
+                    yield prefix.name + obj.name
+
+    def gc(self, keep: Set[str]) -> int:
+        """Delete objects not in keep. Returns how many were removed."""
+        removed = 0
+        for digest in list(self.digests()):
+            if digest not in keep:
+                self.path_for(digest).unlink()
+                removed += 1
+        return removed
+
+
+class HashCache:
+    """Last known digest per source file, keyed by relative path and (size, mtime_ns, inode)."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.entries: Dict[str, list] = {}
+        try:
+            with open(path, 'r') as f:
+                self.entries = json.load(f)
+        except (IOError, ValueError):
+            self.entries = {}
+
+    @staticmethod
+    def _key(st: os.stat_result) -> list:
+        return [st.st_size, st.st_mtime_ns, st.st_ino]
+
+    def lookup(self, rel: str, st: os.stat_result) -> Optional[str]:
+        entry = self.entries.get(rel)
+        if entry is not None and entry[:3] == self._key(st):
+            return entry[3]
+        return None
+
+    def store(self, rel: str, st: os.stat_result, digest: str):
+        self.entries[rel] = self._key(st) + [digest]
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f".{self.path.name}.tmp")
+        with open(tmp, 'w') as f:
+            json.dump(self.entries, f)
+        os.replace(tmp, self.path)
+
+
+def read_manifest(slot: Path) -> Dict[str, Dict]:
+    """{relative path: {"digest", "size"}} for a slot, empty for legacy full-copy slots."""
+    try:
+        with open(slot / MANIFEST_NAME, 'r') as f:
+            return json.load(f)["files"]
+    except (IOError, ValueError, KeyError):
+        return {}
+
+
+def _walk(source: Path, ignore: Iterable[str]) -> Iterator[Tuple[str, Path]]:
+    patterns = list(ignore)
+
+    def ignored(name: str) -> bool:
+        return any(fnmatch.fnmatch(name, pattern) for pattern in patterns)
+
+    for dirpath, dirnames, filenames in os.walk(source):
+        dirnames[:] = sorted(d for d in dirnames if not ignored(d))
+        for name in sorted(filenames):
+            if not ignored(name):
+                path = Path(dirpath) / name
+                yield path.relative_to(source).as_posix(), path
+
+
+def snapshot_dir(source: Path, slot: Path, objects: ObjectStore, cache: HashCache,
+                 ignore: Iterable[str] = ()) -> Dict[str, Dict]:
+    """
+    Make `slot` mirror `source` through the object store and write its manifest.
+    Files matching an `ignore` pattern (by name, at any depth) are skipped.
+    """
+    old = read_manifest(slot)
+    files: Dict[str, Dict] = {}
+    slot.mkdir(parents=True, exist_ok=True)
+
+    for rel, path in _walk(source, ignore):
+        try:
+            st = os.stat(path)
+            digest = cache.lookup(rel, st)
+            if digest is None or digest not in objects:
+                digest = objects.add_file(path)
+                cache.store(rel, st, digest)
+        except OSError:
+            # Vanished or unreadable mid-save; leave it out of this slot
+            continue
+        files[rel] = {"digest": digest, "size": st.st_size}
+        target = slot / rel
+        if old.get(rel, {}).get("digest") != digest or not target.exists():
+            objects.link(digest, target)
+
+    for rel in old.keys() - files.keys():
+        try:
+            (slot / rel).unlink()
+        except OSError:
+            pass
+
+    tmp = slot / f".{MANIFEST_NAME}.tmp"
+    with open(tmp, 'w') as f:
+        json.dump({"files": files}, f, indent=1)
+    os.replace(tmp, slot / MANIFEST_NAME)
+    cache.save()
+    return files
+
+
+def stage_slot(slot: Path, dest: Path, live: Path, cache: HashCache, ignore: Iterable[str] = ()) -> int:
+    """
+    Fill dest with a copy of slot, for swapping into live. A live file whose
+    cached digest matches the slot is hardlinked rather than copied; other
+    files are copied, never linked, so nothing outside saves/ shares an
+    inode with the object store. Returns the number of bytes copied.
+    """
+    files = read_manifest(slot)
+    if not files:
+        # Legacy full-copy slot: nothing to compare against, copy it all
+        files = {rel: {} for rel, _ in _walk(slot, list(ignore) + [MANIFEST_NAME])}
+
+    copied = 0
+    for rel, meta in files.items():
+        target = dest / rel
+        target.parent.mkdir(parents=True, exist_ok=True)
+        current = live / rel
+        try:
+            st = os.stat(current)
+            if meta.get("digest") and cache.lookup(rel, st) == meta["digest"]:
+                os.link(current, target)
+                continue
+        except OSError:
+            pass
+        shutil.copy2(slot / rel, target)
+        copied += os.stat(target).st_size
+    return copied
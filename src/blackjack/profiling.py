@@ -0,0 +1,85 @@
+"""
+Profile the game or a headless session and save the results.
+
+cProfile writes a .prof file (open with pstats, snakeviz, etc.) plus a
+text report of the top functions by cumulative time. When pyinstrument
+is installed, the sampling profiler can be used instead; it writes its
+own text and HTML reports.
+"""
+import cProfile
+import io
+import pstats
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, List, Optional
+
+from . import storage
+from .simulation import run_simulation
+from .solver import StrategyTable
+
+TOP_N = 40
+
+
+def sampling_available() -> bool:
+    try:
+        import pyinstrument  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def profiles_dir() -> Path:
+    path = storage.get_data_dir() / "profiles"
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _base_path(label: str, out_dir: Optional[Path]) -> Path:
+    stamp = datetime.now().strftime("%Y-%m-%d-%H-%M-%S")
+    return (out_dir if out_dir is not None else profiles_dir()) / f"profile-{label}-{stamp}"
+
+
+def profile_call(func: Callable[[], object], label: str, sampling: bool = False,
+                 top_n: int = TOP_N, out_dir: Optional[Path] = None) -> List[Path]:
+    """
+    Run func under a profiler and write the reports.
+    Returns the written paths. sampling=True uses pyinstrument when available.
+    """
+    base = _base_path(label, out_dir)
+
+    if sampling and sampling_available():
+        from pyinstrument import Profiler
+        profiler = Profiler()
+        profiler.start()
+        try:
+            func()
+        finally:
+            profiler.stop()
+            txt_path = base.with_suffix(".txt")
+            html_path = base.with_suffix(".html")
+            txt_path.write_text(profiler.output_text(unicode=True, color=False))
+            html_path.write_text(profiler.output_html())
+        return [txt_path, html_path]
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        func()
+    finally:
+        profiler.disable()
+        prof_path = base.with_suffix(".prof")
+        txt_path = base.with_suffix(".txt")
+        profiler.dump_stats(str(prof_path))
+
+        report = io.StringIO()
+        stats = pstats.Stats(profiler, stream=report)
+        stats.strip_dirs().sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top_n)
+        report.write("\n")
+        stats.sort_stats(pstats.SortKey.TIME).print_stats(top_n)
+        txt_path.write_text(report.getvalue())
+    return [prof_path, txt_path]
+
+
+def headless_session(rounds: int = 20_000, seed: int = 0):
+    """A single-process simulation with the basic-strategy chart, for profiling the engine."""
+    return run_simulation(rounds, seed=seed, workers=1, decide=StrategyTable().decide)
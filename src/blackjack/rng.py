@@ -0,0 +1,201 @@
+"""
+Random number generators for shuffling and trivia, plus a shuffle log.
+
+Anything with the random.Random interface used here (seed, getrandbits,
+shuffle, choice) can be passed to Deck or TriviaManager. make_rng builds
+one of the supported kinds:
+
+    "random"   random.Random (Mersenne Twister, the stdlib default)
+    "pcg64"    NumPy's PCG64 Generator (needs numpy)
+    "counter"  SplitMix64 over a counter, so streams can be jumped cheaply
+"""
+import hashlib
+import os
+import random
+import sys
+from array import array
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+RNG_KINDS = ("random", "pcg64", "counter")
+
+_MASK64 = (1 << 64) - 1
+_GAMMA = 0x9E3779B97F4A7C15
+
+
+def _splitmix64(x: int) -> int:
+    x = (x + _GAMMA) & _MASK64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return x ^ (x >> 31)
+
+
+class CounterRNG(random.Random):
+    """
+    Counter-based generator: output n is splitmix64(key + n * gamma).
+    The state is just (key, counter), so advance() jumps ahead in O(1).
+    """
+    kind = "counter"
+
+    def __init__(self, seed: Optional[int] = None):
+        super().__init__(seed)
+
+    def seed(self, a=None, version=2):
+        if a is None:
+            a = int.from_bytes(os.urandom(8), "little")
+        elif not isinstance(a, int):
+            if isinstance(a, str):
+                a = a.encode()
+            a = int.from_bytes(hashlib.sha512(bytes(a)).digest()[:8], "little")
+        self._key = a & _MASK64
+        self._counter = 0
+
+    def _next64(self) -> int:
+        out = _splitmix64((self._key + self._counter * _GAMMA) & _MASK64)
+        self._counter += 1
+        return out
+
+    def advance(self, n: int):
+        """Skip the next n 64-bit outputs."""
+        self._counter += n
+
+    def getrandbits(self, k: int) -> int:
+        if k <= 64:
+            return self._next64() >> (64 - k) if k else 0
+        result = 0
+        for shift in range(0, k, 64):
+            result |= self._next64() << shift
+        return result & ((1 << k) - 1)
+
+    def random(self) -> float:
+        return (self._next64() >> 11) * (1.0 / (1 << 53))
+
+    def getstate(self):
+        return (self._key, self._counter)
+
+    def setstate(self, state):
+        self._key, self._counter = state
+
+
+class NumpyRNG:
+    """random.Random-style wrapper around a NumPy PCG64 Generator."""
+    kind = "pcg64"
+
+    def __init__(self, seed: Optional[int] = None):
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError("The 'pcg64' RNG needs numpy: pip install numpy") from None
+        self._np = numpy
+        self.seed(seed)
+
+    def seed(self, a=None):
+        self._gen = self._np.random.Generator(self._np.random.PCG64(a))
+
+    def getrandbits(self, k: int) -> int:
+        if k == 0:
+            return 0
+        raw = int.from_bytes(self._gen.bytes((k + 7) // 8), "little")
+        return raw & ((1 << k) - 1)
+
+    def random(self) -> float:
+        return float(self._gen.random())
+
+    def shuffle(self, x):
+        if isinstance(x, (bytearray, memoryview)):
+            # In place on the shoe buffer, no copy
+            self._gen.shuffle(self._np.frombuffer(x, dtype=self._np.uint8))
+        else:
+            order = self._gen.permutation(len(x))
+            items = [x[i] for i in order]
+            x[:] = items
+
+    def choice(self, seq):
+        if not seq:
+            raise IndexError("Cannot choose from an empty sequence")
+        return seq[int(self._gen.integers(len(seq)))]
+
+
+def make_rng(kind: str = "random", seed: Optional[int] = None):
+    """Build an RNG of the given kind (see RNG_KINDS)."""
+    if kind == "random":
+        return random.Random(seed)
+    if kind == "pcg64":
+        return NumpyRNG(seed)
+    if kind == "counter":
+        return CounterRNG(seed)
+    raise ValueError(f"Unknown RNG kind: {kind}")
+
+
+def rng_kind(rng) -> str:
+    return getattr(rng, "kind", "random")
+
+
+class ShuffleLog:
+    """
+    The seed of every shoe shuffle, in order, 8 bytes each.
+
+    While recording, each shuffle draws a 64-bit seed from the deck's RNG,
+    stores it and reseeds the RNG with it. A log opened with replay() hands
+    the same seeds back, so a deck built with that log and an RNG of the
+    same kind repeats every shuffle exactly.
+    """
+
+    _MAGIC = b"BJSHUF1"
+
+    def __init__(self, kind: str = "random", seeds: Iterable[int] = ()):
+        self.kind = kind
+        self.seeds = array('Q', seeds)
+        self._replay_pos: Optional[int] = None
+
+    @property
+    def replaying(self) -> bool:
+        return self._replay_pos is not None
+
+    def next_seed(self, rng) -> int:
+        """Seed for the next shuffle: recorded from rng, or read back when replaying."""
+        if self._replay_pos is not None:
+            if self._replay_pos >= len(self.seeds):
+                raise IndexError("Shuffle log exhausted")
+            seed = self.seeds[self._replay_pos]
+            self._replay_pos += 1
+            return seed
+        seed = rng.getrandbits(64)
+        self.seeds.append(seed)
+        return seed
+
+    def replay(self) -> "ShuffleLog":
+        """A copy of this log that hands its seeds back from the start."""
+        log = ShuffleLog(self.kind, self.seeds)
+        log._replay_pos = 0
+        return log
+
+    def make_rng(self):
+        """Fresh RNG of the kind this log was recorded with."""
+        return make_rng(self.kind)
+
+    def save(self, path: Union[str, Path]):
+        with open(path, 'wb') as f:
+            f.write(self._MAGIC + b" " + self.kind.encode() + b"\n")
+            seeds = self.seeds
+            if sys.byteorder == "big":
+                # Stored little-endian
+                seeds = array('Q', seeds)
+                seeds.byteswap()
+            f.write(seeds.tobytes())
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "ShuffleLog":
+        with open(path, 'rb') as f:
+            header = f.readline().rstrip(b"\n")
+            magic, _, kind = header.partition(b" ")
+            if magic != cls._MAGIC:
+                raise ValueError(f"Not a shuffle log: {path}")
+            log = cls(kind.decode())
+            log.seeds.frombytes(f.read())
+            if sys.byteorder == "big":
+                log.seeds.byteswap()
+        return log
+
+    def __len__(self):
+        return len(self.seeds)
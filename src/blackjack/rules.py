@@ -0,0 +1,37 @@
+from dataclasses import dataclass, asdict
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class Rules:
+    """
+    Table rules. The defaults are the game's own house rules.
+
+    blackjack_payout: None means a natural is just a 21 paid like any other
+    win (the house rule); a number such as 1.5 pays two-card 21s at that
+    rate and lets a dealer natural beat any other player 21.
+    """
+    num_decks: int = 6
+    dealer_hits_soft_17: bool = False
+    win_payout: float = 1.0
+    blackjack_payout: Optional[float] = None
+    surrender_allowed: bool = True
+    surrender_refund: float = 0.5  # fraction of the bet returned on surrender
+    penetration: float = 0.75
+
+    def label(self) -> str:
+        """Short description, e.g. '6D S17 BJ1:1 LS 75%'."""
+        bj = "BJ1:1" if self.blackjack_payout is None else f"BJ{self.blackjack_payout:g}"
+        return " ".join([
+            f"{self.num_decks}D",
+            "H17" if self.dealer_hits_soft_17 else "S17",
+            bj,
+            "LS" if self.surrender_allowed else "NS",
+            f"{self.penetration:.0%}",
+        ])
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+DEFAULT_RULES = Rules()
@@ -0,0 +1,129 @@
+"""
+Monte Carlo simulation of many headless rounds.
+
+Rounds are split into fixed-size shards. Each shard plays on its own shoe
+with an RNG seeded from (master seed, shard index), so the merged result
+depends only on the master seed and round count, never on how many worker
+processes ran the shards.
+"""
+import random
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, fields
+from typing import List, Optional
+
+from .models.card import Card, Deck
+from .models.player import Player
+from .rng import ShuffleLog, make_rng
+from .rules import Rules, DEFAULT_RULES
+from .engine import RoundEngine, DecisionCallback, HIT, STAND, WIN, LOSS, PUSH, SURRENDERED, BUST
+
+SHARD_SIZE = 10_000
+
+
+@dataclass
+class SimulationStats:
+    """Merged counts over a batch of rounds."""
+    rounds: int = 0
+    wins: int = 0
+    losses: int = 0
+    pushes: int = 0
+    surrenders: int = 0
+    busts: int = 0
+    wagered: int = 0
+    net: int = 0
+
+    def record(self, result):
+        self.rounds += 1
+        self.wagered += result.bet
+        self.net += result.net
+        if result.outcome == WIN:
+            self.wins += 1
+        elif result.outcome == LOSS:
+            self.losses += 1
+        elif result.outcome == PUSH:
+            self.pushes += 1
+        elif result.outcome == SURRENDERED:
+            self.surrenders += 1
+        elif result.outcome == BUST:
+            self.busts += 1
+
+    def merge(self, other: "SimulationStats") -> "SimulationStats":
+        for f in fields(self):
+            setattr(self, f.name, getattr(self, f.name) + getattr(other, f.name))
+        return self
+
+    @property
+    def house_edge(self) -> float:
+        """Fraction of each chip wagered that the house keeps."""
+        return -self.net / self.wagered if self.wagered else 0.0
+
+
+def dealer_mimic(player: Player, upcard: Card, can_surrender: bool) -> str:
+    """Default strategy: play like the dealer (hit below 17)."""
+    return HIT if player.hand_value < 17 else STAND
+
+
+def shard_rng(seed: int, shard: int, kind: str = "random"):
+    """Independent RNG stream for one shard."""
+    # Derive a 64-bit shard seed through random.Random's string seeding (SHA-512)
+    shard_seed = random.Random(f"{seed}:{shard}").getrandbits(64)
+    return make_rng(kind, shard_seed)
+
+
+def run_shard(seed: int, shard: int, rounds: int, bet: int = 10, rules: Rules = DEFAULT_RULES,
+              decide: DecisionCallback = dealer_mimic, rng_kind: str = "random",
+              shuffle_log: Optional[ShuffleLog] = None) -> SimulationStats:
+    """
+    Play one shard of rounds on a fresh shoe.
+    Pass a ShuffleLog to record the shard's shuffles, or a replaying one to repeat them.
+    """
+    deck = Deck(num_decks=rules.num_decks, rng=shard_rng(seed, shard, rng_kind), penetration=rules.penetration,
+                shuffle_log=shuffle_log)
+    engine = RoundEngine(deck, Player("Sim"), rules=rules)
+    stats = SimulationStats()
+    for _ in range(rounds):
+        # Flat bet from an unlimited bankroll
+        engine.player.chips = bet
+        stats.record(engine.play_round(bet, decide))
+    return stats
+
+
+def _run_shard_args(args) -> SimulationStats:
+    return run_shard(*args)
+
+
+def shard_jobs(rounds: int, seed: int = 0, bet: int = 10, rules: Rules = DEFAULT_RULES,
+               decide: DecisionCallback = dealer_mimic, rng_kind: str = "random",
+               shard_size: int = SHARD_SIZE) -> List[tuple]:
+    """run_shard argument tuples covering `rounds` rounds."""
+    jobs = []
+    shard = 0
+    remaining = rounds
+    while remaining > 0:
+        size = min(shard_size, remaining)
+        jobs.append((seed, shard, size, bet, rules, decide, rng_kind))
+        shard += 1
+        remaining -= size
+    return jobs
+
+
+def run_jobs(jobs: List[tuple], workers: Optional[int] = None) -> List[SimulationStats]:
+    """Run shard jobs, in-process for workers=1, and return their stats in order."""
+    if workers == 1 or len(jobs) <= 1:
+        return [_run_shard_args(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_run_shard_args, jobs))
+
+
+def run_simulation(rounds: int, seed: int = 0, workers: Optional[int] = None, bet: int = 10,
+                   rules: Rules = DEFAULT_RULES, decide: DecisionCallback = dealer_mimic,
+                   rng_kind: str = "random", shard_size: int = SHARD_SIZE) -> SimulationStats:
+    """
+    Simulate `rounds` rounds across `workers` processes and merge the counts.
+    workers=1 runs in-process. `decide` must be picklable (a module-level function)
+    when more than one worker is used.
+    """
+    total = SimulationStats()
+    for stats in run_jobs(shard_jobs(rounds, seed, bet, rules, decide, rng_kind, shard_size), workers):
+        total.merge(stats)
+    return total
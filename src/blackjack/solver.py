@@ -0,0 +1,170 @@
+"""
+Exact expected value of hit, stand and surrender.
+
+EVs are in units of the bet: +1 is an even-money win, -1 a lost bet and
+-0.5 a surrender under the default rules (naturals are not priced
+separately). Shoes use the same compositions as dealer_odds (counts by
+value 2..11, None for an infinite deck) and must already exclude the
+player's cards and the dealer's upcard.
+"""
+from functools import lru_cache
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from .models.card import Card
+from .dealer_odds import dealer_distribution, remove_card, _draw_probs
+from .engine import HIT, STAND, SURRENDER
+from .rules import Rules, DEFAULT_RULES
+
+
+class ActionEVs(NamedTuple):
+    """EV of each action for one decision."""
+    hit: float
+    stand: float
+    surrender: Optional[float] = None  # None when surrender is not allowed
+
+    @property
+    def best_action(self) -> str:
+        best, action = self.stand, STAND
+        if self.hit > best:
+            best, action = self.hit, HIT
+        if self.surrender is not None and self.surrender > best:
+            action = SURRENDER
+        return action
+
+    @property
+    def best_ev(self) -> float:
+        return max(ev for ev in self if ev is not None)
+
+
+def hand_state(cards: Iterable[Card]) -> Tuple[int, bool]:
+    """(total, soft) of a hand, soft meaning an Ace is still counted as 11."""
+    hard = 0
+    has_ace = False
+    for card in cards:
+        if card.rank == 'Ace':
+            hard += 1
+            has_ace = True
+        else:
+            hard += card.value
+    if has_ace and hard + 10 <= 21:
+        return hard + 10, True
+    return hard, False
+
+def add_card(total: int, soft: bool, value: int) -> Tuple[int, bool]:
+    """(total, soft) after drawing a card of `value` (2-11)."""
+    if value == 11:
+        if total + 11 <= 21:
+            return total + 11, True
+        value = 1
+    total += value
+    if total > 21 and soft:
+        return total - 10, False
+    return total, soft
+
+
+@lru_cache(maxsize=None)
+def _stand_ev(total: int, upcard: int, composition: Optional[Tuple[int, ...]],
+              hit_soft_17: bool, win_payout: float) -> float:
+    if total > 21:
+        return -1.0
+    dist = dealer_distribution(upcard, composition, hit_soft_17)
+    win = dist.bust
+    lose = 0.0
+    for dealer_total in range(17, 22):
+        if dealer_total < total:
+            win += dist[dealer_total - 17]
+        elif dealer_total > total:
+            lose += dist[dealer_total - 17]
+    return win * win_payout - lose
+
+
+@lru_cache(maxsize=None)
+def _hit_ev(total: int, soft: bool, upcard: int, composition: Optional[Tuple[int, ...]],
+            hit_soft_17: bool, win_payout: float) -> float:
+    """EV of taking one card and then playing on optimally."""
+    ev = 0.0
+    for value, prob, after in _draw_probs(composition):
+        new_total, new_soft = add_card(total, soft, value)
+        if new_total > 21:
+            ev -= prob
+        elif new_total == 21:
+            ev += prob * _stand_ev(21, upcard, after, hit_soft_17, win_payout)
+        else:
+            ev += prob * max(_stand_ev(new_total, upcard, after, hit_soft_17, win_payout),
+                             _hit_ev(new_total, new_soft, upcard, after, hit_soft_17, win_payout))
+    return ev
+
+
+def action_evs(total: int, soft: bool, upcard: int, shoe: Optional[Sequence[int]] = None,
+               can_surrender: bool = True, rules: Rules = DEFAULT_RULES) -> ActionEVs:
+    """
+    EV of each action for a player on `total` (soft if an Ace counts 11)
+    against `upcard` (2-11, Ace = 11), drawing from `shoe`.
+    """
+    composition = tuple(shoe) if shoe is not None else None
+    h17 = rules.dealer_hits_soft_17
+    return ActionEVs(
+        _hit_ev(total, soft, upcard, composition, h17, rules.win_payout),
+        _stand_ev(total, upcard, composition, h17, rules.win_payout),
+        rules.surrender_refund - 1 if can_surrender and rules.surrender_allowed else None,
+    )
+
+
+class StrategyTable:
+    """
+    EVs for every hard and soft total against every upcard.
+
+    Built once from a shoe, then queried by bots (decide) or a trainer
+    (evs / best_action / rows).
+
+    Only the upcard is taken out of a finite shoe: one chart row stands
+    for many different hands, so the player's own cards are ignored. That
+    makes composition-based charts an approximation; call action_evs with
+    an exact shoe to price a particular hand.
+    """
+
+    HARD_TOTALS = range(4, 22)
+    SOFT_TOTALS = range(12, 22)
+
+    def __init__(self, shoe: Optional[Sequence[int]] = None, rules: Rules = DEFAULT_RULES):
+        self.shoe = tuple(shoe) if shoe is not None else None
+        self.rules = rules
+        self.entries: Dict[Tuple[int, bool, int], ActionEVs] = {}
+        for upcard in range(2, 12):
+            composition = self.shoe
+            if composition is not None:
+                if not composition[upcard - 2]:
+                    continue
+                composition = remove_card(composition, upcard)
+            for total in self.HARD_TOTALS:
+                self.entries[(total, False, upcard)] = action_evs(total, False, upcard, composition, rules=rules)
+            for total in self.SOFT_TOTALS:
+                self.entries[(total, True, upcard)] = action_evs(total, True, upcard, composition, rules=rules)
+
+    def evs(self, total: int, soft: bool, upcard: int) -> ActionEVs:
+        return self.entries[(total, soft, upcard)]
+
+    def best_action(self, total: int, soft: bool, upcard: int, can_surrender: bool = True) -> str:
+        evs = self.evs(total, soft, upcard)
+        if not can_surrender:
+            evs = evs._replace(surrender=None)
+        return evs.best_action
+
+    def decide(self, player, upcard: Card, can_surrender: bool) -> str:
+        """DecisionCallback for RoundEngine.play_round."""
+        return self.best_action(player.hand_value, player.is_soft, upcard.value, can_surrender)
+
+    def rows(self, soft: bool = False) -> List[Tuple[int, List[str]]]:
+        """Chart rows of (total, best action per upcard 2..11)."""
+        totals = self.SOFT_TOTALS if soft else self.HARD_TOTALS
+        return [
+            (total, [self.best_action(total, soft, upcard) if (total, soft, upcard) in self.entries else ''
+                     for upcard in range(2, 12)])
+            for total in totals
+        ]
+
+
+def clear_cache():
+    """Drop memoized EVs."""
+    _stand_ev.cache_clear()
+    _hit_ev.cache_clear()
@@ -0,0 +1,204 @@
+"""
+SQLite storage backend: players, session and round history in one file.
+
+Selected with PYBJACK_STORAGE=sqlite (see storage.BACKEND). The database
+runs in WAL mode, so chip updates are single-row upserts and readers never
+block the writer. Players are keyed by the same _hash_name digest as
+players.json, and chips are indexed for leaderboards. An existing
+players.json (plus journal) and session.json are imported the first time
+the database is opened.
+"""
+import sqlite3
+import threading
+import time
+import json
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from . import storage
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS players (
+    key   TEXT PRIMARY KEY,
+    name  TEXT NOT NULL,
+    chips INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS players_chips ON players (chips DESC);
+CREATE TABLE IF NOT EXISTS rounds (
+    id        INTEGER PRIMARY KEY,
+    key       TEXT NOT NULL,
+    played_at REAL NOT NULL,
+    bet       INTEGER NOT NULL,
+    outcome   TEXT NOT NULL,
+    net       INTEGER NOT NULL,
+    chips     INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS rounds_key ON rounds (key, played_at);
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT
+) WITHOUT ROWID;
+"""
+
+
+def read_snapshot(path: Path) -> Tuple[Dict[str, Dict], Optional[str]]:
+    """
+    Players and last active user from a database that must not change, such
+    as the copy in a save slot. Opened immutable, so nothing is written to it.
+    """
+    try:
+        db = sqlite3.connect(f"{path.resolve().as_uri()}?immutable=1", uri=True)
+        try:
+            rows = db.execute("SELECT key, name, chips FROM players").fetchall()
+            user = db.execute("SELECT value FROM meta WHERE key = 'last_active_user'").fetchone()
+        finally:
+            db.close()
+    except sqlite3.Error as e:
+        raise ValueError(f"cannot read {path.name}: {e}") from e
+    return {key: {"name": name, "chips": chips} for key, name, chips in rows}, user[0] if user else None
+
+
+class SQLiteStore:
+    """Same interface as storage.PlayerStore, backed by a SQLite database."""
+
+    def __init__(self, data_path: Path):
+        self.data_path = data_path
+        self._lock = threading.Lock()
+        # One connection shared by any thread that saves; the lock serializes use
+        self._db = sqlite3.connect(str(data_path), isolation_level=None, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+        self._migrate_json()
+
+    def _meta(self, key: str) -> Optional[str]:
+        row = self._db.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: Optional[str]):
+        self._db.execute("INSERT INTO meta (key, value) VALUES (?, ?) "
+                         "ON CONFLICT (key) DO UPDATE SET value = excluded.value", (key, value))
+
+    def _migrate_json(self):
+        """Import players.json, its journal and session.json once."""
+        if self._meta("migrated_json") is not None:
+            return
+        json_path = self.data_path.with_name(storage.DATA_FILE.name)
+        players = storage.PlayerStore(json_path).load()
+        session_path = self.data_path.with_name(storage.SESSION_FILE.name)
+        last_user = None
+        if session_path.exists():
+            try:
+                with open(session_path, 'r') as f:
+                    last_user = json.load(f).get("last_active_user")
+            except (json.JSONDecodeError, IOError):
+                pass
+
+        with self._lock:
+            self._db.execute("BEGIN")
+            self._db.executemany(
+                "INSERT OR IGNORE INTO players (key, name, chips) VALUES (?, ?, ?)",
+                ((key, entry.get("name", ""), entry.get("chips", 0)) for key, entry in players.items()))
+            if last_user is not None and self._meta("last_active_user") is None:
+                self._set_meta("last_active_user", last_user)
+            self._set_meta("migrated_json", str(len(players)))
+            self._db.execute("COMMIT")
+
+    # --- PlayerStore interface ---
+
+    def refresh(self):
+        pass
+
+    def invalidate(self):
+        pass
+
+    def load(self) -> Dict[str, Dict]:
+        with self._lock:
+            rows = self._db.execute("SELECT key, name, chips FROM players").fetchall()
+        return {key: {"name": name, "chips": chips} for key, name, chips in rows}
+
+    def get(self, name: str) -> Optional[Dict]:
+        with self._lock:
+            row = self._db.execute("SELECT name, chips FROM players WHERE key = ?",
+                                   (storage._hash_name(name),)).fetchone()
+        return {"name": row[0], "chips": row[1]} if row else None
+
+    def put(self, name: str, chips: int) -> bool:
+        return self.put_many([(name, chips)])
+
+    def put_many(self, updates: Iterable[Tuple[str, int]], sync: bool = False) -> bool:
+        """Upsert chip updates in one transaction."""
+        rows = [(storage._hash_name(name), name, max(0, chips))  # Never save negative chips
+                for name, chips in updates]
+        try:
+            with self._lock:
+                self._db.execute("BEGIN")
+                try:
+                    self._db.executemany(
+                        "INSERT INTO players (key, name, chips) VALUES (?, ?, ?) "
+                        "ON CONFLICT (key) DO UPDATE SET name = excluded.name, chips = excluded.chips", rows)
+                    self._db.execute("COMMIT")
+                except sqlite3.Error:
+                    self._db.execute("ROLLBACK")
+                    raise
+            return True
+        except sqlite3.Error:
+            return False
+
+    def replace_all(self, data: Dict[str, Dict]) -> bool:
+        try:
+            with self._lock:
+                self._db.execute("BEGIN")
+                self._db.execute("DELETE FROM players")
+                self._db.executemany(
+                    "INSERT INTO players (key, name, chips) VALUES (?, ?, ?)",
+                    ((key, entry.get("name", ""), entry.get("chips", 0)) for key, entry in data.items()))
+                self._db.execute("COMMIT")
+            return True
+        except sqlite3.Error:
+            return False
+
+    def compact(self) -> bool:
+        """Checkpoint the WAL into the main file, so copying the .db alone is a full copy."""
+        try:
+            with self._lock:
+                self._db.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            return True
+        except sqlite3.Error:
+            return False
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    # --- SQLite only ---
+
+    def save_session(self, username: str):
+        with self._lock:
+            self._set_meta("last_active_user", username)
+
+    def load_session(self) -> Optional[str]:
+        with self._lock:
+            return self._meta("last_active_user")
+
+    def record_round(self, name: str, bet: int, outcome: str, net: int, chips: int) -> bool:
+        try:
+            with self._lock:
+                self._db.execute(
+                    "INSERT INTO rounds (key, played_at, bet, outcome, net, chips) VALUES (?, ?, ?, ?, ?, ?)",
+                    (storage._hash_name(name), time.time(), bet, outcome, net, chips))
+            return True
+        except sqlite3.Error:
+            return False
+
+    def history(self, name: str, limit: int = 100) -> List[Tuple[float, int, str, int, int]]:
+        """Latest rounds for a player as (played_at, bet, outcome, net, chips), newest first."""
+        with self._lock:
+            return self._db.execute(
+                "SELECT played_at, bet, outcome, net, chips FROM rounds WHERE key = ? "
+                "ORDER BY played_at DESC, id DESC LIMIT ?", (storage._hash_name(name), limit)).fetchall()
+
+    def leaderboard(self, limit: int = 10) -> List[Tuple[str, int]]:
+        with self._lock:
+            return self._db.execute(
+                "SELECT name, chips FROM players ORDER BY chips DESC LIMIT ?", (limit,)).fetchall()
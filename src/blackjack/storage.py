@@ -1,10 +1,19 @@
+import atexit
 import json
 import os
 import shutil
+import struct
+import tarfile
 import hashlib
+import threading
+import time
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Dict, List
+from functools import lru_cache
+from typing import Optional, Dict, Iterable, List, NamedTuple, Tuple
+
+from .archive import archive_suffix, extract_slot, read_archive_index, write_archive
+from .objectstore import HashCache, ObjectStore, read_manifest, snapshot_dir, stage_slot
 
 # Store data in user's home directory
 DATA_DIR = Path.home() / ".terminal_blackjack"
@@ -12,6 +21,19 @@ DATA_FILE = DATA_DIR / "players.json"
 SESSION_FILE = DATA_DIR / "session.json"
 BACKUP_ROOT = DATA_DIR / "saves"
 
+# Chip updates are appended here and folded into players.json on compaction,
+# once the journal outgrows both COMPACT_BYTES and a quarter of the snapshot,
+# so replaying it on load never costs much more than parsing the snapshot
+JOURNAL_NAME = "players.journal"
+COMPACT_BYTES = 4 * 1024
+COMPACT_RATIO = 4
+
+# "json" (players.json + journal), "sqlite" (one database, see sqlite_store)
+# or "binary" (memory-mapped fixed-width records, see binary_store)
+BACKEND = os.environ.get("PYBJACK_STORAGE", "json").strip().lower()
+DB_NAME = "blackjack.db"
+BIN_NAME = "players.bin"
+
 
 def _get_data_path() -> Path:
     """Ensure data directory exists and return path to data file."""
@@ -22,13 +44,44 @@ def get_data_dir() -> Path:
     """Return the main data directory path."""
     return DATA_DIR
 
+@lru_cache(maxsize=1024)
 def _hash_name(name: str) -> str:
     """Create a hash of the player name for storage key."""
     return hashlib.sha256(name.lower().strip().encode()).hexdigest()[:16]
 
-def _load_all_data() -> Dict:
-    """Load all player data from file."""
-    path = _get_data_path()
+def _get_journal_path() -> Path:
+    """Journal file next to the data file."""
+    return _get_data_path().with_name(JOURNAL_NAME)
+
+def _file_sig(path: Path) -> Optional[tuple]:
+    """(inode, size, mtime) of a file, None if it is missing."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+def _apply_records(data: Dict, lines: List[bytes]):
+    """Apply journal lines on top of player data, in order."""
+    for line in lines:
+        try:
+            record = json.loads(line)
+        except ValueError:
+            # A torn write from a crash, possibly with a whole record appended after it
+            start = line.rfind(b'{"key"')
+            if start <= 0:
+                continue
+            try:
+                record = json.loads(line[start:])
+            except ValueError:
+                continue
+        try:
+            data[record["key"]] = {"name": record["name"], "chips": record["chips"]}
+        except (KeyError, TypeError):
+            continue
+
+def _load_snapshot(path: Path) -> Dict:
+    """Load the players.json snapshot alone, without the journal."""
     if not path.exists():
         return {}
     try:
@@ -37,57 +90,457 @@ def _load_all_data() -> Dict:
     except (json.JSONDecodeError, IOError):
         return {}
 
-def _save_all_data(data: Dict) -> bool:
-    """Save all player data to file."""
+
+class PlayerStore:
+    """
+    Player data held in memory: the players.json snapshot plus the journal.
+
+    Every access stats both files. Nothing is re-read while they are
+    unchanged, and only the new tail is replayed when the journal has
+    grown (another process saving), so lookups and saves are O(1). A
+    rewritten snapshot or a truncated/replaced journal triggers a full
+    reload.
+    """
+
+    def __init__(self, data_path: Path):
+        self.data_path = data_path
+        self.journal_path = data_path.with_name(JOURNAL_NAME)
+        self.players: Dict[str, Dict] = {}
+        self._loaded = False
+        self._snapshot_sig: Optional[tuple] = None
+        self._journal_sig: Optional[tuple] = None
+        self._journal_offset = 0  # bytes of the journal already applied
+
+    def invalidate(self):
+        """Force a full reload on next access."""
+        self._loaded = False
+
+    def _journal_grew(self, sig: Optional[tuple]) -> bool:
+        old = self._journal_sig
+        if sig == old:
+            return True
+        if sig is None:
+            return False
+        if old is None:
+            return self._journal_offset == 0
+        return sig[0] == old[0] and sig[1] >= self._journal_offset
+
+    def _read_journal_tail(self):
+        try:
+            with open(self.journal_path, 'rb') as f:
+                sig = os.fstat(f.fileno())
+                f.seek(self._journal_offset)
+                chunk = f.read()
+        except IOError:
+            self._journal_sig = None
+            return
+        # Only whole lines; a partial last line is picked up once it is finished
+        end = chunk.rfind(b"\n") + 1
+        _apply_records(self.players, chunk[:end].splitlines())
+        self._journal_offset += end
+        self._journal_sig = (sig.st_ino, sig.st_size, sig.st_mtime_ns)
+
+    def refresh(self):
+        snapshot = _file_sig(self.data_path)
+        journal = _file_sig(self.journal_path)
+        if not self._loaded or snapshot != self._snapshot_sig or not self._journal_grew(journal):
+            self.players = _load_snapshot(self.data_path)
+            self._snapshot_sig = snapshot
+            self._journal_sig = None
+            self._journal_offset = 0
+            self._loaded = True
+            if journal is not None:
+                self._read_journal_tail()
+        elif journal != self._journal_sig:
+            self._read_journal_tail()
+
+    def load(self) -> Dict[str, Dict]:
+        self.refresh()
+        return self.players
+
+    def get(self, name: str) -> Optional[Dict]:
+        self.refresh()
+        return self.players.get(_hash_name(name))
+
+    def put(self, name: str, chips: int) -> bool:
+        """Journal a chip update and apply it in memory."""
+        return self.put_many([(name, chips)])
+
+    def put_many(self, updates: Iterable[Tuple[str, int]], sync: bool = False) -> bool:
+        """Journal several chip updates in one write (fsynced if sync) and apply them."""
+        self.refresh()
+        entries = {}
+        for name, chips in updates:
+            entries[_hash_name(name)] = {"name": name, "chips": max(0, chips)}  # Never save negative chips
+        if not entries:
+            return True
+        lines = b"".join(json.dumps({"key": key, **entry}).encode() + b"\n" for key, entry in entries.items())
+        try:
+            with open(self.journal_path, 'ab') as f:
+                contiguous = os.fstat(f.fileno()).st_size == self._journal_offset
+                f.write(lines)
+                f.flush()
+                if sync:
+                    os.fsync(f.fileno())
+                sig = os.fstat(f.fileno())
+        except IOError:
+            return False
+
+        self.players.update(entries)
+        if contiguous:
+            # Our own append; no need to read it back
+            self._journal_offset = sig.st_size
+            self._journal_sig = (sig.st_ino, sig.st_size, sig.st_mtime_ns)
+
+        size = sig.st_size
+        if size >= COMPACT_BYTES and size * COMPACT_RATIO >= (self._snapshot_sig or (0, 0))[1]:
+            self.compact()
+        return True
+
+    def replace_all(self, data: Dict[str, Dict]) -> bool:
+        """Make data the whole player set: a new snapshot and an empty journal."""
+        if not _write_snapshot(self.data_path, data):
+            return False
+        # Without this the old journal would replay over the new snapshot
+        journal = _file_sig(self.journal_path)
+        if journal is not None and journal[1]:
+            try:
+                open(self.journal_path, 'w').close()
+            except IOError:
+                return False
+        self.invalidate()
+        return True
+
+    def compact(self) -> bool:
+        """Fold the journal into players.json and empty it."""
+        self.refresh()
+        if self._journal_sig is None or not self._journal_sig[1]:
+            return True
+        if not _write_snapshot(self.data_path, self.players):
+            return False
+        # Records hold absolute chip counts, so a crash before this truncate
+        # just replays updates the snapshot already has
+        try:
+            open(self.journal_path, 'w').close()
+        except IOError:
+            return False
+        self._snapshot_sig = _file_sig(self.data_path)
+        self._journal_sig = _file_sig(self.journal_path)
+        self._journal_offset = 0
+        return True
+
+
+_STORE: Optional[PlayerStore] = None
+# (BACKEND, DATA_FILE) the store was opened for; a match skips the path checks below
+_STORE_FOR: Optional[tuple] = None
+# Held by whichever thread is using the store (the UI or the write-behind thread)
+_STORE_LOCK = threading.RLock()
+
+def _using_sqlite() -> bool:
+    return BACKEND == "sqlite"
+
+def _using_binary() -> bool:
+    return BACKEND == "binary"
+
+def get_player_store() -> PlayerStore:
+    """The shared store for the current data file and backend."""
+    global _STORE, _STORE_FOR
+    if _STORE is not None and _STORE_FOR == (BACKEND, DATA_FILE):
+        return _STORE
     path = _get_data_path()
+    if _using_sqlite():
+        from .sqlite_store import SQLiteStore
+        path = path.with_name(DB_NAME)
+        if not isinstance(_STORE, SQLiteStore) or _STORE.data_path != path:
+            _close_store()
+            _STORE = SQLiteStore(path)
+    elif _using_binary():
+        from .binary_store import BinaryStore
+        path = path.with_name(BIN_NAME)
+        if not isinstance(_STORE, BinaryStore) or _STORE.data_path != path:
+            _close_store()
+            _STORE = BinaryStore(path)
+    elif type(_STORE) is not PlayerStore or _STORE.data_path != path:
+        _close_store()
+        _STORE = PlayerStore(path)
+    _STORE_FOR = (BACKEND, DATA_FILE)
+    return _STORE
+
+def _invalidate_store():
+    if _STORE is not None:
+        _STORE.invalidate()
+
+def _close_store():
+    """Drop the shared store, closing its database if it has one."""
+    global _STORE
+    if _STORE is not None and hasattr(_STORE, "close"):
+        _STORE.close()
+    _STORE = None
+
+def _player_files() -> List[Path]:
+    """Every file holding player or session data, for either backend."""
+    db = DATA_FILE.with_name(DB_NAME)
+    return [DATA_FILE, DATA_FILE.with_name(JOURNAL_NAME), SESSION_FILE, DATA_FILE.with_name(BIN_NAME),
+            db, db.with_name(DB_NAME + "-wal"), db.with_name(DB_NAME + "-shm")]
+
+def _atomic_write(path: Path, text: str):
+    """Write via a temp file, fsync and rename, so readers see the old file or the new one."""
+    tmp = path.with_name(f".{path.name}.tmp")
     try:
-        with open(path, 'w') as f:
-            json.dump(data, f, indent=2)
+        with open(tmp, 'w') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+def _write_snapshot(path: Path, data: Dict) -> bool:
+    try:
+        _atomic_write(path, json.dumps(data, indent=2))
         return True
     except IOError:
         return False
 
+def _load_all_data() -> Dict:
+    """Load all player data: the snapshot plus any journaled updates."""
+    flush()
+    with _STORE_LOCK:
+        return dict(get_player_store().load())
+
+def _save_all_data(data: Dict) -> bool:
+    """Save all player data to file."""
+    flush()
+    with _STORE_LOCK:
+        return get_player_store().replace_all(data)
+
+def compact() -> bool:
+    """Fold the journal into players.json and empty it."""
+    with _STORE_LOCK:
+        return get_player_store().compact()
+
 def load_player(name: str) -> Optional[int]:
     """
     Load player chips by name.
     Returns None if player doesn't exist, otherwise returns chip count.
     """
-    data = _load_all_data()
-    key = _hash_name(name)
-    
-    if key in data:
-        return data[key].get("chips", None)
+    if _WRITER is not None:
+        chips = _WRITER.pending_chips(name)
+        if chips is not None:
+            return chips
+    with _STORE_LOCK:
+        entry = get_player_store().get(name)
+    if entry is not None:
+        return entry.get("chips", None)
     return None
 
 def save_player(name: str, chips: int) -> bool:
-    """Save player chips."""
-    data = _load_all_data()
-    key = _hash_name(name)
-    
-    data[key] = {
-        "name": name,
-        "chips": max(0, chips)  # Never save negative chips
-    }
-    
-    return _save_all_data(data)
+    """
+    Save player chips.
+    Appends one record to the journal; the full file is only rewritten
+    on compaction, so the cost per save does not grow with the player count.
+    With write-behind running this only queues the update and returns.
+    """
+    if _WRITER is not None:
+        _WRITER.save_player(name, chips)
+        return True
+    with _STORE_LOCK:
+        return get_player_store().put(name, chips)
 
 def is_new_player(name: str) -> bool:
     """Check if player is new (no saved data)."""
     return load_player(name) is None
 
+def record_round(name: str, bet: int, outcome: str, net: int, chips: int) -> bool:
+    """Add a round to the player's history (SQLite backend only; a no-op for JSON)."""
+    if not _using_sqlite():
+        return False
+    if _WRITER is not None:
+        _WRITER.record_round(name, bet, outcome, net, chips)
+        return True
+    with _STORE_LOCK:
+        return get_player_store().record_round(name, bet, outcome, net, chips)
+
+def leaderboard(limit: int = 10) -> List[tuple]:
+    """Top players as (name, chips), richest first."""
+    flush()
+    with _STORE_LOCK:
+        if _using_sqlite():
+            return get_player_store().leaderboard(limit)
+        players = list(get_player_store().load().values())
+    ranked = sorted(players, key=lambda entry: entry.get("chips", 0), reverse=True)
+    return [(entry.get("name", ""), entry.get("chips", 0)) for entry in ranked[:limit]]
+
+# --- Write-behind ---
+
+class WriteBehind:
+    """
+    Background thread that commits chip updates off the UI thread.
+
+    Updates arriving within `delay` seconds of each other (a run of trivia
+    answers, say) are coalesced, keeping only the latest chips per player,
+    and committed together: one fsynced journal append or one SQLite
+    transaction. Queued values are visible to load_player straight away.
+    A failed commit is retried; once stopping, only STOP_ATTEMPTS more times.
+    """
+
+    STOP_ATTEMPTS = 3
+
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+        self.commits = 0
+        self.failures = 0
+        self.last_error: Optional[BaseException] = None
+        # Updates dropped because they still failed to commit at shutdown
+        self.abandoned: Dict[str, Tuple[str, int]] = {}
+        self._cond = threading.Condition()
+        self._pending: Dict[str, Tuple[str, int]] = {}
+        self._inflight: Dict[str, Tuple[str, int]] = {}
+        self._rounds: List[tuple] = []
+        self._busy = False
+        self._hurry = False
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name="pybjack-writer", daemon=True)
+        self._thread.start()
+
+    def save_player(self, name: str, chips: int):
+        with self._cond:
+            self._pending[_hash_name(name)] = (name, chips)
+            self._cond.notify_all()
+
+    def record_round(self, *row):
+        with self._cond:
+            self._rounds.append(row)
+            self._cond.notify_all()
+
+    def pending_chips(self, name: str) -> Optional[int]:
+        key = _hash_name(name)
+        with self._cond:
+            item = self._pending.get(key) or self._inflight.get(key)
+        return max(0, item[1]) if item is not None else None
+
+    def _idle(self) -> bool:
+        return not self._pending and not self._rounds and not self._busy
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Commit everything queued now. False on timeout or a failed commit."""
+        with self._cond:
+            failures = self.failures
+            self._hurry = True
+            self._cond.notify_all()
+            self._cond.wait_for(lambda: self._idle() or self.failures != failures, timeout)
+            return self._idle() and self.failures == failures
+
+    def stop(self, timeout: Optional[float] = None) -> bool:
+        """Flush and end the thread. False if anything was left uncommitted or it is still running."""
+        flushed = self.flush(timeout)
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+        return flushed and not self.abandoned and not self._thread.is_alive()
+
+    def _run(self):
+        attempts_left = self.STOP_ATTEMPTS
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending or self._rounds or self._stopping)
+                if self._stopping and not (self._pending or self._rounds):
+                    return
+                # Coalescing window, cut short by flush() or stop()
+                self._cond.wait_for(lambda: self._hurry or self._stopping, self.delay)
+                batch, self._pending = self._pending, {}
+                rounds, self._rounds = self._rounds, []
+                self._inflight = batch
+                self._busy = True
+                self._hurry = False
+
+            try:
+                ok = _commit(batch.values(), rounds)
+                error = None
+            except Exception as e:
+                ok, error = False, e
+
+            with self._cond:
+                self._inflight = {}
+                self._busy = False
+                if ok:
+                    self.commits += 1
+                else:
+                    # Retry later, unless a newer value has been queued meanwhile
+                    for key, item in batch.items():
+                        self._pending.setdefault(key, item)
+                    self._rounds[:0] = rounds
+                    self.failures += 1
+                    self.last_error = error
+                    if self._stopping:
+                        attempts_left -= 1
+                        if attempts_left <= 0:
+                            # Give up rather than hold the game open on a failing disk
+                            self.abandoned, self._pending, self._rounds = self._pending, {}, []
+                            self._cond.notify_all()
+                            return
+                self._cond.notify_all()
+            if not ok:
+                time.sleep(max(self.delay, 0.05))
+
+
+def _commit(updates: Iterable[Tuple[str, int]], rounds: List[tuple]) -> bool:
+    with _STORE_LOCK:
+        store = get_player_store()
+        ok = store.put_many(updates, sync=True)
+        if ok and rounds and _using_sqlite():
+            ok = all(store.record_round(*row) for row in rounds)
+        return ok
+
+
+_WRITER: Optional[WriteBehind] = None
+
+def start_write_behind(delay: float = 0.05) -> WriteBehind:
+    """Move save_player (and round history) onto a background writer."""
+    global _WRITER
+    if _WRITER is None:
+        _WRITER = WriteBehind(delay)
+        atexit.register(stop_write_behind)
+    return _WRITER
+
+def stop_write_behind(timeout: Optional[float] = None) -> bool:
+    """Flush and stop the background writer; saves are synchronous again."""
+    global _WRITER
+    writer, _WRITER = _WRITER, None
+    if writer is None:
+        return True
+    return writer.stop(timeout)
+
+def flush(timeout: Optional[float] = None) -> bool:
+    """Wait until every queued save is on disk (no-op without write-behind)."""
+    if _WRITER is None:
+        return True
+    return _WRITER.flush(timeout)
+
 # --- Session Management ---
 
 def save_session(username: str):
     """Save the last active user session."""
+    if _using_sqlite():
+        with _STORE_LOCK:
+            get_player_store().save_session(username)
+        return
     try:
         DATA_DIR.mkdir(exist_ok=True)
-        with open(SESSION_FILE, 'w') as f:
-            json.dump({"last_active_user": username}, f)
+        _atomic_write(SESSION_FILE, json.dumps({"last_active_user": username}))
     except IOError:
         pass
 
 def load_session() -> Optional[str]:
     """Load the last active user."""
+    if _using_sqlite():
+        with _STORE_LOCK:
+            return get_player_store().load_session()
     if not SESSION_FILE.exists():
         return None
     try:
@@ -101,18 +554,162 @@ def load_session() -> Optional[str]:
 
 CURRENT_SAVE_SLOT: Optional[Path] = None
 
+# One line per slot (player, chips, time, size) so listing saves needs no per-slot I/O
+INDEX_NAME = "saves.index.json"
+ARCHIVE_PREFIX = "archive-"
+
+# The SQLite WAL is checkpointed into the .db before a save, so its side files are skipped,
+# as are -profile reports and -trace output, which are diagnostics rather than game state
+_BACKUP_IGNORE_PATTERNS = ("saves", INDEX_NAME, DB_NAME + "-wal", DB_NAME + "-shm", ".*.tmp",
+                           "profiles", "trace.json")
+
+
+class BackupInfo(NamedTuple):
+    """A save slot as recorded in the index."""
+    path: Path
+    player: str
+    chips: Optional[int]
+    timestamp: float  # last save, seconds since the epoch
+    size: int         # bytes of game data in the slot
+    archive: Optional[str] = None  # archive file holding the slot, None for a folder
+
+
+def get_object_store() -> ObjectStore:
+    """Deduplicated file contents shared by all save slots."""
+    return ObjectStore(BACKUP_ROOT / "objects")
+
+def _snapshot_to_slot(target_dir: Path) -> Dict[str, Dict]:
+    """Mirror DATA_DIR into a slot through the object store (see objectstore)."""
+    objects = get_object_store()
+    return snapshot_dir(DATA_DIR, target_dir, objects, HashCache(objects.root / ".hashcache.json"),
+                        ignore=_BACKUP_IGNORE_PATTERNS)
+
+def _index_path() -> Path:
+    return BACKUP_ROOT.with_name(INDEX_NAME)
+
+def _root_mtime() -> Optional[int]:
+    try:
+        return os.stat(BACKUP_ROOT).st_mtime_ns
+    except OSError:
+        return None
+
+def _read_slot_players(slot: Path) -> Tuple[Dict[str, Dict], Optional[str]]:
+    """
+    Players and last active user saved in a slot, read from whichever
+    backend's file it holds (the current backend's first). Nothing is written.
+    """
+    files = {"json": DATA_FILE.name, "sqlite": DB_NAME, "binary": BIN_NAME}
+    order = [BACKEND] + [backend for backend in files if backend != BACKEND]
+    backend = next((b for b in order if b in files and (slot / files[b]).exists()), None)
+
+    if backend == "sqlite":
+        from .sqlite_store import read_snapshot
+        return read_snapshot(slot / DB_NAME)
+
+    last_user = None
+    try:
+        with open(slot / SESSION_FILE.name, 'r') as f:
+            last_user = json.load(f).get("last_active_user")
+    except (IOError, ValueError, AttributeError):
+        pass
+    if backend == "binary":
+        from .binary_store import read_table
+        return read_table(slot / BIN_NAME), last_user
+    if backend == "json":
+        return PlayerStore(slot / DATA_FILE.name).load(), last_user
+    return {}, last_user
+
+def _read_slot_info(slot: Path) -> Dict:
+    """Index entry for a slot, read from the slot itself (the slow path)."""
+    manifest = read_manifest(slot)
+    if manifest:
+        size = sum(entry["size"] for entry in manifest.values())
+    else:
+        size = sum(f.stat().st_size for f in slot.rglob("*") if f.is_file())
+
+    # The slot's last active user owns it; failing that, backups usually
+    # isolate single users, so the first player is the owner
+    player, chips = None, None
+    try:
+        players, last_user = _read_slot_players(slot)
+        entry = players.get(_hash_name(last_user)) if last_user else None
+        if entry is None and players:
+            entry = next(iter(players.values()))
+        if entry is not None:
+            player, chips = entry.get("name"), entry.get("chips")
+    except (IOError, ValueError, AttributeError, struct.error):
+        pass
+    if player is None:
+        # Folder name: save-USERNAME-YYYY-MM-DD-HH-MM-SS
+        parts = slot.name.split('-')
+        player = parts[1] if len(parts) >= 8 else "Unknown"
+    return {"player": player, "chips": chips, "timestamp": slot.stat().st_mtime, "size": size}
+
+def _write_index(slots: Dict[str, Dict]):
+    index = {"version": 1, "root_mtime_ns": _root_mtime(), "slots": slots}
+    try:
+        _atomic_write(_index_path(), json.dumps(index, indent=1))
+    except IOError:
+        pass
+
+def _load_index(root_mtime: Optional[int] = None) -> Dict[str, Dict]:
+    """
+    Slot entries by folder name, rebuilt if the saves folder changed behind
+    the index's back (its mtime differs from root_mtime, default: now).
+    """
+    if root_mtime is None:
+        root_mtime = _root_mtime()
+    if root_mtime is None:
+        return {}
+    try:
+        with open(_index_path(), 'r') as f:
+            index = json.load(f)
+        if index.get("root_mtime_ns") == root_mtime:
+            return index["slots"]
+    except (IOError, ValueError, KeyError):
+        pass
+    return rebuild_backup_index()
+
+def rebuild_backup_index() -> Dict[str, Dict]:
+    """Scan every save-* folder and archive-* file and rewrite the index."""
+    slots = {}
+    if BACKUP_ROOT.exists():
+        for item in sorted(BACKUP_ROOT.iterdir()):
+            try:
+                if item.is_dir() and item.name.startswith("save-"):
+                    slots[item.name] = _read_slot_info(item)
+                elif item.is_file() and item.name.startswith(ARCHIVE_PREFIX):
+                    for name, info in read_archive_index(item).items():
+                        info.pop("files", None)
+                        # A slot restored into a folder again wins over its archived copy
+                        slots.setdefault(name, dict(info, archive=item.name))
+            except (OSError, ValueError, tarfile.TarError):
+                continue
+    _write_index(slots)
+    return slots
+
+def _index_slot(slot: Path, files: Dict[str, Dict], root_mtime: Optional[int]):
+    """Record a just-saved slot in the index; root_mtime is the saves folder's mtime before the save."""
+    slots = _load_index(root_mtime)
+    player = load_session() or "Unknown"
+    slots[slot.name] = {
+        "player": player,
+        "chips": load_player(player),
+        "timestamp": time.time(),
+        "size": sum(entry["size"] for entry in files.values()),
+    }
+    _write_index(slots)
+
+def get_backup_entries() -> List[BackupInfo]:
+    """Every save slot from the index, newest first."""
+    entries = [BackupInfo(BACKUP_ROOT / name, info["player"], info["chips"], info["timestamp"], info["size"],
+                          info.get("archive"))
+               for name, info in _load_index().items()]
+    return sorted(entries, key=lambda entry: entry.timestamp, reverse=True)
+
 def get_available_backups() -> List[Path]:
     """Returns a list of all valid save-* directories, sorted by newest first."""
-    if not BACKUP_ROOT.exists():
-        return []
-    
-    saves = []
-    for item in BACKUP_ROOT.iterdir():
-        if item.is_dir() and item.name.startswith("save-"):
-            saves.append(item)
-    
-    # Sort by modification time, newest first
-    return sorted(saves, key=lambda p: p.stat().st_mtime, reverse=True)
+    return [entry.path for entry in get_backup_entries()]
 
 def find_latest_backup() -> Optional[Path]:
     """Finds the most recently modified save-* directory."""
@@ -146,60 +743,126 @@ def save_current_game() -> bool:
             os.chdir(Path.home())
 
         BACKUP_ROOT.mkdir(parents=True, exist_ok=True)
+        root_mtime = _root_mtime()
+        # Save slots hold a plain players.json snapshot (or a checkpointed database)
+        compact()
         
         target_dir = CURRENT_SAVE_SLOT
         
         if target_dir and target_dir.exists():
-            # Update existing save
-            # We use copytree with dirs_exist_ok=True to overwrite
-            # CRITICAL: Ignore 'saves' directory to prevent recursive copying of backup folder into itself
-            shutil.copytree(DATA_DIR, target_dir, dirs_exist_ok=True, ignore=shutil.ignore_patterns("saves"))
+            # Update existing save: only changed files are stored and relinked
+            # CRITICAL: 'saves' is ignored to prevent recursive copying of backup folder into itself
+            files = _snapshot_to_slot(target_dir)
             # Touch the directory to update modification time
-            target_dir.touch()
+            os.utime(target_dir)
         else:
             # Create new save
             current_user = load_session()
             target_dir = get_next_backup_path(current_user if current_user else "unknown")
-            # CRITICAL: Ignore 'saves' directory
-            shutil.copytree(DATA_DIR, target_dir, dirs_exist_ok=True, ignore=shutil.ignore_patterns("saves"))
+            files = _snapshot_to_slot(target_dir)
             CURRENT_SAVE_SLOT = target_dir
-            
-        return True
+
+        _index_slot(target_dir, files, root_mtime)
     except Exception:
         return False
 
+    try:
+        apply_retention(DEFAULT_RETENTION)
+    except Exception:
+        # The save itself succeeded; old slots are pruned on a later save
+        pass
+    return True
+
 def backup_data() -> bool:
     """Legacy backup function - redirects to save_current_game."""
     return save_current_game()
 
+# Restore swaps these in whole; other folders in a slot are restored file by file
+_RESTORED_DIRS = ("questions",)
+
+
+def _restore_units(staged: Path) -> List[str]:
+    """Relative paths restore replaces: player files, whole _RESTORED_DIRS, and every other staged file."""
+    units = {path.name for path in _player_files()} | set(_RESTORED_DIRS)
+    for dirpath, dirnames, filenames in os.walk(staged):
+        rel_dir = Path(dirpath).relative_to(staged)
+        dirnames[:] = [d for d in dirnames if (rel_dir / d).as_posix() not in units]
+        units.update((rel_dir / name).as_posix() for name in filenames)
+    return sorted(units)
+
+def _swap_in(staged: Path, retired: Path):
+    """
+    Move each restore unit from staged into DATA_DIR with renames, parking
+    what it replaces under retired. On failure every rename is undone.
+    """
+    moved = []  # (from, to) per rename, for rollback
+    try:
+        for rel in _restore_units(staged):
+            current, new, old = DATA_DIR / rel, staged / rel, retired / rel
+            if os.path.lexists(current):
+                old.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(current, old)
+                moved.append((current, old))
+            if new.exists():
+                current.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(new, current)
+                moved.append((new, current))
+    except OSError:
+        for src, dest in reversed(moved):
+            os.replace(dest, src)
+        # Everything is back in place; retired only holds empty folders now
+        shutil.rmtree(retired, ignore_errors=True)
+        raise
+
 def restore_data(source_dir: Optional[Path] = None) -> bool:
-    """Restores data from a backup source to DATA_DIR."""
+    """
+    Restores data from a backup source to DATA_DIR.
+    The slot is staged next to the live files and swapped in with renames,
+    so a failed restore leaves the current data as it was.
+    """
     global CURRENT_SAVE_SLOT
     
     if source_dir is None:
         source_dir = find_latest_backup()
         
-    if source_dir is None or not source_dir.exists():
+    if source_dir is None:
         return False
-    
+
+    archive = None
+    if not source_dir.exists():
+        archive = _load_index().get(source_dir.name, {}).get("archive")
+        if archive is None:
+            return False
+
+    # CRITICAL: Do NOT delete DATA_DIR if BACKUP_ROOT is inside it!
+    # Only the game files are swapped; saves/ and anything else stay put.
+    staged = DATA_DIR / ".restore.tmp"
+    retired = DATA_DIR / ".restore-old.tmp"
     try:
-        # CRITICAL: Do NOT delete DATA_DIR if BACKUP_ROOT is inside it!
-        # Instead, clean up specific game files before restoring.
-        if DATA_FILE.exists():
-            os.remove(DATA_FILE)
-        if SESSION_FILE.exists():
-            os.remove(SESSION_FILE)
-            
-        questions_dir = DATA_DIR / "questions"
-        if questions_dir.exists():
-            shutil.rmtree(questions_dir)
-            
-        # Restore data
-        shutil.copytree(source_dir, DATA_DIR, dirs_exist_ok=True, ignore=shutil.ignore_patterns("saves"))
-        CURRENT_SAVE_SLOT = source_dir
+        flush()
+        _close_store()
+        for leftover in (staged, retired):
+            if leftover.exists():
+                shutil.rmtree(leftover)
+        staged.mkdir(parents=True)
+
+        if archive is not None:
+            extract_slot(BACKUP_ROOT / archive, source_dir.name, staged)
+        else:
+            # Unchanged live files are hardlinked into the stage, so only changed bytes are copied
+            objects = get_object_store()
+            stage_slot(source_dir, staged, DATA_DIR, HashCache(objects.root / ".hashcache.json"),
+                       ignore=("saves",))
+
+        _swap_in(staged, retired)
+        shutil.rmtree(retired, ignore_errors=True)
+        # Archived slots are read-only; the next save starts a new slot
+        CURRENT_SAVE_SLOT = None if archive is not None else source_dir
         return True
     except Exception:
         return False
+    finally:
+        shutil.rmtree(staged, ignore_errors=True)
 
 def reset_data(keep_saves: bool = False) -> bool:
     """
@@ -208,6 +871,8 @@ def reset_data(keep_saves: bool = False) -> bool:
     """
     global CURRENT_SAVE_SLOT
     CURRENT_SAVE_SLOT = None
+    flush()
+    _close_store()
     
     if not DATA_DIR.exists():
         return True
@@ -215,10 +880,9 @@ def reset_data(keep_saves: bool = False) -> bool:
     try:
         if keep_saves:
             # Delete specific files/dirs but keep saves
-            if DATA_FILE.exists():
-                os.remove(DATA_FILE)
-            if SESSION_FILE.exists():
-                os.remove(SESSION_FILE)
+            for path in _player_files():
+                if path.exists():
+                    os.remove(path)
             
             questions_dir = DATA_DIR / "questions"
             if questions_dir.exists():
@@ -231,3 +895,161 @@ def reset_data(keep_saves: bool = False) -> bool:
         return True
     except Exception:
         return False
+
+
+# --- Retention ---
+
+class RetentionPolicy(NamedTuple):
+    """How many save slots to keep, and in what form."""
+    keep_last: int = 20               # newest slots kept as folders
+    keep_days: Optional[int] = 30     # older slots: one per day for this many days, archived
+    max_bytes: Optional[int] = None   # cap on everything under saves/, oldest dropped first
+    archive_batch: int = 5            # pack only once this many slots are due, to avoid tiny archives
+    compression: str = "xz"
+
+
+DEFAULT_RETENTION = RetentionPolicy()
+
+
+class RetentionPlan(NamedTuple):
+    archive: List[BackupInfo]    # folders to pack into a new archive
+    delete: List[BackupInfo]     # folders to remove outright
+    drop_archives: List[str]     # archive files whose slots have all expired
+
+
+def plan_retention(entries: List[BackupInfo], policy: RetentionPolicy = DEFAULT_RETENTION,
+                   now: Optional[float] = None, protected: Iterable[Path] = ()) -> RetentionPlan:
+    """Decide what apply_retention does with each slot; entries are newest first."""
+    if now is None:
+        now = time.time()
+    cutoff = now - policy.keep_days * 86400 if policy.keep_days is not None else None
+    protected = set(protected)
+
+    folders = [entry for entry in entries if entry.archive is None]
+    kept = {entry.path for entry in folders[:max(policy.keep_last, 0)]} | protected
+    older = [entry for entry in entries if entry.path not in kept]
+
+    def player_day(entry: BackupInfo) -> tuple:
+        return entry.player, datetime.fromtimestamp(entry.timestamp).date()
+
+    # One slot per player per day: a day that still has one of that player's
+    # folders needs nothing archived, and another player's slots never count
+    seen_days = {player_day(entry) for entry in entries if entry.path in kept}
+    archive, delete = [], []
+    for entry in older:
+        day = player_day(entry)
+        fresh = cutoff is None or entry.timestamp >= cutoff
+        if entry.archive is None:
+            if fresh and day not in seen_days:
+                archive.append(entry)
+            else:
+                delete.append(entry)
+        seen_days.add(day)
+
+    if len(archive) < policy.archive_batch:
+        archive = []
+
+    drop_archives = []
+    if cutoff is not None:
+        by_archive: Dict[str, List[float]] = {}
+        for entry in entries:
+            if entry.archive is not None:
+                by_archive.setdefault(entry.archive, []).append(entry.timestamp)
+        drop_archives = sorted(name for name, stamps in by_archive.items() if max(stamps) < cutoff)
+    return RetentionPlan(archive, delete, drop_archives)
+
+
+def _saves_usage() -> int:
+    """Bytes under BACKUP_ROOT, counting hardlinked files once."""
+    seen, total = set(), 0
+    for dirpath, _, filenames in os.walk(BACKUP_ROOT):
+        for name in filenames:
+            try:
+                st = os.lstat(os.path.join(dirpath, name))
+            except OSError:
+                continue
+            if (st.st_dev, st.st_ino) not in seen:
+                seen.add((st.st_dev, st.st_ino))
+                total += st.st_size
+    return total
+
+
+def _next_archive_path(compression: str) -> Path:
+    stamp = datetime.now().strftime("%Y-%m-%d-%H-%M-%S")
+    path = BACKUP_ROOT / f"{ARCHIVE_PREFIX}{stamp}{archive_suffix(compression)}"
+    n = 1
+    while path.exists():
+        path = BACKUP_ROOT / f"{ARCHIVE_PREFIX}{stamp}-{n}{archive_suffix(compression)}"
+        n += 1
+    return path
+
+
+def _gc_objects() -> int:
+    """Remove objects no slot folder links to any more."""
+    keep = set()
+    for item in BACKUP_ROOT.iterdir():
+        if item.is_dir() and item.name.startswith("save-"):
+            keep.update(entry["digest"] for entry in read_manifest(item).values())
+    return get_object_store().gc(keep)
+
+
+def apply_retention(policy: RetentionPolicy = DEFAULT_RETENTION) -> Dict[str, int]:
+    """
+    Prune save slots: keep the newest policy.keep_last as folders, pack one
+    slot per day from the last policy.keep_days into a compressed archive,
+    delete the rest, then trim the oldest data until under policy.max_bytes.
+    The current slot is never touched. Returns counts of what was done.
+    """
+    counts = {"archived": 0, "deleted": 0, "archives_dropped": 0, "objects_removed": 0}
+    if not BACKUP_ROOT.exists():
+        return counts
+
+    slots = _load_index()
+    entries = get_backup_entries()
+    protected = [CURRENT_SAVE_SLOT] if CURRENT_SAVE_SLOT is not None else []
+    plan = plan_retention(entries, policy, protected=protected)
+
+    if plan.archive:
+        path = _next_archive_path(policy.compression)
+        write_archive(path, {entry.path: slots[entry.path.name] for entry in plan.archive}, policy.compression)
+        for entry in plan.archive:
+            shutil.rmtree(entry.path, ignore_errors=True)
+            slots[entry.path.name] = dict(slots[entry.path.name], archive=path.name)
+        counts["archived"] = len(plan.archive)
+
+    for entry in plan.delete:
+        shutil.rmtree(entry.path, ignore_errors=True)
+        slots.pop(entry.path.name, None)
+    counts["deleted"] = len(plan.delete)
+
+    def drop_archive(archive: str):
+        (BACKUP_ROOT / archive).unlink(missing_ok=True)
+        for name in [name for name, info in slots.items() if info.get("archive") == archive]:
+            del slots[name]
+        counts["archives_dropped"] += 1
+
+    for archive in plan.drop_archives:
+        drop_archive(archive)
+    if plan.archive or plan.delete:
+        counts["objects_removed"] = _gc_objects()
+
+    if policy.max_bytes is not None:
+        # Oldest archives go first, then the oldest folders, down to the newest one
+        while _saves_usage() > policy.max_bytes:
+            remaining = sorted(slots.items(), key=lambda item: item[1]["timestamp"])
+            archives = [info["archive"] for _, info in remaining if info.get("archive")]
+            folders = [BACKUP_ROOT / name for name, info in remaining[:-1]
+                       if not info.get("archive") and BACKUP_ROOT / name not in protected]
+            if archives:
+                drop_archive(archives[0])
+            elif folders:
+                shutil.rmtree(folders[0], ignore_errors=True)
+                del slots[folders[0].name]
+                counts["deleted"] += 1
+                counts["objects_removed"] += _gc_objects()
+            else:
+                break
+
+    if any(counts.values()):
+        _write_index(slots)
+    return counts
@@ -0,0 +1,111 @@
+"""
+House edge over a grid of rule variants.
+
+Every variant is split into simulation shards and all shards from all
+variants go through one process pool, so a sweep keeps every worker busy
+even when it has fewer variants than workers. Results are cached per
+variant (rules plus run settings) in memory and, optionally, in a JSON
+file, so re-running a sweep only simulates the cells that are new.
+"""
+import itertools
+import json
+from dataclasses import asdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Union
+
+from .rules import Rules
+from .simulation import SimulationStats, SHARD_SIZE, dealer_mimic, shard_jobs, run_jobs
+from .solver import StrategyTable
+
+STRATEGIES = ("basic", "dealer")
+
+
+def rule_grid(num_decks: Iterable[int] = (1, 2, 6, 8),
+              dealer_hits_soft_17: Iterable[bool] = (False, True),
+              blackjack_payout: Iterable[Optional[float]] = (None, 1.5, 1.2),
+              surrender_allowed: Iterable[bool] = (True, False),
+              penetration: Iterable[float] = (0.75,)) -> List[Rules]:
+    """Every combination of the given rule values."""
+    return [
+        Rules(num_decks=decks, dealer_hits_soft_17=h17, blackjack_payout=payout,
+              surrender_allowed=surrender, penetration=pen)
+        for decks, h17, payout, surrender, pen in itertools.product(
+            num_decks, dealer_hits_soft_17, blackjack_payout, surrender_allowed, penetration)
+    ]
+
+
+def _decider(strategy: str, rules: Rules):
+    if strategy == "basic":
+        # Infinite-deck chart for the variant's dealer and surrender rules
+        return StrategyTable(rules=rules).decide
+    if strategy == "dealer":
+        return dealer_mimic
+    raise ValueError(f"Unknown strategy: {strategy}")
+
+
+class SweepCache:
+    """SimulationStats per sweep cell, optionally persisted to a JSON file."""
+
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        self.path = Path(path) if path is not None else None
+        self.entries: Dict[str, dict] = {}
+        if self.path is not None and self.path.exists():
+            with open(self.path, 'r') as f:
+                self.entries = json.load(f)
+
+    @staticmethod
+    def key(rules: Rules, rounds: int, seed: int, bet: int, strategy: str, rng_kind: str,
+            shard_size: int = SHARD_SIZE) -> str:
+        # Shard boundaries pick the per-shard RNG streams, so they change the results
+        return json.dumps({
+            "rules": rules.to_dict(), "rounds": rounds, "seed": seed,
+            "bet": bet, "strategy": strategy, "rng": rng_kind, "shard_size": shard_size,
+        }, sort_keys=True)
+
+    def get(self, key: str) -> Optional[SimulationStats]:
+        entry = self.entries.get(key)
+        return SimulationStats(**entry) if entry is not None else None
+
+    def put(self, key: str, stats: SimulationStats):
+        self.entries[key] = asdict(stats)
+
+    def save(self):
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'w') as f:
+            json.dump(self.entries, f, indent=2)
+
+
+def run_sweep(variants: Iterable[Rules], rounds: int, seed: int = 0, workers: Optional[int] = None,
+              bet: int = 10, strategy: str = "basic", rng_kind: str = "random",
+              cache: Optional[SweepCache] = None, shard_size: int = SHARD_SIZE) -> Dict[Rules, SimulationStats]:
+    """
+    Simulate `rounds` rounds of every variant and return the stats per
+    variant (see SimulationStats.house_edge). Cells already in `cache` are
+    not re-run; new ones are added to it and the cache is saved.
+    """
+    cache = cache if cache is not None else SweepCache()
+    variants = list(dict.fromkeys(variants))
+    results: Dict[Rules, SimulationStats] = {}
+
+    jobs = []
+    owners = []
+    for rules in variants:
+        cached = cache.get(SweepCache.key(rules, rounds, seed, bet, strategy, rng_kind, shard_size))
+        if cached is not None:
+            results[rules] = cached
+            continue
+        results[rules] = SimulationStats()
+        variant_jobs = shard_jobs(rounds, seed, bet, rules, _decider(strategy, rules), rng_kind, shard_size)
+        jobs.extend(variant_jobs)
+        owners.extend([rules] * len(variant_jobs))
+
+    if jobs:
+        for rules, stats in zip(owners, run_jobs(jobs, workers)):
+            results[rules].merge(stats)
+        for rules in dict.fromkeys(owners):
+            cache.put(SweepCache.key(rules, rounds, seed, bet, strategy, rng_kind, shard_size), results[rules])
+        cache.save()
+
+    return {rules: results[rules] for rules in variants}
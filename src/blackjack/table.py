@@ -0,0 +1,75 @@
+from typing import List, Optional, Sequence, Union
+
+from .models.card import Deck
+from .models.player import Player, Dealer
+from .engine import DecisionCallback, RoundResult, play_hand, settle
+from .rules import Rules, DEFAULT_RULES
+
+MAX_SEATS = 7
+
+
+class Table:
+    """
+    Up to seven seats playing against one dealer from one shared shoe.
+
+    Cards are dealt round the table as in a casino (one to each seat, one
+    to the dealer, then again), every seat plays its hand in turn, the
+    dealer plays out once, and all remaining bets are settled in one pass.
+    """
+
+    def __init__(self, deck: Deck, seats: Sequence[Player], dealer: Optional[Dealer] = None,
+                 rules: Rules = DEFAULT_RULES):
+        if not 1 <= len(seats) <= MAX_SEATS:
+            raise ValueError(f"A table has 1 to {MAX_SEATS} seats")
+        self.deck = deck
+        self.rules = rules
+        self.seats = list(seats)
+        self.dealer = dealer if dealer is not None else Dealer(rules.dealer_hits_soft_17)
+
+    def play_round(self, bets: Sequence[int],
+                   decide: Union[DecisionCallback, Sequence[DecisionCallback]]) -> List[Optional[RoundResult]]:
+        """
+        Play one round. `bets` has one entry per seat (0 sits the round out);
+        `decide` is one callback for every seat or one per seat.
+        Returns one result per seat, None for seats that did not play.
+        """
+        if len(bets) != len(self.seats):
+            raise ValueError("Need one bet per seat")
+        deciders = list(decide) if isinstance(decide, (list, tuple)) else [decide] * len(self.seats)
+
+        self.dealer.clear_hand()
+        playing = []
+        for index, (seat, bet) in enumerate(zip(self.seats, bets)):
+            seat.clear_hand()
+            if bet > 0 and seat.place_bet(bet):
+                playing.append(index)
+
+        results: List[Optional[RoundResult]] = [None] * len(self.seats)
+        if not playing:
+            return results
+
+        # Reshuffle only between rounds, never mid-hand
+        self.deck.shuffle_if_needed()
+
+        for _ in range(2):
+            for index in playing:
+                self.seats[index].add_card(self.deck.deal())
+            self.dealer.add_card(self.deck.deal())
+
+        to_settle = []
+        for index in playing:
+            seat = self.seats[index]
+            surrendered = play_hand(seat, self.dealer, self.deck, deciders[index], self.rules)
+            if surrendered is not None:
+                results[index] = surrendered
+            else:
+                to_settle.append(index)
+
+        # One dealer play-out for the whole table, only if someone is still in
+        if any(not self.seats[index].is_busted for index in to_settle):
+            while self.dealer.should_hit():
+                self.dealer.add_card(self.deck.deal())
+
+        for index in to_settle:
+            results[index] = settle(self.seats[index], self.dealer, self.rules)
+        return results
@@ -6,7 +6,10 @@ from typing import List, Dict, Optional, Tuple
 from .storage import get_data_dir
 
 class TriviaManager:
-    def __init__(self, custom_dir: str = None):
+    def __init__(self, custom_dir: str = None, rng: Optional[random.Random] = None):
+        # Question picker; any random.Random-compatible RNG (see blackjack.rng)
+        self.rng = rng if rng is not None else random
+
         # Resolve path relative to the user's home directory
         if custom_dir:
              self.custom_dir = os.path.abspath(custom_dir)
@@ -103,7 +106,7 @@ class TriviaManager:
         if not available_indices:
             available_indices = range(total)
             
-        selected_idx = random.choice(available_indices)
+        selected_idx = self.rng.choice(available_indices)
         return questions[selected_idx], selected_idx
 
     def get_custom_topics(self) -> List[Tuple[str, str]]:
@@ -67,34 +67,16 @@ class BlackjackUI:
             return "exit"
 
     def show_backup_selection(self, backups: list) -> any:
-        """Show menu to select a backup file."""
+        """Show menu to select a backup (storage.BackupInfo entries, newest first)."""
         self.clear_screen()
         self.print_header()
         import questionary
         
         choices = []
         for b in backups:
-            name_parts = b.name.split('-')
-            # Try to read username from players.json inside the backup
-            player_name = "Unknown"
-            try:
-                p_file = b / "players.json"
-                if p_file.exists():
-                    import json
-                    with open(p_file, 'r') as f:
-                        data = json.load(f)
-                        # data is {hash: {name: ..., chips: ...}}
-                        # Since backups usually isolate single users, pick the first
-                        if data:
-                            first_key = list(data.keys())[0]
-                            player_name = data[first_key].get("name", "Unknown")
-            except Exception:
-                pass
-
-            # Fallback to filename parsing if reading failed or yielded Unknown
-            if player_name == "Unknown":
-                if len(name_parts) >= 8:
-                    player_name = name_parts[1]
+            # b is a storage.BackupInfo; player and chips come from the backup index
+            name_parts = b.path.name.split('-')
+            player_name = b.player or "Unknown"
             
             # Extract timestamp from folder name for display
             # Format usually: save-NAME-YYYY-MM... or save-YYYY...
@@ -104,9 +86,11 @@ class BlackjackUI:
             else:
                 timestamp = "legacy"
 
-            display_name = f"{player_name} ({timestamp})"
+            chips = f" ${b.chips}" if b.chips is not None else ""
+            archived = " [archived]" if b.archive else ""
+            display_name = f"{player_name}{chips} ({timestamp}){archived}"
             
-            choices.append(questionary.Choice(title=display_name, value=b))
+            choices.append(questionary.Choice(title=display_name, value=b.path))
             
         choices.append(questionary.Choice(title="Back to Menu", value="CANCEL"))
         
@@ -0,0 +1,62 @@
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from blackjack import storage
+from blackjack.engine import RoundEngine
+from blackjack.models.card import Card
+from blackjack.models.player import Player
+from blackjack.rules import DEFAULT_RULES
+
+
+class StackedDeck:
+    """Deals cards in the given order, counting how many went out."""
+    def __init__(self, cards):
+        self.cards = [Card(rank, suit) for rank, suit in cards]
+        self.dealt = 0
+
+    def deal(self):
+        self.dealt += 1
+        return self.cards.pop(0)
+
+    def shuffle_if_needed(self):
+        return False
+
+
+def make_engine(cards, rules=DEFAULT_RULES, chips=100):
+    return RoundEngine(StackedDeck(cards), Player("Tester", chips), rules=rules)
+
+
+def always(action):
+    """A decide() callback that always picks action."""
+    return lambda player, upcard, can_surrender: action
+
+
+@pytest.fixture
+def storage_backend():
+    """Backend data_dir selects; override it in a module or parametrize it."""
+    return "json"
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch, storage_backend):
+    """Point storage at an empty temporary data directory, closing the store afterwards."""
+    data = tmp_path / "data"
+    data.mkdir()
+    monkeypatch.setattr(storage, "DATA_DIR", data)
+    monkeypatch.setattr(storage, "DATA_FILE", data / "players.json")
+    monkeypatch.setattr(storage, "SESSION_FILE", data / "session.json")
+    monkeypatch.setattr(storage, "BACKUP_ROOT", data / "saves")
+    monkeypatch.setattr(storage, "CURRENT_SAVE_SLOT", None)
+    monkeypatch.setattr(storage, "BACKEND", storage_backend)
+    yield data
+    storage._close_store()
+
+
+@pytest.fixture
+def numbered_slots(data_dir, monkeypatch):
+    """New save slots get distinct names even when created within the same second."""
+    names = iter(f"save-Player1-2026-01-01-00-{i // 60:02d}-{i % 60:02d}" for i in range(600))
+    monkeypatch.setattr(storage, "get_next_backup_path", lambda user="unknown": storage.BACKUP_ROOT / next(names))
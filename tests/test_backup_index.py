@@ -0,0 +1,86 @@
+import pytest
+import json
+import shutil
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from blackjack import storage
+from blackjack.objectstore import file_digest, read_manifest
+
+pytestmark = pytest.mark.usefixtures("numbered_slots")
+
+
+
+
+def new_save(name, chips):
+    storage.save_session(name)
+    storage.save_player(name, chips)
+    storage.CURRENT_SAVE_SLOT = None
+    assert storage.save_current_game()
+    return storage.CURRENT_SAVE_SLOT
+
+
+def test_save_records_slot_in_index(data_dir):
+    slot = new_save("Player1", 120)
+    entries = storage.get_backup_entries()
+    assert len(entries) == 1
+    entry = entries[0]
+    assert entry.path == slot
+    assert (entry.player, entry.chips) == ("Player1", 120)
+    assert entry.size > 0
+    assert (data_dir / storage.INDEX_NAME).exists()
+    assert not (slot / storage.INDEX_NAME).exists()
+
+def test_listing_reads_no_slots(data_dir, monkeypatch):
+    first = new_save("Player1", 100)
+    second = new_save("Player1", 200)
+
+    def no_scan(slot):
+        raise AssertionError("slot was read")
+
+    monkeypatch.setattr(storage, "_read_slot_info", no_scan)
+    assert storage.get_available_backups() == [second, first]
+    assert storage.find_latest_backup() == second
+
+def test_updating_slot_refreshes_entry(data_dir):
+    slot = new_save("Player1", 100)
+    storage.save_player("Player1", 75)
+    assert storage.save_current_game()
+    assert storage.CURRENT_SAVE_SLOT == slot
+    assert storage.get_backup_entries()[0].chips == 75
+
+def test_stale_index_is_rebuilt(data_dir):
+    kept = new_save("Player1", 100)
+    gone = new_save("Player1", 200)
+    shutil.rmtree(gone)
+
+    # A slot copied in by hand, in the old full-copy layout
+    legacy = storage.BACKUP_ROOT / "save-Other-2025-05-05-10-00-00"
+    legacy.mkdir()
+    with open(legacy / "players.json", 'w') as f:
+        json.dump({storage._hash_name("Other"): {"name": "Other", "chips": 33}}, f)
+
+    entries = {entry.path: entry for entry in storage.get_backup_entries()}
+    assert set(entries) == {kept, legacy}
+    assert (entries[legacy].player, entries[legacy].chips) == ("Other", 33)
+
+def test_corrupt_index_is_rebuilt(data_dir):
+    slot = new_save("Player1", 100)
+    (data_dir / storage.INDEX_NAME).write_text("{not json")
+    assert storage.get_available_backups() == [slot]
+
+@pytest.mark.parametrize("storage_backend", ["json", "sqlite", "binary"])
+def test_rebuild_reads_slot_through_its_backend(data_dir, storage_backend):
+    storage.save_player("Someone", 5)
+    slot = new_save("Player1", 120)
+    before = storage.get_backup_entries()
+    assert (before[0].player, before[0].chips) == ("Player1", 120)
+
+    storage.rebuild_backup_index()
+    after = storage.get_backup_entries()
+    assert [(e.path, e.player, e.chips) for e in after] == [(slot, "Player1", 120)]
+    # Reading the slot left its (shared) files untouched
+    for rel, meta in read_manifest(slot).items():
+        assert file_digest(slot / rel) == meta["digest"]
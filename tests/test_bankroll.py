@@ -0,0 +1,50 @@
+import pytest
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+np = pytest.importorskip("numpy")
+
+from blackjack.bankroll import OutcomeProbs, simulate_bankroll
+from blackjack.simulation import SimulationStats
+
+
+def test_probs_must_sum_to_one():
+    with pytest.raises(ValueError):
+        OutcomeProbs(0.5, 0.4, 0.0)
+
+def test_from_stats_counts_busts_as_losses():
+    stats = SimulationStats(rounds=10, wins=4, losses=2, busts=2, pushes=1, surrenders=1)
+    assert OutcomeProbs.from_stats(stats) == OutcomeProbs(0.4, 0.4, 0.1, 0.1)
+
+def test_always_lose():
+    report = simulate_bankroll(OutcomeProbs(0.0, 1.0, 0.0), bet=10, start=95, paths=100, seed=1)
+    assert report.ruin_probability == 1.0
+    # 9 full bets then the last 5 chips
+    assert (report.rounds_played == 10).all()
+
+def test_always_surrender():
+    report = simulate_bankroll(OutcomeProbs(0.0, 0.0, 0.0, 1.0), bet=10, start=20, paths=10, seed=1)
+    # 20 -> 15 -> 10 -> 5 -> 2 -> 1 -> 0
+    assert (report.rounds_played == 6).all()
+
+def test_always_win_reaches_target():
+    report = simulate_bankroll(OutcomeProbs(1.0, 0.0, 0.0), bet=10, start=500, target=600, paths=50, seed=1)
+    assert report.target_probability == 1.0
+    assert (report.final_chips == 600).all()
+    assert (report.rounds_played == 10).all()
+
+def test_fair_game_gamblers_ruin():
+    """Even odds from 5 units to 10 units is a coin flip."""
+    report = simulate_bankroll(OutcomeProbs(0.5, 0.5, 0.0), bet=10, start=50, target=100, paths=20_000, seed=3)
+    assert report.ruin_probability == pytest.approx(0.5, abs=0.02)
+    assert report.ruin_probability + report.target_probability == pytest.approx(1.0)
+
+def test_seeded_runs_repeat():
+    probs = OutcomeProbs(0.42, 0.49, 0.09)
+    a = simulate_bankroll(probs, paths=500, max_rounds=200, seed=9)
+    b = simulate_bankroll(probs, paths=500, max_rounds=200, seed=9)
+    assert (a.final_chips == b.final_chips).all()
+    assert a.survival_curve()[0] == 1.0
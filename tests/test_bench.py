@@ -0,0 +1,26 @@
+import pytest
+import sys
+from pathlib import Path
+
+# Add benchmarks and src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "benchmarks"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import bench
+from blackjack import storage
+
+
+def test_compare_flags_regressions_only():
+    rows = bench.compare({"fast": 1.0, "slow": 2.0, "new": 1.0}, {"fast": 1.1, "slow": 1.0}, threshold=0.25)
+    flagged = {name: regressed for name, _, _, regressed in rows}
+    assert flagged == {"fast": False, "slow": True, "new": False}
+
+def test_baseline_covers_every_benchmark():
+    assert set(bench.load_baseline(bench.BASELINE)) >= set(bench.BENCHMARKS)
+
+def test_run_leaves_storage_paths_alone():
+    data_dir = storage.DATA_DIR
+    results = bench.run(["player.hand_value", "storage.load_player[1]"], repeat=1, min_time=0.01)
+    assert set(results) == {"player.hand_value", "storage.load_player[1]"}
+    assert all(seconds > 0 for seconds in results.values())
+    assert storage.DATA_DIR == data_dir
@@ -0,0 +1,107 @@
+import pytest
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from blackjack import storage, binary_store
+from blackjack.binary_store import BinaryStore
+
+
+@pytest.fixture
+def storage_backend():
+    """data_dir (see conftest) selects the binary backend in this module."""
+    return "binary"
+
+
+def test_save_and_load(data_dir):
+    assert storage.load_player("Player1") is None
+    assert storage.save_player("Player1", 100)
+    assert storage.save_player("player1", 250)
+    assert storage.save_player("Broke", -5)
+    assert storage.load_player("PLAYER1") == 250
+    assert storage.load_player("Broke") == 0
+    assert storage.get_player_store().get("player1")["name"] == "Player1"
+    assert (data_dir / storage.BIN_NAME).exists()
+    assert not (data_dir / "players.json").exists()
+
+def test_chip_update_rewrites_nothing_else(data_dir):
+    storage.save_player("Player1", 100)
+    path = data_dir / storage.BIN_NAME
+    before = path.read_bytes()
+    storage.save_player("Player1", 101)
+    after = path.read_bytes()
+    assert len(before) == len(after)
+    changed = [i for i in range(len(before)) if before[i] != after[i]]
+    # One byte of the little-endian int64 chip count
+    assert len(changed) == 1
+
+def test_grows_past_half_full(data_dir, monkeypatch):
+    monkeypatch.setattr(binary_store, "MIN_CAPACITY", 8)
+    for i in range(50):
+        assert storage.save_player(f"player{i}", i)
+    store = storage.get_player_store()
+    assert store._capacity == 128
+    assert all(storage.load_player(f"player{i}") == i for i in range(50))
+    assert len(storage._load_all_data()) == 50
+
+def test_migrates_json(data_dir):
+    storage._write_snapshot(data_dir / "players.json",
+                            {storage._hash_name("Old"): {"name": "Old", "chips": 40}})
+    with open(data_dir / storage.JOURNAL_NAME, 'w') as f:
+        f.write(json.dumps({"key": storage._hash_name("Old"), "name": "Old", "chips": 55}) + "\n")
+    assert storage.load_player("Old") == 55
+
+    # Later JSON edits are not imported again
+    storage.save_player("Old", 80)
+    storage._close_store()
+    storage._write_snapshot(data_dir / "players.json", {})
+    assert storage.load_player("Old") == 80
+
+def test_other_process_sees_updates(data_dir):
+    storage.save_player("Player1", 100)
+    other = BinaryStore(data_dir / storage.BIN_NAME)
+    try:
+        assert other.put("Player1", 7)
+        assert storage.load_player("Player1") == 7
+        # Replacing the file (as a grow does) is picked up too
+        assert other.replace_all({storage._hash_name("New"): {"name": "New", "chips": 3}})
+        assert storage.load_player("New") == 3
+        assert storage.load_player("Player1") is None
+    finally:
+        other.close()
+
+def test_rejects_foreign_file(tmp_path):
+    path = tmp_path / storage.BIN_NAME
+    path.write_bytes(b"\0" * 64)
+    with pytest.raises(ValueError):
+        BinaryStore(path)
+
+def test_leaderboard(data_dir):
+    for name, chips in (("A", 10), ("B", 300), ("C", 120)):
+        storage.save_player(name, chips)
+    assert storage.leaderboard(2) == [("B", 300), ("C", 120)]
+
+def test_backup_and_restore(data_dir):
+    storage.save_player("Player1", 100)
+    assert storage.save_current_game()
+    slot = storage.CURRENT_SAVE_SLOT
+    assert (slot / storage.BIN_NAME).exists()
+
+    storage.save_player("Player1", 5)
+    assert storage.save_current_game()
+    storage.save_player("Player1", 60)
+    assert storage.restore_data(slot)
+    assert storage.load_player("Player1") == 5
+
+def test_write_behind(data_dir):
+    storage.start_write_behind(delay=0.2)
+    try:
+        for chips in (10, 20, 30):
+            storage.save_player("Player1", chips)
+        assert storage.load_player("Player1") == 30
+        assert storage.flush(timeout=5)
+    finally:
+        storage.stop_write_behind()
+    assert storage.get_player_store().get("Player1")["chips"] == 30
@@ -0,0 +1,60 @@
+import pytest
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from blackjack.models.card import Deck, card_code
+from blackjack.models.counting import CardCounter, HI_LO
+from blackjack.rng import make_rng
+
+
+def test_balanced_systems_end_at_zero():
+    """Balanced systems sum to zero over a full shoe."""
+    for name in ("hi-lo", "hi-opt-i", "hi-opt-ii", "omega-ii", "zen"):
+        deck = Deck(num_decks=2, rng=make_rng("random", 1))
+        deck.attach_counter(CardCounter(name))
+        for _ in range(104):
+            deck.deal()
+        assert deck.running_count == 0, name
+
+def test_ko_is_unbalanced():
+    deck = Deck(num_decks=1, rng=make_rng("random", 1))
+    deck.attach_counter(CardCounter("ko", initial_count=-4))
+    for _ in range(52):
+        deck.deal()
+    assert deck.running_count == 0
+
+def test_running_count_matches_history():
+    deck = Deck(num_decks=6, rng=make_rng("counter", 8))
+    deck.attach_counter(CardCounter("hi-lo"))
+    seen = [deck.deal() for _ in range(150)]
+    expected = sum(HI_LO[card.code % 13] for card in seen)
+    assert deck.running_count == expected
+    assert deck.decks_remaining == pytest.approx(162 / 52)
+    assert deck.true_count == pytest.approx(expected / (162 / 52))
+
+def test_reshuffle_resets_count():
+    deck = Deck(num_decks=1, penetration=0.5)
+    deck.attach_counter(CardCounter())
+    for _ in range(30):
+        deck.deal()
+    assert deck.counter.cards_seen == 30
+    deck.shuffle_if_needed()
+    assert deck.running_count == 0
+    assert deck.counter.cards_seen == 0
+
+def test_custom_tags():
+    counter = CardCounter([0] * 12 + [5])
+    counter.see(card_code('Ace', 'Hearts'))
+    counter.see(card_code('Two', 'Hearts'))
+    assert counter.running_count == 5
+    with pytest.raises(ValueError):
+        CardCounter([1, 2, 3])
+
+def test_no_counter():
+    deck = Deck(num_decks=1)
+    deck.deal()
+    with pytest.raises(ValueError):
+        deck.running_count
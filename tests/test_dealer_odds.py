@@ -0,0 +1,41 @@
+import pytest
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from blackjack.models.card import Deck
+from blackjack.dealer_odds import dealer_distribution, dealer_table, full_shoe, remove_card
+
+
+def test_distribution_sums_to_one():
+    for upcard in range(2, 12):
+        assert sum(dealer_distribution(upcard)) == pytest.approx(1.0)
+
+def test_infinite_deck_known_values():
+    """Published infinite-deck, stand-on-17 bust rates."""
+    assert dealer_distribution(2).bust == pytest.approx(0.3536, abs=1e-4)
+    assert dealer_distribution(6).bust == pytest.approx(0.4232, abs=1e-4)
+    assert dealer_distribution(10).bust == pytest.approx(0.2121, abs=1e-4)
+    assert dealer_distribution(11).bust == pytest.approx(0.1153, abs=1e-4)
+
+def test_final_total_lookup():
+    dist = dealer_distribution(10)
+    assert dist.final_total(20) == dist.p20
+
+def test_composition_matters():
+    """With every ten-value card gone, a dealer 6 can no longer draw to a hard 16 + 10 bust."""
+    shoe = list(remove_card(full_shoe(1), 6))
+    rich = dealer_distribution(6, shoe)
+    shoe[8] = 0  # no tens
+    poor = dealer_distribution(6, shoe)
+    assert poor.bust < rich.bust
+
+def test_deck_composition_feeds_table():
+    deck = Deck(num_decks=2)
+    assert deck.composition() == full_shoe(2)
+    deck.deal()
+    assert sum(deck.composition()) == 103
+    table = dealer_table(deck.composition())
+    assert all(sum(dist) == pytest.approx(1.0) for dist in table.values())
@@ -0,0 +1,93 @@
+import pytest
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from blackjack.models.card import Deck
+from blackjack.models.player import Player
+from blackjack.engine import RoundEngine, HIT, STAND, SURRENDER, WIN, LOSS, PUSH, SURRENDERED, BUST
+
+from conftest import StackedDeck, always, make_engine
+
+
+def test_deal_order():
+    """Cards go player, dealer, player, dealer."""
+    engine = make_engine([('Two', 'Spades'), ('Three', 'Spades'), ('Four', 'Spades'), ('Five', 'Spades')])
+    assert engine.begin_round(10)
+    assert [c.rank for c in engine.player.hand] == ['Two', 'Four']
+    assert [c.rank for c in engine.dealer.hand] == ['Three', 'Five']
+
+def test_bet_refused():
+    engine = make_engine([], chips=5)
+    assert engine.play_round(10, always(STAND)) is None
+    assert engine.player.chips == 5
+
+def test_stand_win():
+    # Player 20, dealer 17
+    engine = make_engine([('King', 'Spades'), ('Ten', 'Hearts'), ('Queen', 'Spades'), ('Seven', 'Hearts')])
+    result = engine.play_round(10, always(STAND))
+    assert result.outcome == WIN
+    assert result.net == 10
+    assert engine.player.chips == 110
+
+def test_dealer_wins():
+    # Player 17, dealer 20
+    engine = make_engine([('King', 'Spades'), ('Ten', 'Hearts'), ('Seven', 'Spades'), ('Queen', 'Hearts')])
+    result = engine.play_round(10, always(STAND))
+    assert result.outcome == LOSS
+    assert engine.player.chips == 90
+
+def test_push():
+    engine = make_engine([('King', 'Spades'), ('Ten', 'Hearts'), ('Eight', 'Spades'), ('Eight', 'Hearts')])
+    result = engine.play_round(10, always(STAND))
+    assert result.outcome == PUSH
+    assert result.net == 0
+    assert engine.player.chips == 100
+
+def test_dealer_hits_to_bust():
+    # Player 18, dealer 16 draws a King
+    engine = make_engine([('King', 'Spades'), ('Ten', 'Hearts'), ('Eight', 'Spades'), ('Six', 'Hearts'), ('King', 'Clubs')])
+    result = engine.play_round(10, always(STAND))
+    assert result.outcome == WIN
+    assert result.dealer_busted
+    assert len(engine.dealer.hand) == 3
+
+def test_player_bust_skips_dealer():
+    engine = make_engine([('King', 'Spades'), ('Ten', 'Hearts'), ('Six', 'Spades'), ('Six', 'Hearts'), ('King', 'Clubs')])
+    result = engine.play_round(10, always(HIT))
+    assert result.outcome == BUST
+    assert result.net == -10
+    assert len(engine.dealer.hand) == 2
+
+def test_surrender_returns_half():
+    engine = make_engine([('King', 'Spades'), ('Ten', 'Hearts'), ('Six', 'Spades'), ('Seven', 'Hearts')])
+    result = engine.play_round(11, always(SURRENDER))
+    assert result.outcome == SURRENDERED
+    assert result.payout == 5
+    assert engine.player.chips == 94
+
+def test_headless_rounds_conserve_chips():
+    """Many rounds on a real shoe never create or lose chips outside of bets."""
+    engine = RoundEngine(Deck(num_decks=6), Player("Bot", 1_000_000))
+    hit_below_17 = lambda player, upcard, can_surrender: HIT if player.hand_value < 17 else STAND
+    total_net = 0
+    for _ in range(2000):
+        total_net += engine.play_round(10, hit_below_17).net
+    assert engine.player.chips == 1_000_000 + total_net
+
+def test_reshuffle_waits_for_next_round():
+    """Passing the cut card mid-hand does not reshuffle until the next round."""
+    deck = Deck(num_decks=1, penetration=0.5)
+    engine = RoundEngine(deck, Player("Bot", 1_000))
+    while len(deck) > 27:
+        deck.deal()
+    assert not deck.needs_shuffle
+    engine.begin_round(10)
+    assert deck.needs_shuffle
+    engine.hit()
+    assert len(deck) == 22
+    engine.resolve()
+    engine.begin_round(10)
+    assert len(deck) == 48
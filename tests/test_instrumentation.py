@@ -0,0 +1,85 @@
+import pytest
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from blackjack import storage
+from blackjack.game_logic import BlackjackGame
+from blackjack.instrumentation import SpanRecorder, percentile
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_idle_time_excluded_from_enclosing_spans():
+    clock = FakeClock()
+    rec = SpanRecorder(clock=clock)
+    with rec.span("outer"):
+        clock.now += 1.0
+        with rec.span("inner"):
+            with rec.idle("input"):
+                clock.now += 5.0
+            clock.now += 0.5
+    spans = {span.name: span for span in rec.spans}
+    assert spans["inner"].duration == pytest.approx(0.5)
+    assert spans["outer"].duration == pytest.approx(1.5)
+    assert spans["input"].idle and spans["input"].duration == pytest.approx(5.0)
+
+def test_ring_buffer_keeps_latest():
+    rec = SpanRecorder(capacity=3)
+    for i in range(5):
+        with rec.span(f"s{i}"):
+            pass
+    assert [span.name for span in rec.spans] == ["s2", "s3", "s4"]
+
+def test_percentiles():
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 50
+    assert percentile(values, 95) == 95
+    assert percentile(values, 99) == 99
+    assert percentile([], 50) == 0.0
+
+
+class ScriptedUI:
+    """Stands in for BlackjackUI: bets 10 and always stands."""
+    def __init__(self):
+        self.tables = 0
+
+    def display_table(self, *args):
+        self.tables += 1
+
+    def get_bet(self, chips):
+        return 10
+
+    def get_action(self, can_surrender=False):
+        return 's'
+
+    def show_message(self, *args):
+        pass
+
+
+def test_play_round_records_phases(tmp_path, monkeypatch):
+    monkeypatch.setattr(storage, "DATA_DIR", tmp_path)
+    monkeypatch.setattr(storage, "DATA_FILE", tmp_path / "players.json")
+    monkeypatch.setattr(time, "sleep", lambda seconds: None)
+
+    rec = SpanRecorder()
+    game = BlackjackGame(recorder=rec)
+    game.ui = ScriptedUI()
+    game.player.name, game.player.chips = "Tester", 100
+    game.play_round()
+
+    summary = rec.summary()
+    assert {"bet", "deal", "player_turn", "dealer_turn", "resolve", "save_progress"} <= set(summary["phases"])
+    assert summary["phases"]["display_table"]["count"] == game.ui.tables
+    assert summary["idle"]["sleep"]["count"] >= 2
+    assert summary["idle"]["input"]["count"] == 2
+    assert storage.load_player("Tester") == game.player.chips
@@ -0,0 +1,63 @@
+import pytest
+import sys
+import copy
+import pickle
+import tracemalloc
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from blackjack.models.card import Card, Deck
+from blackjack.models.player import Player, Dealer
+from blackjack.engine import RoundEngine, HIT, STAND
+
+
+def traced(fn):
+    """Bytes still allocated after running fn (the result is kept alive)."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = fn()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del result
+    return after - before
+
+
+def test_cards_are_shared():
+    assert Card('Ace', 'Spades') is Card('Ace', 'Spades')
+    card = Card('Ten', 'Hearts')
+    assert copy.deepcopy(card) is card
+    assert pickle.loads(pickle.dumps(card)) is card
+
+def test_cards_are_immutable():
+    with pytest.raises(AttributeError):
+        Card('Two', 'Clubs').value = 11
+
+def test_models_have_no_instance_dict():
+    for obj in (Card('Two', 'Clubs'), Player("Slots"), Dealer()):
+        assert not hasattr(obj, '__dict__')
+
+def test_shoe_memory():
+    """A 6-deck shoe is a byte buffer, not 312 card objects."""
+    assert traced(lambda: Deck(num_decks=6)) < 2048
+
+def test_dealing_allocates_no_cards():
+    """Dealing a whole shoe only costs the list holding the references."""
+    deck = Deck(num_decks=6)
+    held = traced(lambda: [deck.deal() for _ in range(312)])
+    # One Card with a __dict__ each would be over 40KB
+    assert held < 312 * 8 * 2
+
+def test_round_memory():
+    """Rounds reuse the shared cards, so nothing accumulates per round."""
+    engine = RoundEngine(Deck(num_decks=6), Player("Bot", 1_000_000))
+    decide = lambda player, upcard, can_surrender: HIT if player.hand_value < 17 else STAND
+    engine.play_round(10, decide)
+
+    def play():
+        for _ in range(500):
+            engine.play_round(10, decide)
+    assert traced(play) < 1024
@@ -1,12 +1,13 @@
 
 import pytest
+import random
 import sys
 from pathlib import Path
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from blackjack.models.card import Card, Deck
+from blackjack.models.card import Card, Deck, card_code, card_from_code
 from blackjack.models.player import Player, Dealer
 
 # Tests for Card
@@ -41,11 +42,55 @@ def test_deal():
 def test_auto_reshuffle():
     """Test deck reshuffles when empty."""
     deck = Deck(num_decks=1)
-    deck.cards = [] # Force empty
+    for _ in range(52): # Empty the shoe
+        deck.deal()
+    assert len(deck) == 0
     card = deck.deal()
     assert card is not None
     assert len(deck) == 51 # 52 - 1
 
+def test_card_codes_round_trip():
+    """Every code maps to a distinct card and back."""
+    cards = [card_from_code(code) for code in range(52)]
+    assert len({(c.rank, c.suit) for c in cards}) == 52
+    assert all(card_code(c.rank, c.suit) == code for code, c in enumerate(cards))
+
+def test_shoe_composition():
+    """A 6-deck shoe holds each card exactly 6 times."""
+    deck = Deck(num_decks=6)
+    counts = {}
+    for _ in range(len(deck)):
+        code = deck.deal_code()
+        counts[code] = counts.get(code, 0) + 1
+    assert counts == {code: 6 for code in range(52)}
+
+def test_reshuffle_reuses_buffer():
+    """Reshuffling permutes the existing buffer instead of rebuilding it."""
+    deck = Deck(num_decks=6)
+    buffer = deck._codes
+    deck.create_deck()
+    assert deck._codes is buffer
+    assert len(deck) == 312
+
+def test_cut_card():
+    """The cut card flags a reshuffle without touching the current shoe."""
+    deck = Deck(num_decks=1, penetration=0.75)
+    assert deck.cut_card == 39
+    for _ in range(38):
+        deck.deal()
+    assert not deck.shuffle_if_needed()
+    deck.deal()
+    assert deck.needs_shuffle
+    assert len(deck) == 13
+    buffer = deck._codes
+    assert deck.shuffle_if_needed()
+    assert len(deck) == 52
+    assert deck._codes is buffer
+
+def test_invalid_penetration():
+    with pytest.raises(ValueError):
+        Deck(num_decks=1, penetration=0)
+
 # Tests for Player
 @pytest.fixture
 def player():
@@ -102,6 +147,38 @@ def test_bust(player):
     assert player.hand_value == 25
     assert player.is_busted
 
+def test_soft_hand(player):
+    """Soft while an Ace still counts as 11."""
+    player.add_card(Card('Ace', 'Spades'))
+    player.add_card(Card('Six', 'Hearts'))
+    assert player.is_soft
+    player.add_card(Card('Ten', 'Clubs'))
+    assert not player.is_soft
+    assert player.hand_value == 17
+
+def test_clear_hand_resets_value(player):
+    player.add_card(Card('King', 'Spades'))
+    player.add_card(Card('Ace', 'Hearts'))
+    player.clear_hand()
+    assert player.hand_value == 0
+    assert not player.is_soft
+
+def test_incremental_value_matches_rescan():
+    """Running totals agree with the rescan-and-reduce algorithm."""
+    rng = random.Random(1)
+    deck = Deck(num_decks=2, rng=rng)
+    for _ in range(2000):
+        player = Player("Check")
+        for _ in range(rng.randint(1, 8)):
+            player.add_card(deck.deal())
+            value = sum(card.value for card in player.hand)
+            aces = sum(1 for card in player.hand if card.rank == 'Ace')
+            while value > 21 and aces:
+                value -= 10
+                aces -= 1
+            assert player.hand_value == value
+            assert player.is_busted == (value > 21)
+
 def test_win_bet(player):
     """Test winning adds chips correctly."""
     player.place_bet(50)
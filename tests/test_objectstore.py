@@ -0,0 +1,156 @@
+import pytest
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from blackjack import storage, objectstore
+from blackjack.objectstore import ObjectStore, HashCache, snapshot_dir, read_manifest, MANIFEST_NAME
+
+
+
+@pytest.fixture
+def data_dir(data_dir):
+    questions = data_dir / "questions"
+    questions.mkdir()
+    for i in range(5):
+        (questions / f"topic{i}.json").write_text('{"questions": []}' + " " * i)
+    return data_dir
+
+
+def test_slots_share_objects(data_dir, monkeypatch):
+    names = iter(["save-a", "save-b"])
+    monkeypatch.setattr(storage, "get_next_backup_path", lambda user="unknown": storage.BACKUP_ROOT / next(names))
+    storage.save_player("Player1", 100)
+    assert storage.save_current_game()
+    first = storage.CURRENT_SAVE_SLOT
+    storage.CURRENT_SAVE_SLOT = None
+    storage.save_player("Player1", 50)
+    assert storage.save_current_game()
+    second = storage.CURRENT_SAVE_SLOT
+    assert first != second
+
+    a, b = first / "questions" / "topic0.json", second / "questions" / "topic0.json"
+    assert a.read_text() == b.read_text()
+    assert os.stat(a).st_ino == os.stat(b).st_ino
+    assert read_manifest(first)["players.json"]["digest"] != read_manifest(second)["players.json"]["digest"]
+
+def test_unchanged_files_are_not_rehashed(data_dir, monkeypatch):
+    storage.save_player("Player1", 100)
+    assert storage.save_current_game()
+
+    added = []
+    real_add = ObjectStore.add_file
+    monkeypatch.setattr(ObjectStore, "add_file", lambda self, src: added.append(src.name) or real_add(self, src))
+    (data_dir / "questions" / "topic3.json").write_text('{"questions": [1]}')
+    assert storage.save_current_game()
+    assert added == ["topic3.json"]
+
+def test_slot_tracks_deleted_files(data_dir):
+    assert storage.save_current_game()
+    slot = storage.CURRENT_SAVE_SLOT
+    (data_dir / "questions" / "topic4.json").unlink()
+    assert storage.save_current_game()
+    assert not (slot / "questions" / "topic4.json").exists()
+    assert "questions/topic4.json" not in read_manifest(slot)
+
+def test_restore_from_slot(data_dir):
+    storage.save_player("Player1", 100)
+    assert storage.save_current_game()
+    slot = storage.CURRENT_SAVE_SLOT
+    storage.save_player("Player1", 1)
+    assert storage.restore_data(slot)
+    assert storage.load_player("Player1") == 100
+    assert not (data_dir / MANIFEST_NAME).exists()
+    # Restored files are copies, so writing them cannot touch the object store
+    restored = data_dir / "questions" / "topic0.json"
+    assert os.stat(restored).st_ino != os.stat(slot / "questions" / "topic0.json").st_ino
+
+def test_copy_fallback_without_hardlinks(tmp_path, monkeypatch):
+    def no_link(src, dst):
+        raise OSError("hardlinks not supported")
+
+    monkeypatch.setattr(objectstore.os, "link", no_link)
+    source = tmp_path / "src"
+    source.mkdir()
+    (source / "a.txt").write_text("hello")
+    objects = ObjectStore(tmp_path / "objects")
+    files = snapshot_dir(source, tmp_path / "slot", objects, HashCache(tmp_path / "cache.json"))
+    assert (tmp_path / "slot" / "a.txt").read_text() == "hello"
+    assert files["a.txt"]["digest"] in objects
+
+def test_gc_keeps_referenced(tmp_path):
+    source = tmp_path / "src"
+    source.mkdir()
+    (source / "a.txt").write_text("a")
+    objects = ObjectStore(tmp_path / "objects")
+    kept = snapshot_dir(source, tmp_path / "slot", objects, HashCache(tmp_path / "cache.json"))
+    (source / "a.txt").write_text("b")
+    snapshot_dir(source, tmp_path / "slot2", objects, HashCache(tmp_path / "cache.json"))
+    assert objects.gc({entry["digest"] for entry in kept.values()}) == 1
+    assert list(objects.digests()) == [kept["a.txt"]["digest"]]
+
+def test_restore_links_unchanged_and_copies_changed(data_dir):
+    storage.save_player("Player1", 100)
+    assert storage.save_current_game()
+    slot = storage.CURRENT_SAVE_SLOT
+    unchanged = data_dir / "questions" / "topic0.json"
+    before = os.stat(unchanged).st_ino
+    (data_dir / "questions" / "topic1.json").write_text("edited")
+    (data_dir / "questions" / "extra.json").write_text("{}")
+
+    assert storage.restore_data(slot)
+    # Same file, moved back in by rename rather than rewritten
+    assert os.stat(unchanged).st_ino == before
+    assert os.stat(unchanged).st_nlink == 1
+    assert (data_dir / "questions" / "topic1.json").read_text() == '{"questions": []} '
+    assert not (data_dir / "questions" / "extra.json").exists()
+    assert not any(p.name.startswith(".restore") for p in data_dir.iterdir())
+
+def test_failed_restore_keeps_current_data(data_dir, monkeypatch):
+    storage.save_player("Player1", 100)
+    assert storage.save_current_game()
+    slot = storage.CURRENT_SAVE_SLOT
+    storage.save_player("Player1", 5)
+    (data_dir / "questions" / "topic1.json").write_text("edited")
+
+    real_replace = os.replace
+    calls = []
+
+    def flaky_replace(src, dst):
+        calls.append(src)
+        if len(calls) == 3:
+            raise OSError("disk went away")
+        real_replace(src, dst)
+
+    monkeypatch.setattr(storage.os, "replace", flaky_replace)
+    assert not storage.restore_data(slot)
+    monkeypatch.setattr(storage.os, "replace", real_replace)
+
+    assert storage.load_player("Player1") == 5
+    assert (data_dir / "questions" / "topic1.json").read_text() == "edited"
+    assert len(list((data_dir / "questions").iterdir())) == 5
+    assert not any(p.name.startswith(".restore") for p in data_dir.iterdir())
+
+def test_restore_legacy_slot(data_dir):
+    slot = storage.BACKUP_ROOT / "save-Old-2024-01-01-00-00-00"
+    (slot / "questions").mkdir(parents=True)
+    (slot / "questions" / "old.json").write_text("{}")
+    (slot / "players.json").write_text('{"%s": {"name": "Old", "chips": 42}}' % storage._hash_name("Old"))
+    assert storage.restore_data(slot)
+    assert storage.load_player("Old") == 42
+    assert [p.name for p in (data_dir / "questions").iterdir()] == ["old.json"]
+
+def test_diagnostics_are_not_backed_up(data_dir):
+    (data_dir / "profiles").mkdir()
+    (data_dir / "profiles" / "profile-game.prof").write_text("stats")
+    (data_dir / "trace.json").write_text("{}")
+    assert storage.save_current_game()
+    slot = storage.CURRENT_SAVE_SLOT
+    assert not (slot / "profiles").exists()
+    assert not (slot / "trace.json").exists()
+    # Restoring leaves them where they are
+    assert storage.restore_data(slot)
+    assert (data_dir / "profiles" / "profile-game.prof").exists()
+    assert (data_dir / "trace.json").exists()
@@ -0,0 +1,22 @@
+import pytest
+import pstats
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from blackjack import profiling
+
+
+def test_cprofile_writes_prof_and_report(tmp_path):
+    paths = profiling.profile_call(lambda: profiling.headless_session(200), "headless", out_dir=tmp_path)
+    prof, report = paths
+    assert prof.suffix == ".prof" and report.suffix == ".txt"
+    assert pstats.Stats(str(prof)).total_calls > 0
+    assert "play_round" in report.read_text()
+
+def test_reports_go_to_data_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(profiling.storage, "DATA_DIR", tmp_path)
+    paths = profiling.profile_call(lambda: None, "noop")
+    assert all(path.parent == tmp_path / "profiles" for path in paths)
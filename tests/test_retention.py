@@ -0,0 +1,161 @@
+import pytest
+import json
+import sys
+import tarfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from blackjack import storage
+from blackjack.archive import INDEX_MEMBER, extract_slot, read_archive_index, write_archive
+from blackjack.storage import BackupInfo, RetentionPolicy, plan_retention
+
+DAY = 86400
+NOW = datetime(2027, 1, 15, 12).timestamp()  # local noon, so +-0.1 day stays on the day
+
+
+
+@pytest.fixture
+def data_dir(data_dir, numbered_slots, monkeypatch):
+    # Retention is exercised explicitly below
+    monkeypatch.setattr(storage, "DEFAULT_RETENTION", RetentionPolicy(keep_last=1000))
+    return data_dir
+
+
+def new_save(name, chips, age_days=0.0):
+    storage.save_session(name)
+    storage.save_player(name, chips)
+    storage.CURRENT_SAVE_SLOT = None
+    assert storage.save_current_game()
+    slot = storage.CURRENT_SAVE_SLOT
+    # Backdate the slot in the index, as if it had been saved age_days ago
+    index = json.loads(storage._index_path().read_text())
+    index["slots"][slot.name]["timestamp"] = time.time() - age_days * DAY
+    storage._index_path().write_text(json.dumps(index))
+    return slot
+
+
+def entry(n, age_days, archive=None, player="P"):
+    return BackupInfo(Path(f"/saves/save-{player}-{n}"), player, 100, NOW - age_days * DAY, 10, archive)
+
+
+def test_plan_keeps_newest_folders():
+    entries = [entry(i, i * 0.01) for i in range(5)]
+    plan = plan_retention(entries, RetentionPolicy(keep_last=5), now=NOW)
+    assert plan == ([], [], [])
+
+def test_plan_archives_one_per_day_and_deletes_the_rest():
+    # Newest first: two slots today, then one per day going back
+    entries = [entry(0, 0), entry(1, 0.1)] + [entry(i, i) for i in range(2, 8)] + [entry(8, 40)]
+    plan = plan_retention(entries, RetentionPolicy(keep_last=1, keep_days=30, archive_batch=1), now=NOW)
+    archived = [e.path.name for e in plan.archive]
+    deleted = [e.path.name for e in plan.delete]
+    assert "save-P-0" not in archived + deleted
+    assert archived == [f"save-P-{i}" for i in range(2, 8)]
+    # Same day as the kept slot, and past the 30-day window
+    assert deleted == ["save-P-1", "save-P-8"]
+
+def test_plan_days_are_per_player():
+    # Same day throughout: alice's extra slot goes, bob's only one is kept
+    entries = [entry(0, 0, player="alice"), entry(1, 0.01, player="alice"),
+               entry(2, 0.02, player="alice"), entry(3, 0.03, player="bob")]
+    plan = plan_retention(entries, RetentionPolicy(keep_last=2, archive_batch=1), now=NOW)
+    assert [e.path.name for e in plan.delete] == ["save-alice-2"]
+    assert [e.path.name for e in plan.archive] == ["save-bob-3"]
+
+    # Below a full batch, bob's slot stays a folder rather than being deleted
+    plan = plan_retention(entries, RetentionPolicy(keep_last=2, archive_batch=5), now=NOW)
+    assert [e.path.name for e in plan.delete] == ["save-alice-2"]
+    assert plan.archive == []
+
+def test_plan_waits_for_a_full_batch():
+    entries = [entry(0, 0), entry(1, 1), entry(2, 2)]
+    plan = plan_retention(entries, RetentionPolicy(keep_last=1, archive_batch=5), now=NOW)
+    assert plan.archive == []
+
+def test_plan_drops_expired_archives_and_protects_current():
+    entries = [entry(0, 0), entry(1, 50), entry(2, 60, "archive-a.tar.xz"), entry(3, 5, "archive-b.tar.xz")]
+    plan = plan_retention(entries, RetentionPolicy(keep_last=1, keep_days=30), now=NOW,
+                          protected=[entries[1].path])
+    assert plan.delete == []
+    assert plan.drop_archives == ["archive-a.tar.xz"]
+
+
+def test_archive_roundtrip_extracts_only_one_slot(tmp_path):
+    a, b = tmp_path / "save-A", tmp_path / "save-B"
+    for slot, chips in ((a, 100), (b, 200)):
+        (slot / "questions").mkdir(parents=True)
+        (slot / "players.json").write_text(json.dumps({"x": {"name": "P", "chips": chips}}))
+        (slot / "questions" / "t.json").write_text("shared")
+    path = tmp_path / "archive.tar.xz"
+    write_archive(path, {a: {"player": "P", "chips": 100}, b: {"player": "P", "chips": 200}})
+
+    # Index first, then one object per distinct file
+    with tarfile.open(path, "r|*") as tar:
+        names = [member.name for member in tar]
+    assert names[0] == INDEX_MEMBER
+    assert len(names) == 1 + 3
+
+    assert read_archive_index(path)["save-B"]["chips"] == 200
+    out = tmp_path / "out"
+    assert extract_slot(path, "save-B", out) == 2
+    assert json.loads((out / "players.json").read_text())["x"]["chips"] == 200
+    assert (out / "questions" / "t.json").read_text() == "shared"
+    with pytest.raises(KeyError):
+        extract_slot(path, "save-C", out)
+
+
+def test_apply_retention_archives_and_restores(data_dir):
+    slots = [new_save("Player1", 100 + i, age_days=10 - i) for i in range(6)]
+    storage.CURRENT_SAVE_SLOT = None
+
+    counts = storage.apply_retention(RetentionPolicy(keep_last=1, archive_batch=1))
+    assert counts["archived"] == 5
+    assert [s.exists() for s in slots] == [False] * 5 + [True]
+    archives = list(storage.BACKUP_ROOT.glob("archive-*.tar.xz"))
+    assert len(archives) == 1
+
+    entries = storage.get_backup_entries()
+    assert [e.archive is not None for e in entries] == [False] + [True] * 5
+    # The index survives a rebuild from the archive alone
+    storage._index_path().unlink()
+    assert {e.path.name: e.archive for e in storage.get_backup_entries()} == \
+        {e.path.name: e.archive for e in entries}
+
+    # Only objects the remaining folder links to are kept
+    live = {meta["digest"] for meta in storage.read_manifest(slots[-1]).values()}
+    assert set(storage.get_object_store().digests()) == live
+
+    assert storage.restore_data(slots[2])
+    assert storage.load_player("Player1") == 102
+    assert storage.CURRENT_SAVE_SLOT is None
+
+def test_apply_retention_deletes_expired(data_dir):
+    old = new_save("Player1", 100, age_days=90)
+    recent = new_save("Player1", 200)
+    counts = storage.apply_retention(RetentionPolicy(keep_last=1, keep_days=30))
+    assert counts["deleted"] == 1
+    assert not old.exists() and recent.exists()
+    assert storage.get_available_backups() == [recent]
+
+def test_apply_retention_enforces_max_bytes(data_dir):
+    (data_dir / "questions").mkdir()
+    for i in range(4):
+        (data_dir / "questions" / "big.json").write_text(str(i) * 20_000)
+        new_save("Player1", 100 + i, age_days=4 - i)
+    newest = storage.CURRENT_SAVE_SLOT
+    storage.CURRENT_SAVE_SLOT = None
+
+    storage.apply_retention(RetentionPolicy(keep_last=10, max_bytes=30_000))
+    assert storage._saves_usage() <= 30_000
+    assert storage.get_available_backups() == [newest]
+
+def test_save_applies_default_retention(data_dir, monkeypatch):
+    monkeypatch.setattr(storage, "DEFAULT_RETENTION", RetentionPolicy(keep_last=2, archive_batch=1))
+    for i in range(4):
+        new_save("Player1", 100 + i, age_days=4 - i)
+    entries = storage.get_backup_entries()
+    assert len(entries) == 4
+    assert sum(e.archive is None for e in entries) == 2
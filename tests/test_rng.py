@@ -0,0 +1,68 @@
+import pytest
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from blackjack.models.card import Deck
+from blackjack.rng import CounterRNG, ShuffleLog, make_rng
+from blackjack.trivia import TriviaManager
+from blackjack.simulation import run_simulation
+
+
+def dealt(deck, n=300):
+    return [deck.deal_code() for _ in range(n)]
+
+
+@pytest.mark.parametrize("kind", ["random", "counter", "pcg64"])
+def test_seeded_decks_repeat(kind):
+    if kind == "pcg64":
+        pytest.importorskip("numpy")
+    a = Deck(num_decks=2, rng=make_rng(kind, 42))
+    b = Deck(num_decks=2, rng=make_rng(kind, 42))
+    assert dealt(a) == dealt(b)
+    # Still a real shoe after shuffling
+    assert sorted(dealt(Deck(num_decks=1, rng=make_rng(kind, 1)), 52)) == list(range(52))
+
+def test_counter_rng_advance():
+    a = CounterRNG(9)
+    b = CounterRNG(9)
+    a.getrandbits(64)
+    a.getrandbits(64)
+    b.advance(2)
+    assert a.getrandbits(64) == b.getrandbits(64)
+
+def test_counter_rng_string_seed_is_stable():
+    assert CounterRNG("shard:1").getrandbits(64) == CounterRNG("shard:1").getrandbits(64)
+
+def test_shuffle_log_replay(tmp_path):
+    log = ShuffleLog()
+    original = dealt(Deck(num_decks=1, rng=make_rng("counter", 3), shuffle_log=log))
+    assert log.kind == "counter"
+    assert len(log) == 6  # initial shuffle + 5 reshuffles of a 52-card shoe
+
+    path = tmp_path / "session.shuffles"
+    log.save(path)
+    assert path.stat().st_size < 100
+
+    replayed = dealt(Deck(num_decks=1, shuffle_log=ShuffleLog.load(path).replay()))
+    assert replayed == original
+
+def test_replay_runs_out():
+    log = ShuffleLog(seeds=[1]).replay()
+    deck = Deck(num_decks=1, shuffle_log=log)
+    with pytest.raises(IndexError):
+        deck.create_deck()
+
+def test_trivia_rng(tmp_path):
+    picks = []
+    for _ in range(2):
+        trivia = TriviaManager(custom_dir=str(tmp_path), rng=make_rng("random", 5))
+        picks.append([trivia.get_next_question(trivia.general_questions, [])[1] for _ in range(10)])
+    assert picks[0] == picks[1]
+
+def test_simulation_rng_kind():
+    a = run_simulation(500, seed=2, workers=1, rng_kind="counter", shard_size=250)
+    b = run_simulation(500, seed=2, workers=1, rng_kind="counter", shard_size=250)
+    assert a == b
@@ -0,0 +1,69 @@
+import pytest
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from blackjack.models.card import Card
+from blackjack.models.player import Player, Dealer
+from blackjack.engine import HIT, STAND, SURRENDER, WIN, LOSS, SURRENDERED
+from blackjack.dealer_odds import dealer_distribution
+from blackjack.solver import action_evs
+from blackjack.rules import Rules, DEFAULT_RULES
+
+from conftest import always, make_engine
+
+
+def test_default_rules_match_house():
+    assert DEFAULT_RULES.num_decks == 6
+    assert not DEFAULT_RULES.dealer_hits_soft_17
+    assert DEFAULT_RULES.blackjack_payout is None
+    assert DEFAULT_RULES.label() == "6D S17 BJ1:1 LS 75%"
+
+def test_h17_dealer_hits_soft_17():
+    dealer = Dealer(hits_soft_17=True)
+    dealer.add_card(Card('Ace', 'Spades'))
+    dealer.add_card(Card('Six', 'Hearts'))
+    assert dealer.should_hit()
+    s17 = Dealer()
+    s17.add_card(Card('Ace', 'Spades'))
+    s17.add_card(Card('Six', 'Hearts'))
+    assert not s17.should_hit()
+
+def test_three_to_two_natural():
+    # Player A-K, dealer 10-7
+    cards = [('Ace', 'Spades'), ('Ten', 'Hearts'), ('King', 'Spades'), ('Seven', 'Hearts')]
+    result = make_engine(cards, Rules(blackjack_payout=1.5)).play_round(10, always(STAND))
+    assert result.outcome == WIN
+    assert result.net == 15
+
+def test_dealer_natural_beats_drawn_21():
+    # Player 7-4 hits a King to 21, dealer A-K
+    cards = [('Seven', 'Spades'), ('Ace', 'Hearts'), ('Four', 'Spades'), ('King', 'Hearts'), ('King', 'Clubs')]
+    actions = iter([HIT, STAND])
+    result = make_engine(cards, Rules(blackjack_payout=1.5)).play_round(10, lambda p, u, s: next(actions))
+    assert result.outcome == LOSS
+
+def test_surrender_disabled():
+    cards = [('King', 'Spades'), ('Ten', 'Hearts'), ('Six', 'Spades'), ('Seven', 'Hearts')]
+    offered = []
+
+    def decide(player, upcard, can_surrender):
+        offered.append(can_surrender)
+        return SURRENDER
+
+    result = make_engine(cards, Rules(surrender_allowed=False)).play_round(10, decide)
+    assert offered[0] is False
+    assert result.outcome != SURRENDERED
+
+def test_h17_raises_dealer_bust_odds():
+    s17 = dealer_distribution(6)
+    h17 = dealer_distribution(6, hit_soft_17=True)
+    assert h17.bust > s17.bust
+    assert h17.p17 < s17.p17
+    assert sum(h17) == pytest.approx(1.0)
+
+def test_solver_respects_surrender_rule():
+    assert action_evs(16, False, 10, rules=Rules(surrender_allowed=False)).surrender is None
+    assert action_evs(16, False, 10).surrender == pytest.approx(-0.5)
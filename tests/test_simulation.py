@@ -0,0 +1,38 @@
+import pytest
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from blackjack.simulation import run_simulation, run_shard, SimulationStats
+
+
+def test_counts_add_up():
+    stats = run_simulation(2_000, seed=7, workers=1, shard_size=500)
+    assert stats.rounds == 2_000
+    assert stats.wins + stats.losses + stats.pushes + stats.surrenders + stats.busts == 2_000
+    assert stats.wagered == 2_000 * 10
+
+def test_same_seed_same_result():
+    a = run_simulation(1_000, seed=3, workers=1, shard_size=250)
+    b = run_simulation(1_000, seed=3, workers=1, shard_size=250)
+    assert a == b
+
+def test_different_seed_differs():
+    a = run_simulation(1_000, seed=3, workers=1, shard_size=250)
+    b = run_simulation(1_000, seed=4, workers=1, shard_size=250)
+    assert a != b
+
+def test_worker_count_does_not_change_result():
+    """Sharding is fixed by the seed, so the pool size is irrelevant."""
+    serial = run_simulation(2_000, seed=11, workers=1, shard_size=250)
+    parallel = run_simulation(2_000, seed=11, workers=3, shard_size=250)
+    assert serial == parallel
+
+def test_merge():
+    a = run_shard(1, 0, 300)
+    b = run_shard(1, 1, 300)
+    merged = SimulationStats().merge(a).merge(b)
+    assert merged.rounds == 600
+    assert merged.net == a.net + b.net
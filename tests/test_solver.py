@@ -0,0 +1,58 @@
+import pytest
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from blackjack.models.card import Card, Deck
+from blackjack.models.player import Player
+from blackjack.engine import RoundEngine, HIT, STAND, SURRENDER
+from blackjack.dealer_odds import full_shoe
+from blackjack.solver import StrategyTable, action_evs, add_card, hand_state
+
+
+def test_hand_state():
+    assert hand_state([Card('Ace', 'Spades'), Card('Six', 'Hearts')]) == (17, True)
+    assert hand_state([Card('Ace', 'Spades'), Card('Six', 'Hearts'), Card('Ten', 'Clubs')]) == (17, False)
+    assert hand_state([Card('Ace', 'Spades'), Card('Ace', 'Hearts')]) == (12, True)
+
+def test_add_card():
+    assert add_card(10, False, 11) == (21, True)
+    assert add_card(16, True, 9) == (15, False)
+    assert add_card(12, True, 11) == (13, True)
+
+def test_stand_on_21_can_only_push_or_win():
+    evs = action_evs(21, False, 10)
+    assert evs.stand > 0.8
+    assert evs.best_action == STAND
+
+def test_surrender_only_when_allowed():
+    evs = action_evs(16, False, 11, can_surrender=False)
+    assert evs.surrender is None
+    assert evs.best_action in (HIT, STAND)
+
+def test_infinite_deck_chart():
+    table = StrategyTable()
+    assert table.best_action(11, False, 6) == HIT
+    assert table.best_action(13, False, 2) == STAND
+    assert table.best_action(12, False, 7) == HIT
+    assert table.best_action(18, True, 10) == HIT
+    assert table.best_action(16, False, 10) == SURRENDER
+    assert table.best_action(16, False, 10, can_surrender=False) == HIT
+
+def test_composition_close_to_infinite_for_big_shoe():
+    shoe = list(full_shoe(8))
+    shoe[8] -= 1  # dealer shows a Ten
+    shoe[8] -= 1  # player holds Ten, Six
+    shoe[4] -= 1
+    finite = action_evs(16, False, 10, shoe)
+    infinite = action_evs(16, False, 10)
+    assert finite.hit == pytest.approx(infinite.hit, abs=0.01)
+    assert finite.stand == pytest.approx(infinite.stand, abs=0.01)
+
+def test_table_drives_engine():
+    table = StrategyTable()
+    engine = RoundEngine(Deck(num_decks=6), Player("Bot", 10_000))
+    for _ in range(200):
+        assert engine.play_round(10, table.decide) is not None
@@ -0,0 +1,96 @@
+import pytest
+import json
+import sqlite3
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from blackjack import storage
+from blackjack.sqlite_store import SQLiteStore
+
+
+@pytest.fixture
+def storage_backend():
+    """data_dir (see conftest) selects the SQLite backend in this module."""
+    return "sqlite"
+
+
+def test_save_and_load(data_dir):
+    assert storage.load_player("Player1") is None
+    assert storage.save_player("Player1", 100)
+    assert storage.save_player("player1", 250)
+    assert storage.load_player("PLAYER1") == 250
+    assert not storage.is_new_player("Player1")
+    assert (data_dir / storage.DB_NAME).exists()
+    assert not (data_dir / "players.json").exists()
+
+def test_wal_mode_and_chips_index(data_dir):
+    storage.save_player("Player1", 100)
+    db = sqlite3.connect(str(data_dir / storage.DB_NAME))
+    assert db.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    plan = db.execute("EXPLAIN QUERY PLAN SELECT name, chips FROM players ORDER BY chips DESC LIMIT 3").fetchall()
+    assert any("players_chips" in row[-1] for row in plan)
+    db.close()
+
+def test_migrates_json_once(data_dir):
+    storage._write_snapshot(data_dir / "players.json",
+                            {storage._hash_name("Old"): {"name": "Old", "chips": 40}})
+    with open(data_dir / storage.JOURNAL_NAME, 'w') as f:
+        f.write(json.dumps({"key": storage._hash_name("Old"), "name": "Old", "chips": 55}) + "\n")
+    with open(data_dir / "session.json", 'w') as f:
+        json.dump({"last_active_user": "Old"}, f)
+
+    assert storage.load_player("Old") == 55
+    assert storage.load_session() == "Old"
+
+    # Later JSON edits are not imported again
+    storage.save_player("Old", 80)
+    storage._close_store()
+    storage._write_snapshot(data_dir / "players.json", {})
+    assert storage.load_player("Old") == 80
+
+def test_session(data_dir):
+    assert storage.load_session() is None
+    storage.save_session("Player1")
+    assert storage.load_session() == "Player1"
+
+def test_round_history_and_leaderboard(data_dir):
+    for name, chips in (("A", 10), ("B", 300), ("C", 120)):
+        storage.save_player(name, chips)
+    assert storage.leaderboard(2) == [("B", 300), ("C", 120)]
+
+    assert storage.record_round("A", 10, "win", 10, 20)
+    assert storage.record_round("A", 10, "loss", -10, 10)
+    history = storage.get_player_store().history("A")
+    assert [row[2] for row in history] == ["loss", "win"]
+
+def test_backup_and_restore(data_dir):
+    storage.save_player("Player1", 100)
+    assert storage.save_current_game()
+    slot = storage.CURRENT_SAVE_SLOT
+    assert (slot / storage.DB_NAME).exists()
+
+    storage.save_player("Player1", 5)
+    assert storage.restore_data(slot)
+    assert storage.load_player("Player1") == 100
+
+@pytest.mark.parametrize("storage_backend", ["json"])
+def test_json_leaderboard(data_dir):
+    for name, chips in (("A", 10), ("B", 300)):
+        storage.save_player(name, chips)
+    assert storage.leaderboard(1) == [("B", 300)]
+    assert not storage.record_round("A", 10, "win", 10, 20)
+
+def test_write_behind(data_dir):
+    storage.start_write_behind(delay=0.2)
+    try:
+        for chips in (10, 20, 30):
+            storage.save_player("Player1", chips)
+        storage.record_round("Player1", 10, "win", 10, 30)
+        assert storage.load_player("Player1") == 30
+        assert storage.flush(timeout=5)
+    finally:
+        storage.stop_write_behind()
+    assert storage.get_player_store().get("Player1")["chips"] == 30
+    assert len(storage.get_player_store().history("Player1")) == 1
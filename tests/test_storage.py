@@ -2,6 +2,8 @@
 import pytest
 import sys
 import json
+import threading
+import time
 from unittest.mock import patch, MagicMock, mock_open
 from pathlib import Path
 
@@ -19,75 +21,83 @@ def test_hash_name():
     assert h1 == h3
     assert len(h1) == 16
 
-@patch("blackjack.storage._get_data_path")
-@patch("builtins.open")
-def test_load_player_exists(mock_file, mock_get_path):
+
+def test_load_player_exists(data_dir):
     """Test loading an existing player."""
-    # Setup mock data
-    fake_data = {
-        storage._hash_name("Player1"): {"name": "Player1", "chips": 500}
-    }
-    
-    # Configure the mock open to read our data
-    # Create a mock file object
-    mock_file_obj = MagicMock()
-    mock_file_obj.read.return_value = json.dumps(fake_data)
-    
-    # Make the context manager return it (`with open(...) as f`)
-    mock_file.return_value.__enter__.return_value = mock_file_obj
-    
-    # Configure path.exists() to return True
-    mock_path = MagicMock()
-    mock_path.exists.return_value = True
-    mock_get_path.return_value = mock_path
+    storage._save_all_data({storage._hash_name("Player1"): {"name": "Player1", "chips": 500}})
 
     chips = storage.load_player("Player1")
     assert chips == 500
 
-@patch("blackjack.storage._get_data_path")
-@patch("builtins.open")
-def test_load_player_not_found(mock_file, mock_get_path):
+def test_load_player_not_found(data_dir):
     """Test loading a non-existent player."""
-    # Setup mock empty data
-    mock_file_obj = MagicMock()
-    mock_file_obj.read.return_value = "{}"
-    mock_file.return_value.__enter__.return_value = mock_file_obj
-    
-    mock_path = MagicMock()
-    mock_path.exists.return_value = True
-    mock_get_path.return_value = mock_path
+    storage._save_all_data({})
 
     chips = storage.load_player("UnknownPlayer")
     assert chips is None
 
-@patch("blackjack.storage._get_data_path")
-@patch("builtins.open")
-def test_save_player(mock_file, mock_get_path):
-    """Test saving a player."""
-    # 1. First open() call (Read): return existing data
-    # We need a mock that behaves as a context manager
-    read_ctx = MagicMock()
-    read_file = MagicMock()
-    read_ctx.__enter__.return_value = read_file
-    read_file.read.return_value = "{}"  # Return empty dict json
-
-    # 2. Second open() call (Write): save new data
-    write_ctx = MagicMock()
-    write_file = MagicMock()
-    write_ctx.__enter__.return_value = write_file
-    
-    # Configure open() to return these context managers in sequence
-    mock_file.side_effect = [read_ctx, write_ctx]
-    
-    mock_path = MagicMock()
-    mock_path.exists.return_value = True
-    mock_get_path.return_value = mock_path
+def test_save_player(data_dir):
+    """Saving appends one journal record and leaves players.json alone."""
+    storage._save_all_data({storage._hash_name("Old"): {"name": "Old", "chips": 10}})
+    before = (data_dir / "players.json").read_text()
 
     success = storage.save_player("NewPlayer", 1000)
     assert success is True
-    
-    # Verify write called on the second file handle
-    write_file.write.assert_called()
+
+    assert (data_dir / "players.json").read_text() == before
+    lines = (data_dir / storage.JOURNAL_NAME).read_text().splitlines()
+    assert len(lines) == 1
+    assert json.loads(lines[0])["chips"] == 1000
+    assert storage.load_player("NewPlayer") == 1000
+    assert storage.load_player("Old") == 10
+
+def test_journal_replays_latest_value(data_dir):
+    for chips in (100, 200, 150):
+        storage.save_player("Player1", chips)
+    storage.save_player("Player2", -5)
+    assert storage.load_player("Player1") == 150
+    assert storage.load_player("Player2") == 0
+
+def test_torn_journal_record_is_skipped(data_dir):
+    storage.save_player("Player1", 100)
+    with open(data_dir / storage.JOURNAL_NAME, 'a') as f:
+        f.write('{"key": "abc", "na')
+    assert storage.load_player("Player1") == 100
+
+def test_save_after_torn_record(data_dir):
+    with open(data_dir / storage.JOURNAL_NAME, 'a') as f:
+        f.write('{"key": "abc", "na')
+    storage._invalidate_store()
+    storage.save_player("Player1", 100)
+    storage._invalidate_store()
+    assert storage.load_player("Player1") == 100
+
+def test_compaction_folds_journal(data_dir, monkeypatch):
+    monkeypatch.setattr(storage, "COMPACT_BYTES", 200)
+    for i in range(10):
+        storage.save_player(f"Player{i}", i)
+    journal = data_dir / storage.JOURNAL_NAME
+    assert journal.stat().st_size < 200
+    snapshot = json.loads((data_dir / "players.json").read_text())
+    assert len(snapshot) >= 2
+    assert all(storage.load_player(f"Player{i}") == i for i in range(10))
+
+def test_save_all_data_replaces_journaled_players(data_dir):
+    storage.save_player("alice", 100)
+    storage.save_player("bob", 50)
+    assert storage._save_all_data({storage._hash_name("alice"): {"name": "alice", "chips": 999}})
+    assert storage.load_player("alice") == 999
+    assert storage.load_player("bob") is None
+    storage._close_store()
+    assert storage.load_player("alice") == 999
+
+def test_restore_discards_current_journal(data_dir):
+    storage.save_player("Player1", 100)
+    assert storage.save_current_game()
+    slot = storage.CURRENT_SAVE_SLOT
+    storage.save_player("Player1", 5)
+    assert storage.restore_data(slot)
+    assert storage.load_player("Player1") == 100
 
 @patch("blackjack.storage.DATA_DIR")
 @patch("blackjack.storage.shutil")
@@ -114,3 +124,99 @@ def test_reset_data_keep_saves(mock_remove, mock_session, mock_data_file, mock_d
     # Verify removals
     mock_remove.assert_any_call(mock_data_file)
     mock_remove.assert_any_call(mock_session)
+
+def test_store_does_not_reread_unchanged_files(data_dir, monkeypatch):
+    storage.save_player("Player1", 100)
+    storage.load_player("Player1")
+
+    def no_open(*args, **kwargs):
+        raise AssertionError("file re-read")
+
+    monkeypatch.setattr("builtins.open", no_open)
+    for _ in range(3):
+        assert storage.load_player("Player1") == 100
+        assert not storage.is_new_player("Player1")
+
+def test_store_sees_other_writers(data_dir):
+    storage.save_player("Player1", 100)
+    assert storage.load_player("Player1") == 100
+
+    # Another process appends to the journal...
+    other = storage.PlayerStore(data_dir / "players.json")
+    other.put("Player2", 70)
+    assert storage.load_player("Player2") == 70
+
+    # ...then compacts and rewrites the snapshot
+    other.put("Player1", 5)
+    other.compact()
+    assert storage.load_player("Player1") == 5
+    assert storage.load_player("Player2") == 70
+
+def test_hash_name_is_memoized():
+    storage._hash_name.cache_clear()
+    storage._hash_name("Memo")
+    storage._hash_name("Memo")
+    assert storage._hash_name.cache_info().hits == 1
+
+@pytest.fixture
+def writer(data_dir):
+    writer = storage.start_write_behind(delay=0.2)
+    yield writer
+    storage.stop_write_behind()
+
+def test_write_behind_coalesces_updates(data_dir, writer):
+    for chips in range(100, 110):
+        assert storage.save_player("Player1", chips)
+    storage.save_player("Player2", 7)
+    # Visible before it reaches disk
+    assert storage.load_player("Player1") == 109
+
+    assert storage.flush(timeout=5)
+    assert writer.commits == 1
+    lines = (data_dir / storage.JOURNAL_NAME).read_text().splitlines()
+    assert len(lines) == 2
+
+    storage._close_store()
+    assert storage.load_player("Player1") == 109
+    assert storage.load_player("Player2") == 7
+
+def test_stop_write_behind_flushes(data_dir):
+    storage.start_write_behind(delay=10)
+    storage.save_player("Player1", 42)
+    assert storage.stop_write_behind(timeout=5)
+    storage._close_store()
+    assert storage.load_player("Player1") == 42
+
+def test_stop_write_behind_gives_up_on_failing_disk(data_dir, monkeypatch):
+    monkeypatch.setattr(storage.PlayerStore, "put_many", lambda self, updates, sync=False: False)
+    writer = storage.start_write_behind(delay=0.01)
+    storage.save_player("Player1", 42)
+
+    # No timeout, as on exit; run it aside so a hang fails the test instead of blocking it
+    result = []
+    stopper = threading.Thread(target=lambda: result.append(storage.stop_write_behind()))
+    start = time.monotonic()
+    stopper.start()
+    stopper.join(5)
+    assert not stopper.is_alive()
+    assert time.monotonic() - start < 5
+    assert result == [False]
+    assert writer.failures >= writer.STOP_ATTEMPTS
+    assert [name for name, _ in writer.abandoned.values()] == ["Player1"]
+
+def test_snapshot_write_is_atomic(data_dir, monkeypatch):
+    storage._save_all_data({storage._hash_name("Player1"): {"name": "Player1", "chips": 1}})
+    before = (data_dir / "players.json").read_text()
+
+    def failing_fsync(fd):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(storage.os, "fsync", failing_fsync)
+    assert not storage._save_all_data({})
+    assert (data_dir / "players.json").read_text() == before
+    assert [p.name for p in data_dir.iterdir()] == ["players.json"]
+
+def test_session_round_trip(data_dir):
+    storage.save_session("Player1")
+    assert storage.load_session() == "Player1"
+    assert not (data_dir / ".session.json.tmp").exists()
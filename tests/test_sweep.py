@@ -0,0 +1,56 @@
+import pytest
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from blackjack import sweep
+from blackjack.rules import Rules
+from blackjack.simulation import run_simulation
+from blackjack.sweep import SweepCache, rule_grid, run_sweep
+
+
+def test_rule_grid_is_full_product():
+    grid = rule_grid(num_decks=(1, 6), dealer_hits_soft_17=(False, True), blackjack_payout=(None, 1.5),
+                     surrender_allowed=(True,), penetration=(0.5, 0.75))
+    assert len(grid) == 16
+    assert len(set(grid)) == 16
+
+def test_sweep_matches_single_simulation():
+    rules = Rules(num_decks=2, dealer_hits_soft_17=True)
+    result = run_sweep([rules], 600, seed=5, workers=1, strategy="dealer", shard_size=200)
+    expected = run_simulation(600, seed=5, workers=1, rules=rules, shard_size=200)
+    assert result[rules] == expected
+
+def test_sweep_only_runs_new_cells(tmp_path, monkeypatch):
+    path = tmp_path / "sweep.json"
+    first = [Rules(num_decks=1), Rules(num_decks=2)]
+    run_sweep(first, 200, seed=1, workers=1, strategy="dealer", cache=SweepCache(path))
+
+    ran = []
+    real_run_jobs = sweep.run_jobs
+
+    def counting_run_jobs(jobs, workers=None):
+        ran.extend(job[4] for job in jobs)
+        return real_run_jobs(jobs, workers)
+
+    monkeypatch.setattr(sweep, "run_jobs", counting_run_jobs)
+    result = run_sweep(first + [Rules(num_decks=8)], 200, seed=1, workers=1, strategy="dealer",
+                       cache=SweepCache(path))
+    assert set(ran) == {Rules(num_decks=8)}
+    assert all(stats.rounds == 200 for stats in result.values())
+
+def test_cache_keys_on_shard_size(tmp_path):
+    path = tmp_path / "sweep.json"
+    rules = Rules(num_decks=2)
+    run_sweep([rules], 400, seed=3, workers=1, strategy="dealer", cache=SweepCache(path), shard_size=200)
+    result = run_sweep([rules], 400, seed=3, workers=1, strategy="dealer", cache=SweepCache(path), shard_size=100)
+    assert result[rules] == run_simulation(400, seed=3, workers=1, rules=rules, shard_size=100)
+    assert len(SweepCache(path).entries) == 2
+
+def test_basic_strategy_beats_dealer_mimic():
+    rules = Rules()
+    basic = run_sweep([rules], 4_000, seed=2, workers=1, strategy="basic")[rules]
+    mimic = run_sweep([rules], 4_000, seed=2, workers=1, strategy="dealer")[rules]
+    assert basic.house_edge < mimic.house_edge
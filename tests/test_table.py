@@ -0,0 +1,65 @@
+import pytest
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from blackjack.models.card import Deck
+from blackjack.models.player import Player
+from blackjack.engine import HIT, STAND, SURRENDER, WIN, LOSS, BUST, SURRENDERED
+from blackjack.table import Table
+
+from conftest import StackedDeck, always
+
+
+def test_seat_limits():
+    with pytest.raises(ValueError):
+        Table(Deck(), [])
+    with pytest.raises(ValueError):
+        Table(Deck(), [Player(str(i), 100) for i in range(8)])
+
+def test_deal_order_round_the_table():
+    deck = StackedDeck([(r, 'Spades') for r in ('Two', 'Three', 'Four', 'Five', 'Six', 'Seven')]
+                        + [('Ten', 'Hearts')] * 4)
+    table = Table(deck, [Player("A", 100), Player("B", 100)])
+    table.play_round([10, 10], always(STAND))
+    assert [c.rank for c in table.seats[0].hand] == ['Two', 'Five']
+    assert [c.rank for c in table.seats[1].hand] == ['Three', 'Six']
+    assert [c.rank for c in table.dealer.hand[:2]] == ['Four', 'Seven']
+
+def test_one_dealer_playout_for_all_seats():
+    # Seats: 20 and 19; dealer 16 draws one King and busts
+    deck = StackedDeck([('King', 'Spades'), ('Nine', 'Spades'), ('Ten', 'Hearts'),
+                         ('Queen', 'Spades'), ('Ten', 'Clubs'), ('Six', 'Hearts'),
+                         ('King', 'Clubs')])
+    table = Table(deck, [Player("A", 100), Player("B", 100)])
+    results = table.play_round([10, 20], always(STAND))
+    assert [r.outcome for r in results] == [WIN, WIN]
+    assert deck.dealt == 7
+    assert [seat.chips for seat in table.seats] == [110, 120]
+
+def test_mixed_outcomes_and_sitting_out():
+    # A hits 16 into a bust, B surrenders, C sits out, D stands on 20 vs dealer 18
+    deck = StackedDeck([('Ten', 'Spades'), ('Ten', 'Hearts'), ('Ten', 'Clubs'), ('Nine', 'Spades'),
+                         ('Six', 'Spades'), ('Six', 'Hearts'), ('Ten', 'Diamonds'), ('Nine', 'Hearts'),
+                         ('King', 'Spades')])
+    seats = [Player("A", 100), Player("B", 100), Player("C", 100), Player("D", 100)]
+    table = Table(deck, seats)
+    results = table.play_round([10, 10, 0, 10], [always(HIT), always(SURRENDER), always(STAND), always(STAND)])
+    assert results[0].outcome == BUST
+    assert results[1].outcome == SURRENDERED
+    assert results[2] is None
+    assert results[3].outcome == WIN
+    assert len(table.dealer.hand) == 2
+
+def test_full_table_on_real_shoe():
+    deck = Deck(num_decks=6, penetration=0.75)
+    seats = [Player(f"Seat {i}", 100_000) for i in range(7)]
+    table = Table(deck, seats)
+    hit_below_17 = lambda player, upcard, can_surrender: HIT if player.hand_value < 17 else STAND
+    net = [0] * 7
+    for _ in range(300):
+        for i, result in enumerate(table.play_round([10] * 7, hit_below_17)):
+            net[i] += result.net
+    assert [seat.chips for seat in seats] == [100_000 + n for n in net]